@@ -0,0 +1,71 @@
+"""Benchmark du magasin d'artefacts : archivage, déduplication, listing des runs.
+
+Archive ``--runs`` runs dans un magasin temporaire : un modèle
+(``PolynomialFeatures`` + ``Ridge``) et ses métriques par run, avec un
+nouveau modèle tous les ``--distinct`` runs seulement (les autres runs
+réarchivent le même modèle, comme après un cache d'entraînement). Mesure
+ensuite le listing et la comparaison des runs, depuis un magasin froid,
+ainsi que le premier chargement paresseux d'un modèle.
+
+Exemple ::
+
+    python benchmarks/bench_artifact_store.py --runs 500 --distinct 10
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PolynomialFeatures
+
+from tp_kedro_weather.artifacts import ArtifactStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument("--distinct", type=int, default=10, help="Runs partageant le même modèle")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    X = rng.normal(size=(args.rows, 2))
+    y = X @ [1.5, -0.5] + rng.normal(scale=0.1, size=args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArtifactStore(tmp)
+        model = None
+        start = time.perf_counter()
+        for i in range(args.runs):
+            if i % args.distinct == 0:
+                alpha = 1.0 + i
+                model = Pipeline([("poly", PolynomialFeatures(degree=2)), ("regressor", Ridge(alpha=alpha))]).fit(X, y)
+            metrics = {"model_type": "polynomial_ridge", "r2_test": float(model.score(X, y)), "alpha": alpha}
+            store.save_run(f"run-{i:05d}", model, metrics)
+        save_seconds = time.perf_counter() - start
+
+        objects = list((Path(tmp) / "objects").rglob("*.*"))
+        print(f"{args.runs} runs archivés en {save_seconds:.2f} s, "
+              f"{len(objects)} objets ({sum(p.stat().st_size for p in objects) / 1e3:.1f} ko)")
+
+        cold = ArtifactStore(tmp)
+        start = time.perf_counter()
+        runs = cold.runs()
+        print(f"listing   : {len(runs)} runs en {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+        start = time.perf_counter()
+        cold.compare([run.run_id for run in runs])
+        print(f"comparaison de tous les runs : {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+        start = time.perf_counter()
+        runs[-1].model
+        print(f"chargement du dernier modèle : {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
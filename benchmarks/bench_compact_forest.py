@@ -0,0 +1,93 @@
+"""Benchmark de la forêt compacte face au modèle picklé.
+
+Entraîne une forêt de la taille du candidat ``random_forest``, l'enregistre
+en pickle et en tableaux ``.npy``, puis compare le temps de chargement, la
+taille sur disque et la latence par ligne pour plusieurs tailles de lot.
+Vérifie que les prédictions sont identiques à celles de la forêt évaluée
+sur un seul thread (``n_jobs=1`` : arbres sommés dans l'ordre).
+
+Exemple ::
+
+    python benchmarks/bench_compact_forest.py --rows 100000
+"""
+
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+
+from tp_kedro_weather.datasets import NumpyArraysDataset
+from tp_kedro_weather.pipelines.data_processing.compact_forest import CompactForest
+
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000)
+
+
+def best_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def directory_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Lignes d'entraînement")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X = np.column_stack([rng.uniform(0, 100, args.rows), rng.uniform(0, 50, args.rows)])
+    y = 25 - 0.1 * X[:, 0] - 0.2 * X[:, 1] + rng.normal(0, 2, args.rows)
+    # Mêmes hyperparamètres que le candidat random_forest
+    rf = RandomForestRegressor(n_estimators=100, max_depth=10, min_samples_split=5, random_state=42, n_jobs=-1)
+    rf.fit(X, y)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = Path(tmp) / "modele.pkl"
+        compact_path = Path(tmp) / "modele_compact"
+        with open(pickle_path, "wb") as f:
+            pickle.dump(rf, f, protocol=pickle.HIGHEST_PROTOCOL)
+        NumpyArraysDataset(filepath=str(compact_path)).save(CompactForest.from_sklearn(rf).to_arrays())
+
+        def load_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        def load_compact():
+            return CompactForest(NumpyArraysDataset(filepath=str(compact_path)).load())
+
+        print(f"{'format':<10} {'taille (Mo)':>12} {'chargement (ms)':>16}")
+        print(f"{'pickle':<10} {pickle_path.stat().st_size / 1e6:>12.2f} {best_time(load_pickle, args.repeat) * 1e3:>16.2f}")
+        print(f"{'compact':<10} {directory_size(compact_path) / 1e6:>12.2f} {best_time(load_compact, args.repeat) * 1e3:>16.2f}")
+
+        forest = load_compact()
+        X_eval = np.column_stack([rng.uniform(0, 100, max(BATCH_SIZES)), rng.uniform(0, 50, max(BATCH_SIZES))])
+        # Référence sur un seul thread : avec n_jobs=-1, scikit-learn somme les
+        # arbres dans l'ordre de fin des threads (écarts de quelques ulp)
+        expected = rf.set_params(n_jobs=1).predict(X_eval)
+        rf.set_params(n_jobs=-1)
+        actual = forest.predict(X_eval)
+        if not np.array_equal(expected, actual):
+            raise SystemExit(f"Prédictions différentes : écart max {np.abs(expected - actual).max():.3e}")
+        print("\nPrédictions identiques à rf.predict (n_jobs=1)")
+
+        print(f"\n{'lot':>7} {'sklearn (µs/ligne)':>19} {'compact (µs/ligne)':>19}")
+        for batch_size in BATCH_SIZES:
+            batch = X_eval[:batch_size]
+            sklearn_time = best_time(lambda: rf.predict(batch), args.repeat)
+            compact_time = best_time(lambda: forest.predict(batch), args.repeat)
+            print(f"{batch_size:>7} {sklearn_time / batch_size * 1e6:>19.2f} {compact_time / batch_size * 1e6:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark de l'ingestion du CSV brut : ``pandas.CSVDataset`` contre ``ArrowCSVDataset``.
+
+Écrit un fichier brut synthétique (avec sentinelles), puis mesure pour
+chaque dataset le débit (Mo/s) du chargement seul, et du chargement suivi de
+la conversion des mesures en flottants (``coerce_column``, première étape de
+``clean_weather_data``) :
+
+- ``pandas`` : configuration historique, sentinelles gardées en texte
+  (colonnes ``object``) puis converties par ``pd.to_numeric`` ;
+- ``arrow``  : configuration actuelle de ``raw_weather_data``, parsing
+  multi-thread, mesures converties en bloc au chargement (sentinelles
+  nulles et comptées).
+
+Vérifie que les mesures converties et les rapports de nettoyage (compteurs
+de sentinelles et de valeurs invalides) sont identiques.
+
+Usage ::
+
+    python benchmarks/bench_csv_ingestion.py --rows 1000000 10000000 --repeat 3
+    python benchmarks/bench_csv_ingestion.py --rows 10000000 --threads 1 4 8
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import yaml
+from kedro.io import AbstractDataset
+from kedro_datasets.pandas import CSVDataset
+
+from tp_kedro_weather.pipelines.data_processing.cleaning import clean_frame, coerce_column, parse_schema
+from tp_kedro_weather.synthetic import write_weather_csv
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+# Configuration de raw_weather_data avant ArrowCSVDataset
+PANDAS_LOAD_ARGS = {"keep_default_na": False, "na_values": [""]}
+
+
+def best_time(func, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def convert(df, specs) -> dict:
+    return {spec.name: coerce_column(df[spec.name], spec)[0] for spec in specs}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--dirty-rate", type=float, default=0.02, help="Proportion de cellules sentinelles")
+    parser.add_argument("--threads", type=int, nargs="+", help="Threads pyarrow (par défaut : nombre de cœurs)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="Meilleur temps sur N chargements")
+    parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    catalog = yaml.safe_load((PROJECT_DIR / "conf" / "base" / "catalog.yml").read_text())
+    params = yaml.safe_load((PROJECT_DIR / "conf" / "base" / "parameters.yml").read_text())
+    specs = parse_schema(params["cleaning"])
+    threads = args.threads or [pa.cpu_count()]
+
+    results = []
+    print(f"{'rows':>12} {'dataset':<12} {'MB':>8} {'load MB/s':>10} {'load+convert MB/s':>18}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.rows:
+            path = write_weather_csv(str(Path(tmp) / "weather_data.csv"), n_rows, args.dirty_rate, args.seed)
+            megabytes = path.stat().st_size / 1e6
+
+            candidates = {"pandas": CSVDataset(filepath=str(path), load_args=PANDAS_LOAD_ARGS)}
+            for n_threads in threads:
+                config = {**catalog["raw_weather_data"], "filepath": str(path)}
+                candidates[f"arrow x{n_threads}"] = (n_threads, AbstractDataset.from_config("raw_weather_data", config))
+
+            reference = reference_report = None
+            for name, candidate in candidates.items():
+                if isinstance(candidate, tuple):
+                    n_threads, dataset = candidate
+                    pa.set_cpu_count(n_threads)
+                else:
+                    dataset = candidate
+                _, load_s = best_time(dataset.load, args.repeat)
+                converted, total_s = best_time(lambda: convert(dataset.load(), specs), args.repeat)
+                if reference is None:
+                    reference = converted
+                elif not all(np.array_equal(reference[key], converted[key], equal_nan=True) for key in reference):
+                    raise SystemExit(f"{name} : mesures converties différentes de pandas")
+                report = clean_frame(dataset.load(), specs)[1]
+                if reference_report is None:
+                    reference_report = report
+                elif report != reference_report:
+                    raise SystemExit(f"{name} : rapport de nettoyage différent de pandas")
+                results.append({
+                    "rows": n_rows,
+                    "dataset": name,
+                    "megabytes": megabytes,
+                    "load_mb_per_s": megabytes / load_s,
+                    "load_convert_mb_per_s": megabytes / total_s,
+                })
+                print(f"{n_rows:>12} {name:<12} {megabytes:>8.1f} {megabytes / load_s:>10.1f} {megabytes / total_s:>18.1f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark des features temporelles : calcul vectorisé face à pandas ``rolling``.
+
+Calcule les retards et les moyennes, minimums et maximums glissants de
+``parameters.yml`` (clé ``feature_engineering``) sur des données
+synthétiques, d'une part avec ``window_features``, d'autre part colonne par
+colonne et fenêtre par fenêtre avec ``shift`` et ``rolling`` de pandas.
+Vérifie que les résultats sont identiques (à l'arrondi float32 près) et
+mesure l'extension incrémentale d'une table existante.
+
+Exemple ::
+
+    python benchmarks/bench_features.py --rows 10000000 --windows 3 6 24 168
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from tp_kedro_weather.pipelines.data_processing.features import (
+    build_feature_table,
+    feature_names,
+    history_rows,
+    window_features,
+)
+from tp_kedro_weather.synthetic import generate_weather_frame
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+
+def pandas_features(df: pd.DataFrame, params: dict) -> pd.DataFrame:
+    columns = {}
+    for name in params["columns"]:
+        for lag in params["lags"]:
+            columns[f"{name}_lag{lag}"] = df[name].shift(lag)
+        for window in params["windows"]:
+            rolling = df[name].rolling(window)
+            for stat in params["stats"]:
+                columns[f"{name}_{stat}{window}"] = getattr(rolling, stat)()
+    return pd.DataFrame(columns).iloc[history_rows(params):]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--windows", type=int, nargs="+", help="Fenêtres (par défaut : celles de parameters.yml)")
+    parser.add_argument("--append", type=float, default=0.01, help="Proportion de lignes ajoutées pour l'extension")
+    args = parser.parse_args()
+
+    with open(PROJECT_DIR / "conf" / "base" / "parameters.yml", encoding="utf-8") as f:
+        params = {**yaml.safe_load(f)["feature_engineering"], "enabled": True}
+    if args.windows:
+        params["windows"] = args.windows
+    df = generate_weather_frame(args.rows).astype(np.float32)
+    history = history_rows(params)
+
+    start = time.perf_counter()
+    expected = pandas_features(df, params)
+    pandas_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values = window_features({name: df[name].to_numpy() for name in params["columns"]}, params, history)
+    numpy_seconds = time.perf_counter() - start
+
+    error = max(
+        float(np.nanmax(np.abs(expected[name].to_numpy(dtype=np.float64) - row)))
+        for name, row in zip(feature_names(params), values)
+    )
+    print(f"{len(feature_names(params))} features, {args.rows} lignes")
+    print(f"pandas    : {pandas_seconds:.2f} s")
+    print(f"vectorisé : {numpy_seconds:.2f} s ({pandas_seconds / numpy_seconds:.1f}x), écart max {error:.2e}")
+
+    n_old = int(args.rows * (1 - args.append))
+    table, meta, _ = build_feature_table(df.iloc[:n_old], params)
+    start = time.perf_counter()
+    _, _, first_new = build_feature_table(df, params, {"meta": meta, "table": table})
+    print(f"extension : {time.perf_counter() - start:.2f} s pour {args.rows - n_old} lignes "
+          f"ajoutées à {first_new} lignes existantes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark du stockage intermédiaire : CSV contre formats colonnaires.
+
+Compare, pour des données nettoyées synthétiques, le temps de sauvegarde, le
+temps de relecture et la taille sur disque de :
+
+- ``csv``          : ``pandas.CSVDataset`` (format historique) ;
+- ``parquet-zstd`` : ``ColumnarDataset`` Parquet float32 compressé zstd ;
+- ``arrow-ipc``    : ``ColumnarDataset`` Arrow IPC float32 non compressé,
+  relu par mapping mémoire sans copie.
+
+Usage ::
+
+    python benchmarks/bench_intermediate_storage.py --rows 1000000 10000000 100000000
+
+100M lignes demandent environ 5 Go de RAM et plusieurs minutes pour le CSV.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from kedro_datasets.pandas import CSVDataset
+
+from tp_kedro_weather.datasets import ColumnarDataset
+
+SCHEMA = {"temperature": "float32", "humidity": "float32", "windspeed": "float32"}
+COLUMNS = ["humidity", "windspeed", "temperature"]
+
+
+def make_cleaned_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Données nettoyées synthétiques, arrondies au dixième comme les mesures des stations."""
+    rng = np.random.default_rng(seed)
+    humidity = rng.uniform(20, 100, n_rows).round(1)
+    windspeed = rng.gamma(2.0, 5.0, n_rows).round(1)
+    temperature = (30 - 0.15 * humidity - 0.2 * windspeed + rng.normal(0, 2, n_rows)).round(1)
+    return pd.DataFrame({"temperature": temperature, "humidity": humidity, "windspeed": windspeed})
+
+
+def make_datasets(directory: Path) -> dict:
+    """Associer chaque format à son dataset et au fichier qu'il écrit."""
+    return {
+        "csv": (CSVDataset(filepath=str(directory / "cleaned.csv")), directory / "cleaned.csv"),
+        "parquet-zstd": (ColumnarDataset(
+            filepath=str(directory / "cleaned.parquet"),
+            file_format="parquet",
+            schema=SCHEMA,
+            load_args={"columns": COLUMNS},
+            save_args={"compression": "zstd"},
+        ), directory / "cleaned.parquet"),
+        "arrow-ipc": (ColumnarDataset(
+            filepath=str(directory / "cleaned.arrow"),
+            file_format="arrow",
+            schema=SCHEMA,
+            load_args={"columns": COLUMNS, "memory_map": True},
+        ), directory / "cleaned.arrow"),
+    }
+
+
+def bench(n_rows: int) -> list:
+    df = make_cleaned_frame(n_rows)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (dataset, path) in make_datasets(Path(tmp)).items():
+            start = time.perf_counter()
+            dataset.save(df)
+            save_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = dataset.load()
+            # Forcer la matérialisation des colonnes lues
+            _ = float(loaded["temperature"].sum())
+            load_s = time.perf_counter() - start
+
+            size = path.stat().st_size
+            results.append(
+                {
+                    "rows": n_rows,
+                    "format": name,
+                    "save_s": round(save_s, 3),
+                    "load_s": round(load_s, 3),
+                    "size_mb": round(size / 1e6, 2),
+                }
+            )
+            del loaded
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000, 100_000_000])
+    parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    all_results = []
+    print(f"{'rows':>12} {'format':>14} {'save (s)':>10} {'load (s)':>10} {'size (MB)':>10}")
+    for n_rows in args.rows:
+        for row in bench(n_rows):
+            all_results.append(row)
+            print(f"{row['rows']:>12} {row['format']:>14} {row['save_s']:>10} {row['load_s']:>10} {row['size_mb']:>10}")
+
+    if args.output:
+        args.output.write_text(json.dumps(all_results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
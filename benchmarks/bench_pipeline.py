@@ -0,0 +1,220 @@
+"""Suite de benchmarks du pipeline data_processing à plusieurs échelles.
+
+Pour chaque taille, un fichier brut synthétique (``tp_kedro_weather.synthetic``,
+graine et taux de sentinelles configurables) est écrit dans un répertoire
+temporaire, puis sont chronométrés avec les entrées réelles du catalogue et
+des paramètres (``conf/base``, complétés par ``--env``) :
+
+- le chargement de ``raw_weather_data`` ;
+- ``clean_weather_data`` ;
+- la sauvegarde et le chargement de ``cleaned_weather_data`` ;
+- l'entraînement de chaque candidat seul, puis ``train_model`` complet (cache
+  désactivé) ;
+- la sauvegarde et le chargement de ``trained_model`` et ``metrics`` ;
+- ``generate_model_report``.
+
+Les résultats sont écrits en JSON (une entrée par étape et par taille, avec
+les versions et la machine). Avec ``--baseline``, chaque étape est comparée
+à la référence enregistrée et signalée si elle est plus lente de plus de
+``--tolerance`` ; le code de sortie vaut alors 1.
+
+Usage ::
+
+    python benchmarks/bench_pipeline.py --rows 10000 100000 1000000 --save-baseline
+    python benchmarks/bench_pipeline.py --rows 10000 100000 1000000
+    python benchmarks/bench_pipeline.py --env streaming --rows 10000000 100000000
+
+En mémoire, 10⁸ lignes demandent plusieurs dizaines de Go : utiliser
+``--env streaming`` (blocs, ajustement hors mémoire de la famille linéaire).
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+import yaml
+from kedro.io import AbstractDataset
+from sklearn.model_selection import train_test_split
+
+from tp_kedro_weather.datasets import FrameChunks
+from tp_kedro_weather.pipelines.data_processing.models import fit_candidate, parse_candidates
+from tp_kedro_weather.pipelines.data_processing.nodes import clean_weather_data, train_model
+from tp_kedro_weather.pipelines.data_processing.reporting import generate_model_report
+from tp_kedro_weather.synthetic import write_weather_csv
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+DATASETS = ("raw_weather_data", "cleaned_weather_data", "trained_model", "metrics")
+DEFAULT_BASELINE = PROJECT_DIR / "benchmarks" / "baseline.json"
+
+
+def read_conf(env: str, name: str) -> dict:
+    """Configuration ``base`` complétée clé par clé par l'environnement ``env``."""
+    conf = yaml.safe_load((PROJECT_DIR / "conf" / "base" / f"{name}.yml").read_text()) or {}
+    env_path = PROJECT_DIR / "conf" / env / f"{name}.yml"
+    if env != "base" and env_path.exists():
+        for key, value in (yaml.safe_load(env_path.read_text()) or {}).items():
+            conf[key] = {**conf[key], **value} if name == "parameters" and isinstance(value, dict) else value
+    return conf
+
+
+def make_datasets(catalog: dict, directory: Path, raw_path: Path) -> dict:
+    """Datasets du catalogue, fichiers redirigés vers ``directory``."""
+    datasets = {}
+    for name in DATASETS:
+        config = dict(catalog[name])
+        config["filepath"] = str(raw_path if name == "raw_weather_data" else directory / Path(config["filepath"]).name)
+        datasets[name] = AbstractDataset.from_config(name, config)
+    return datasets
+
+
+def timed(func, repeat: int):
+    """Meilleur temps sur ``repeat`` exécutions, et résultat de la dernière."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def bench(n_rows: int, args: argparse.Namespace, catalog: dict, params: dict) -> list:
+    results = []
+
+    def record(step: str, func):
+        result, seconds = timed(func, args.repeat)
+        results.append({
+            "step": step,
+            "rows": n_rows,
+            "seconds": seconds,
+            "rows_per_s": n_rows / seconds if seconds else None,
+        })
+        print(f"{n_rows:>12} {step:<40} {seconds:>10.3f}")
+        return result
+
+    training = params["training"]
+    no_cache = {**params["training_cache"], "enabled": False}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        raw_path = write_weather_csv(str(tmp / "weather_data.csv"), n_rows, args.dirty_rate, args.seed)
+        datasets = make_datasets(catalog, tmp, raw_path)
+
+        raw = record("load raw_weather_data", datasets["raw_weather_data"].load)
+        cleaned, _ = record("clean_weather_data", lambda: clean_weather_data(raw, params["cleaning"]))
+        record("save cleaned_weather_data", lambda: datasets["cleaned_weather_data"].save(cleaned))
+        cleaned = record("load cleaned_weather_data", datasets["cleaned_weather_data"].load)
+
+        if isinstance(cleaned, FrameChunks):
+            print(f"{'':>12} {'(candidats seuls : ignorés en mode par blocs)':<40}")
+        else:
+            # Même découpage que train_model
+            arrays = tuple(train_test_split(
+                cleaned[training["features"]].to_numpy(), cleaned[training["target"]].to_numpy(),
+                test_size=training["test_size"], random_state=training["random_state"],
+            ))
+            for spec in parse_candidates(training["candidates"]):
+                record(f"train_model[{spec.name}]", lambda spec=spec: fit_candidate(spec, arrays))
+
+        model, metrics, _ = record("train_model", lambda: train_model(cleaned, training, no_cache))
+        for name, data in (("trained_model", model), ("metrics", metrics)):
+            record(f"save {name}", lambda name=name, data=data: datasets[name].save(data))
+            record(f"load {name}", datasets[name].load)
+
+        # Rendu synchrone et forcé : on mesure le rendu lui-même
+        reporting = {**params["reporting"], "output_dir": str(tmp / "08_reporting"), "background": False, "force": True}
+        record("generate_model_report", lambda: generate_model_report(metrics, reporting))
+    return results
+
+
+def environment() -> dict:
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def compare(results: list, baseline: dict, tolerance: float, min_seconds: float) -> list:
+    """Étapes plus lentes que la référence au-delà de la tolérance."""
+    reference = {(entry["step"], entry["rows"]): entry["seconds"] for entry in baseline["results"]}
+    regressions = []
+    print(f"\n{'rows':>12} {'step':<40} {'base (s)':>10} {'now (s)':>10} {'ratio':>7}")
+    for entry in results:
+        base = reference.get((entry["step"], entry["rows"]))
+        if base is None:
+            continue
+        ratio = entry["seconds"] / base if base > 0 else float("inf")
+        # En dessous du plancher, le bruit de mesure domine
+        regressed = ratio > 1 + tolerance and entry["seconds"] >= min_seconds
+        flag = "  RÉGRESSION" if regressed else ""
+        print(f"{entry['rows']:>12} {entry['step']:<40} {base:>10.3f} {entry['seconds']:>10.3f} {ratio:>7.2f}{flag}")
+        if regressed:
+            regressions.append({**entry, "baseline_seconds": base, "ratio": ratio})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--env", default="base", help="Environnement de configuration (ex. streaming)")
+    parser.add_argument("--dirty-rate", type=float, default=0.02, help="Proportion de cellules sentinelles")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=1, help="Meilleur temps sur N exécutions")
+    parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Référence à comparer")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistrer ces résultats comme référence")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Ralentissement toléré (0.25 = +25 %%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Durée minimale pour signaler une régression")
+    args = parser.parse_args()
+
+    catalog = read_conf(args.env, "catalog")
+    params = read_conf(args.env, "parameters")
+
+    print(f"{'rows':>12} {'step':<40} {'time (s)':>10}")
+    results = []
+    for n_rows in args.rows:
+        results += bench(n_rows, args, catalog, params)
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "env": args.env,
+        "dirty_rate": args.dirty_rate,
+        "seed": args.seed,
+        "environment": environment(),
+        "results": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"\nRéférence enregistrée : {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"\nPas de référence ({args.baseline}) : relancer avec --save-baseline pour en créer une")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("environment") != report["environment"] or baseline.get("env") != args.env:
+        print("\nAttention : référence mesurée sur une autre machine, version ou configuration")
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de +{args.tolerance:.0%}")
+        sys.exit(1)
+    print("\nAucune régression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark des runners Kedro sur le pipeline par défaut.
+
+Compare ``SequentialRunner``, ``ThreadRunner`` et ``ParallelRunner`` sur un
+projet temporaire : copie de ``pyproject.toml`` et ``conf/``, lien vers
+``src/`` et fichier brut synthétique (``tp_kedro_weather.synthetic``). Les
+données du projet ne sont jamais touchées. Chaque run est un ``kedro run``
+dans un processus neuf, cache d'entraînement désactivé et rapport rendu de
+façon synchrone, pour que tous les runners fassent le même travail.
+
+Les métriques de chaque runner sont comparées à celles du
+``SequentialRunner`` : un runner qui ne produit pas les mêmes résultats est
+signalé et le code de sortie vaut 1.
+
+Usage ::
+
+    python benchmarks/bench_runners.py --rows 1000000 --repeat 3
+    python benchmarks/bench_runners.py --env streaming --rows 10000000
+"""
+
+import argparse
+import json
+import math
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tp_kedro_weather.synthetic import write_weather_csv
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+RUNNERS = ("SequentialRunner", "ThreadRunner", "ParallelRunner")
+# Travail identique pour tous les runners ; la recherche d'hyperparamètres,
+# bornée en temps réel, n'est pas reproductible d'un run à l'autre
+RUN_PARAMS = (
+    "training_cache.enabled=false,training.tuning.enabled=false,"
+    "reporting.background=false,reporting.force=true"
+)
+
+
+def make_project(directory: Path, n_rows: int, dirty_rate: float, seed: int) -> Path:
+    """Projet temporaire qui partage le code source mais pas les données."""
+    shutil.copy(PROJECT_DIR / "pyproject.toml", directory / "pyproject.toml")
+    shutil.copytree(PROJECT_DIR / "conf", directory / "conf")
+    (directory / "conf" / "local").mkdir(exist_ok=True)
+    os.symlink(PROJECT_DIR / "src", directory / "src")
+    write_weather_csv(str(directory / "data" / "01_raw" / "weather_data.csv"), n_rows, dirty_rate, seed)
+    return directory
+
+
+def run(project: Path, runner: str, env: str) -> float:
+    command = [sys.executable, "-m", "kedro", "run", "--runner", runner, "--params", RUN_PARAMS]
+    if env != "base":
+        command += ["--env", env]
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=project, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{runner} a échoué :\n{completed.stderr[-3000:]}")
+    return seconds
+
+
+def outputs(project: Path) -> dict:
+    """Métriques produites par le dernier run."""
+    with open(project / "data" / "04_models" / "metrics.pkl", "rb") as f:
+        return pickle.load(f)
+
+
+def same(a, b, rel_tol: float = 1e-9) -> bool:
+    """Égalité récursive, à l'arrondi près pour les flottants (ordre des sommes des threads)."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(same(a[key], b[key], rel_tol) for key in a)
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=rel_tol, abs_tol=1e-12)
+    return a == b
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--env", default="base", help="Environnement de configuration (ex. streaming)")
+    parser.add_argument("--runners", nargs="+", default=list(RUNNERS), choices=RUNNERS)
+    parser.add_argument("--dirty-rate", type=float, default=0.02, help="Proportion de cellules sentinelles")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=1, help="Meilleur temps sur N runs")
+    parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    results = {}
+    reference = None
+    mismatches = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project = make_project(Path(tmp), args.rows, args.dirty_rate, args.seed)
+        print(f"{'runner':<20} {'best (s)':>10} {'speed-up':>9}")
+        for runner in args.runners:
+            best = min(run(project, runner, args.env) for _ in range(args.repeat))
+            produced = outputs(project)
+            if reference is None:
+                reference = produced
+            elif not same(produced, reference):
+                mismatches.append(runner)
+            baseline = results.get("SequentialRunner", {}).get("seconds", best)
+            results[runner] = {"seconds": best, "speed_up": baseline / best}
+            print(f"{runner:<20} {best:>10.2f} {baseline / best:>8.2f}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({"rows": args.rows, "env": args.env, "results": results}, indent=2))
+    if mismatches:
+        print(f"\nRésultats différents de {args.runners[0]} : {', '.join(mismatches)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark du temps de démarrage (imports) avec ``python -X importtime``.
+
+Mesure, dans des interpréteurs neufs :
+
+- ``register``  : configuration du projet et enregistrement des pipelines
+  (ce que font ``kedro run``, ``kedro viz``... avant d'exécuter quoi que ce
+  soit) ;
+- ``clean``     : enregistrement puis exécution du seul nettoyage sur un
+  petit DataFrame (équivalent de ``kedro run --nodes clean_weather_data_node``
+  sans le catalogue) ;
+- ``train``     : idem suivi de ``train_model``, pour comparaison.
+
+Pour chaque scénario : temps total d'import (somme des ``self`` de
+``-X importtime``), temps réel du processus, paquets de premier niveau les
+plus coûteux, et bibliothèques lourdes chargées. Avec ``--check``, le code
+de sortie vaut 1 si ``register`` importe pandas ou pyarrow, ou si
+``register`` ou ``clean`` importe scikit-learn, matplotlib ou scipy.
+
+Usage ::
+
+    python benchmarks/bench_startup.py --repeat 5 --check
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+HEAVY = ("sklearn", "matplotlib", "scipy", "pyarrow", "pandas", "numpy")
+# Bibliothèques qui ne doivent pas être chargées pour enregistrer ou nettoyer.
+# pandas (>= 2.2) importe lui-même pyarrow : il n'est interdit qu'à l'enregistrement
+FORBIDDEN = {
+    "register": ("sklearn", "matplotlib", "scipy", "pyarrow", "pandas"),
+    "clean": ("sklearn", "matplotlib", "scipy"),
+}
+
+_REGISTER = """
+from kedro.framework.project import configure_project
+configure_project("tp_kedro_weather")
+from tp_kedro_weather.pipeline_registry import register_pipelines
+pipelines = register_pipelines()
+"""
+
+_CLEAN = _REGISTER + """
+import pandas as pd
+import yaml
+from tp_kedro_weather.pipelines.data_processing.nodes import clean_weather_data
+params = yaml.safe_load(open(PARAMETERS_PATH))
+raw = pd.DataFrame({
+    "temperature": ["21.5", "N/A", "18.0", "25.1"] * 25,
+    "humidity": ["60", "55", "missing", "70"] * 25,
+    "windspeed": ["10", "12", "8", "unknown"] * 25,
+})
+cleaned, _ = clean_weather_data(raw, params["cleaning"])
+"""
+
+_TRAIN = _CLEAN + """
+from tp_kedro_weather.pipelines.data_processing.nodes import train_model
+train_model(cleaned, {**params["training"], "n_workers": 1}, {"enabled": False})
+"""
+
+
+def scenarios() -> dict:
+    params = repr(str(PROJECT_DIR / "conf" / "base" / "parameters.yml"))
+    return {
+        "register": _REGISTER,
+        "clean": _CLEAN.replace("PARAMETERS_PATH", params),
+        "train": _TRAIN.replace("PARAMETERS_PATH", params),
+    }
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Somme des temps ``self`` et temps cumulé de chaque paquet de premier niveau (µs)."""
+    total = 0
+    top_level = {}
+    packages = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        total += int(self_us)
+        module = name.strip()
+        packages.add(module.split(".")[0])
+        # Les imports imbriqués sont indentés de deux espaces par niveau
+        if not name[1:].startswith(" "):
+            top_level[module] = int(cumulative_us)
+    return {"import_us": total, "top_level_us": top_level, "packages": packages}
+
+
+def run(code: str) -> dict:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_DIR, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr[-2000:])
+    return {"wall_s": wall, **parse_importtime(completed.stderr)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Meilleur temps sur N interpréteurs")
+    parser.add_argument("--top", type=int, default=8, help="Paquets de premier niveau affichés")
+    parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--check", action="store_true", help="Échouer si un import lourd est chargé trop tôt")
+    args = parser.parse_args()
+
+    results = {}
+    failures = []
+    for name, code in scenarios().items():
+        runs = [run(code) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["import_us"])
+        heavy = sorted(package for package in HEAVY if package in best["packages"])
+        results[name] = {
+            "import_ms": best["import_us"] / 1000,
+            "wall_ms": min(r["wall_s"] for r in runs) * 1000,
+            "heavy_imports": heavy,
+            "top_level_ms": {
+                package: us / 1000
+                for package, us in sorted(best["top_level_us"].items(), key=lambda item: -item[1])[:args.top]
+            },
+        }
+        print(f"\n== {name} : imports {results[name]['import_ms']:.0f} ms, "
+              f"processus {results[name]['wall_ms']:.0f} ms")
+        print(f"   bibliothèques lourdes : {', '.join(heavy) or 'aucune'}")
+        for package, ms in results[name]["top_level_ms"].items():
+            print(f"   {package:<30} {ms:>8.1f} ms")
+        unexpected = sorted(set(heavy) & set(FORBIDDEN.get(name, ())))
+        if unexpected:
+            failures.append(f"{name} importe {', '.join(unexpected)}")
+
+    if "train" in results and results["train"]["import_ms"] > 0:
+        for name in ("register", "clean"):
+            ratio = results[name]["import_ms"] / results["train"]["import_ms"]
+            print(f"\n{name} : {ratio:.0%} du temps d'import du scénario complet (train)")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if failures:
+        print("\n" + "\n".join(failures))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
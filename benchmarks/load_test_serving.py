@@ -0,0 +1,109 @@
+"""Test de charge du serveur de prédiction local.
+
+Lance N clients concurrents (connexions HTTP persistantes) pendant une durée
+donnée contre ``python -m tp_kedro_weather serve`` et affiche le débit et les
+latences p50/p99 vues par les clients, puis les compteurs du serveur.
+
+Exemple ::
+
+    python -m tp_kedro_weather serve --max-wait-ms 2 &
+    python benchmarks/load_test_serving.py --concurrency 32 --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import threading
+import time
+
+import numpy as np
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """Connexion HTTP sur un socket Unix."""
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+def connect(args: argparse.Namespace) -> http.client.HTTPConnection:
+    if args.unix_socket:
+        return UnixHTTPConnection(args.unix_socket)
+    connection = http.client.HTTPConnection(args.host, args.port, timeout=10.0)
+    connection.connect()
+    connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
+
+
+def client(args: argparse.Namespace, seed: int, stop_at: float, latencies: list, errors: list) -> None:
+    rng = np.random.default_rng(seed)
+    connection = connect(args)
+    headers = {"Content-Type": "application/json"}
+    local = []
+    n_errors = 0
+    while time.perf_counter() < stop_at:
+        instances = [
+            {"humidity": float(h), "windspeed": float(w)}
+            for h, w in zip(rng.uniform(0, 100, args.rows_per_request), rng.uniform(0, 50, args.rows_per_request))
+        ]
+        body = json.dumps({"instances": instances})
+        start = time.perf_counter()
+        connection.request("POST", "/predict", body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        local.append(time.perf_counter() - start)
+        n_errors += response.status != 200
+    connection.close()
+    latencies.extend(local)
+    errors.append(n_errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--unix-socket", default=None)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Durée du test en secondes")
+    parser.add_argument("--rows-per-request", type=int, default=1)
+    args = parser.parse_args()
+
+    latencies: list = []
+    errors: list = []
+    stop_at = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=client, args=(args, seed, stop_at, latencies, errors))
+        for seed in range(args.concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1000.0
+    n_requests = latencies_ms.size
+    print(f"Requêtes : {n_requests} en {elapsed:.1f} s, {sum(errors)} erreurs")
+    print(f"Débit    : {n_requests / elapsed:,.0f} requêtes/s, "
+          f"{n_requests * args.rows_per_request / elapsed:,.0f} lignes/s")
+    if n_requests:
+        print(f"Latence  : p50 {np.percentile(latencies_ms, 50):.2f} ms, "
+              f"p99 {np.percentile(latencies_ms, 99):.2f} ms, max {latencies_ms.max():.2f} ms")
+
+    connection = connect(args)
+    connection.request("GET", "/metrics")
+    print("\nCompteurs du serveur :")
+    print(json.dumps(json.loads(connection.getresponse().read()), indent=2))
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
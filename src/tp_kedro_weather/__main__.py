@@ -1,5 +1,9 @@
 """tp_kedro_weather file for ensuring the package is executable
 as `tp-kedro-weather` and `python -m tp_kedro_weather`
+
+`python -m tp_kedro_weather serve` starts the local prediction server
+(see `tp_kedro_weather.serving`); `python -m tp_kedro_weather runs` lists
+and compares archived runs (see `tp_kedro_weather.artifacts`).
 """
 import sys
 from pathlib import Path
@@ -10,6 +14,15 @@ from kedro.framework.project import configure_project
 
 
 def main(*args, **kwargs) -> Any:
+    if not args and sys.argv[1:2] == ["serve"]:
+        from tp_kedro_weather.serving import main as serve
+
+        return serve(sys.argv[2:])
+    if not args and sys.argv[1:2] == ["runs"]:
+        from tp_kedro_weather.artifacts import main as runs
+
+        return runs(sys.argv[2:])
+
     package_name = Path(__file__).parent.name
     configure_project(package_name)
 
@@ -0,0 +1,264 @@
+"""Magasin d'artefacts des runs, adressé par contenu.
+
+Chaque run enregistre sa transformation (étapes de prétraitement du
+``Pipeline`` scikit-learn), son estimateur et ses métriques comme objets
+indépendants, nommés par le hash BLAKE2b de leur contenu sérialisé ::
+
+    data/04_models/artifacts/
+        objects/3f/3f9c....pkl     # transformation, estimateur (pickle)
+        objects/a1/a1b2....json    # métriques (JSON)
+        runs.jsonl                 # index : une ligne par run
+
+Un objet identique à celui d'un run précédent (même transformation, même
+modèle relu depuis le cache d'entraînement...) n'est pas réécrit. L'index
+associe l'identifiant de chaque run à ses objets et garde un résumé des
+métriques scalaires : lister et comparer des centaines de runs ne lit que
+ce fichier, sans désérialiser aucun modèle ni importer scikit-learn. Les
+objets d'un run ne sont lus qu'à l'accès (``RunArtifacts.model``,
+``RunArtifacts.metrics``).
+
+Lister les runs ou en comparer quelques-uns ::
+
+    python -m tp_kedro_weather runs
+    python -m tp_kedro_weather runs --compare <run_id> <run_id>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_STORE = "data/04_models/artifacts"
+_INDEX_FILE = "runs.jsonl"
+# Métriques reprises dans le résumé de l'index (les autres restent dans l'objet JSON)
+SUMMARY_KEYS = ("model_type", "r2_test", "mse_test", "mae_test", "r2_train", "mse_train", "n_train", "n_test")
+
+
+def _json_default(value: Any) -> Any:
+    # Scalaires et tableaux NumPy, sans importer NumPy
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Objet non sérialisable en JSON : {type(value).__name__}")
+
+
+def _type_name(obj: Any) -> str:
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+class RunArtifacts:
+    """Artefacts d'un run, chargés à la demande (et une seule fois)."""
+
+    def __init__(self, store: "ArtifactStore", record: Dict[str, Any]):
+        self._store = store
+        self.record = record
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def run_id(self) -> str:
+        return self.record["run_id"]
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Métriques scalaires de l'index (aucun objet lu)."""
+        return self.record["summary"]
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Métriques complètes (objet JSON, sans désérialisation pickle)."""
+        if "metrics" not in self._cache:
+            self._cache["metrics"] = self._store.read_object(self.record["artifacts"]["metrics"])
+        return self._cache["metrics"]
+
+    @property
+    def model(self) -> Any:
+        """Modèle complet : transformation et estimateur réassemblés en ``Pipeline``."""
+        if "model" not in self._cache:
+            artifacts = self.record["artifacts"]
+            estimator = self._store.read_object(artifacts["model"])
+            if "transform" in artifacts:
+                from sklearn.pipeline import Pipeline
+
+                steps = self._store.read_object(artifacts["transform"])
+                estimator = Pipeline(steps + [(artifacts["model"]["step"], estimator)])
+            self._cache["model"] = estimator
+        return self._cache["model"]
+
+
+class ArtifactStore:
+    """
+    Répertoire d'objets adressés par contenu et index des runs.
+
+    Args:
+        root: Répertoire du magasin
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = Path(root)
+        self._records: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_stamp: Optional[Tuple[int, int]] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / _INDEX_FILE
+
+    def _object_path(self, digest: str, suffix: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{suffix}"
+
+    def put_object(self, payload: bytes, suffix: str) -> Dict[str, Any]:
+        """Écrire un objet s'il n'existe pas déjà ; renvoie sa référence."""
+        digest = hashlib.blake2b(payload, digest_size=20).hexdigest()
+        path = self._object_path(digest, suffix)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        return {"hash": digest, "format": suffix.lstrip("."), "size": len(payload)}
+
+    def read_object(self, reference: Dict[str, Any]) -> Any:
+        path = self._object_path(reference["hash"], f".{reference['format']}")
+        if reference["format"] == "json":
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def save_run(self, run_id: Optional[str], model: Any, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enregistrer les artefacts d'un run et l'ajouter à l'index.
+
+        Args:
+            run_id: Identifiant du run (un identifiant aléatoire si ``None``)
+            model: Modèle entraîné (``Pipeline`` scikit-learn ou estimateur seul)
+            metrics: Métriques du run (sérialisables en JSON)
+
+        Returns:
+            Entrée de l'index
+        """
+        artifacts = {}
+        steps = getattr(model, "steps", None)
+        if steps:
+            # Prétraitement et estimateur séparés : une transformation inchangée est partagée
+            if len(steps) > 1:
+                artifacts["transform"] = {
+                    **self.put_object(pickle.dumps(list(steps[:-1]), protocol=pickle.HIGHEST_PROTOCOL), ".pkl"),
+                    "type": [_type_name(step) for _, step in steps[:-1]],
+                }
+            step, estimator = steps[-1]
+        else:
+            step, estimator = None, model
+        artifacts["model"] = {
+            **self.put_object(pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL), ".pkl"),
+            "type": _type_name(estimator),
+            "step": step,
+        }
+        metrics_json = json.dumps(metrics, sort_keys=True, default=_json_default).encode()
+        artifacts["metrics"] = self.put_object(metrics_json, ".json")
+
+        record = {
+            "run_id": run_id or uuid.uuid4().hex,
+            "timestamp": time.time(),
+            "artifacts": artifacts,
+            "summary": {key: metrics[key] for key in SUMMARY_KEYS if key in metrics},
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Une seule écriture par ligne en mode ajout : sûr entre processus
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=_json_default) + "\n")
+        return record
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Entrées de l'index par run (la dernière l'emporte), relues si le fichier a changé."""
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            return {}
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if self._records is None or stamp != self._index_stamp:
+            records = {}
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        records[record["run_id"]] = record
+            self._records, self._index_stamp = records, stamp
+        return self._records
+
+    def runs(self) -> List[RunArtifacts]:
+        """Tous les runs, du plus ancien au plus récent."""
+        records = sorted(self._read_index().values(), key=lambda record: record["timestamp"])
+        return [RunArtifacts(self, record) for record in records]
+
+    def run(self, run_id: str) -> RunArtifacts:
+        """Un run, par identifiant complet ou préfixe non ambigu."""
+        records = self._read_index()
+        if run_id in records:
+            return RunArtifacts(self, records[run_id])
+        matches = [key for key in records if key.startswith(run_id)]
+        if len(matches) != 1:
+            raise KeyError(f"Run '{run_id}' {'ambigu' if matches else 'introuvable'} dans {self.index_path}")
+        return RunArtifacts(self, records[matches[0]])
+
+    def compare(self, run_ids: Sequence[str], keys: Sequence[str] = SUMMARY_KEYS) -> List[Dict[str, Any]]:
+        """Résumés de plusieurs runs, avec pour chaque artefact l'indication qu'il est partagé."""
+        runs = [self.run(run_id) for run_id in run_ids]
+        rows = []
+        for run in runs:
+            row = {"run_id": run.run_id, **{key: run.summary.get(key) for key in keys}}
+            for name, reference in run.record["artifacts"].items():
+                row[f"{name}_hash"] = reference["hash"][:12]
+            rows.append(row)
+        return rows
+
+
+def _format_table(rows: List[Dict[str, Any]]) -> str:
+    if not rows:
+        return "(aucun run)"
+    columns = list(rows[0])
+
+    def cell(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return "" if value is None else str(value)
+
+    widths = {column: max(len(column), *(len(cell(row.get(column))) for row in rows)) for column in columns}
+    lines = ["  ".join(column.ljust(widths[column]) for column in columns)]
+    lines += ["  ".join(cell(row.get(column)).ljust(widths[column]) for column in columns) for row in rows]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tp_kedro_weather runs", description="Lister ou comparer les runs archivés.")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="Répertoire du magasin d'artefacts")
+    parser.add_argument("--limit", type=int, default=20, help="Nombre de runs récents listés (0 : tous)")
+    parser.add_argument("--compare", nargs="+", metavar="RUN_ID", help="Runs à comparer (identifiants ou préfixes)")
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.store)
+    if args.compare:
+        try:
+            rows = store.compare(args.compare)
+        except KeyError as error:
+            parser.exit(1, f"{parser.prog}: {error.args[0]}\n")
+        print(_format_table(rows))
+        return
+    runs = store.runs()
+    runs = runs[-args.limit:] if args.limit else runs
+    rows = [
+        {
+            # Identifiant complet : les identifiants de session ne diffèrent
+            # souvent qu'après l'heure
+            "run_id": run.run_id,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.record["timestamp"])),
+            **{key: run.summary.get(key) for key in ("model_type", "r2_test", "mse_test")},
+            "model": run.record["artifacts"]["model"]["hash"][:12],
+        }
+        for run in runs
+    ]
+    print(_format_table(rows))
@@ -0,0 +1,48 @@
+"""Datasets personnalisés du projet.
+
+Les classes sont importées à la première utilisation : importer le paquet
+(ou ``FrameChunks`` seul) ne charge pas pyarrow.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .arrow_csv_dataset import ArrowCSVDataset
+    from .artifact_store_dataset import ArtifactStoreDataset
+    from .chunked_csv_dataset import ChunkedCSVDataset, CSVChunks, FrameChunks
+    from .columnar_dataset import ColumnarChunks, ColumnarDataset
+    from .feature_store_dataset import FeatureStoreDataset
+    from .numpy_arrays_dataset import NumpyArraysDataset
+    from .optional_pickle_dataset import OptionalPickleDataset
+    from .partitioned_csv_dataset import CSVPartition, PartitionChunks, PartitionedCSVDataset
+
+_MODULES = {
+    "ArrowCSVDataset": "arrow_csv_dataset",
+    "ArtifactStoreDataset": "artifact_store_dataset",
+    "ChunkedCSVDataset": "chunked_csv_dataset",
+    "CSVChunks": "chunked_csv_dataset",
+    "ColumnarChunks": "columnar_dataset",
+    "ColumnarDataset": "columnar_dataset",
+    "CSVPartition": "partitioned_csv_dataset",
+    "FeatureStoreDataset": "feature_store_dataset",
+    "FrameChunks": "chunked_csv_dataset",
+    "NumpyArraysDataset": "numpy_arrays_dataset",
+    "OptionalPickleDataset": "optional_pickle_dataset",
+    "PartitionChunks": "partitioned_csv_dataset",
+    "PartitionedCSVDataset": "partitioned_csv_dataset",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
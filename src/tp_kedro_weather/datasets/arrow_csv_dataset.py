@@ -0,0 +1,156 @@
+"""Dataset CSV parsé par le lecteur multi-thread de pyarrow, avec schéma déclaré.
+
+Les colonnes numériques du schéma sont parsées en texte Arrow, puis
+converties en bloc dans leur type par ``pyarrow.compute`` ; les sentinelles
+(``N/A``, ``missing``...) et toute autre valeur non numérique deviennent des
+nulls, comme avec ``pd.to_numeric(errors="coerce")``. Les mesures arrivent
+donc en tableaux flottants natifs (NaN pour les nulls), sans colonne
+``object`` ni seconde conversion dans le nettoyage.
+
+Les valeurs non numériques rendues nulles sont comptées par valeur dans
+``df.attrs[RAW_TOKENS_ATTR]`` : le rapport de nettoyage et le profil de
+qualité gardent ainsi leurs compteurs par sentinelle et de valeurs invalides.
+"""
+
+from __future__ import annotations
+
+import logging
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+from kedro.io import AbstractDataset
+
+from tp_kedro_weather.pipelines.data_processing.cleaning import RAW_TOKENS_ATTR
+
+logger = logging.getLogger(__name__)
+
+
+class ArrowCSVDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """
+    Dataset CSV local lu avec ``pyarrow.csv`` (parsing et conversion multi-thread).
+
+    - ``schema`` associe un type Arrow (``float64``, ``float32``, ``int64``,
+      ``string``...) aux colonnes ; les autres colonnes gardent le type inféré.
+    - ``sentinels`` : valeurs non numériques attendues dans les colonnes
+      numériques. Toutes les valeurs non numériques deviennent nulles et sont
+      comptées ; celles qui ne sont pas des sentinelles sont en plus signalées
+      dans le journal (conversion plus lente de la colonne concernée).
+    - ``load_args`` : ``columns`` (colonnes à lire), ``block_size`` (octets
+      par bloc parsé, l'unité de parallélisme), ``use_threads``,
+      ``delimiter``, ``encoding``.
+
+    Exemple de configuration ::
+
+        raw_weather_data:
+          type: tp_kedro_weather.datasets.ArrowCSVDataset
+          filepath: data/01_raw/weather_data.csv
+          schema:
+            temperature: float64
+          sentinels: ["N/A", "missing", "unknown"]
+    """
+
+    DEFAULT_LOAD_ARGS: Dict[str, Any] = {"use_threads": True, "block_size": 1 << 24}
+
+    def __init__(
+        self,
+        *,
+        filepath: str,
+        schema: Optional[Dict[str, str]] = None,
+        sentinels: Optional[List[str]] = None,
+        load_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self._filepath = Path(filepath)
+        self._schema = dict(schema or {})
+        self._arrow_types = {name: pa.type_for_alias(alias) for name, alias in self._schema.items()}
+        self._sentinels = list(sentinels or [])
+        self._load_args = {**deepcopy(self.DEFAULT_LOAD_ARGS), **(load_args or {})}
+        self.metadata = metadata
+
+    def _options(self):
+        args = self._load_args
+        read_options = pv.ReadOptions(
+            use_threads=args.get("use_threads", True),
+            block_size=args.get("block_size"),
+            encoding=args.get("encoding", "utf8"),
+        )
+        parse_options = pv.ParseOptions(delimiter=args.get("delimiter", ","))
+        # Colonnes numériques lues en texte : converties ensuite, sentinelles comptées
+        column_types = {
+            name: pa.string() if self._is_numeric(arrow_type) else arrow_type
+            for name, arrow_type in self._arrow_types.items()
+        }
+        convert_options = pv.ConvertOptions(
+            column_types=column_types,
+            null_values=[""],
+            # Les colonnes texte gardent leurs cellules vides comme des nulls, comme pandas
+            strings_can_be_null=True,
+            include_columns=args.get("columns"),
+        )
+        return read_options, parse_options, convert_options
+
+    @staticmethod
+    def _is_numeric(arrow_type: pa.DataType) -> bool:
+        return pa.types.is_floating(arrow_type) or pa.types.is_integer(arrow_type)
+
+    def _to_numeric(self, name: str, column: pa.ChunkedArray, arrow_type: pa.DataType) -> Tuple[pa.ChunkedArray, Dict[str, int]]:
+        """Convertir une colonne texte, non numériques à null ; renvoie aussi leurs comptes par valeur."""
+        is_sentinel = pc.fill_null(pc.is_in(column, value_set=pa.array(self._sentinels, pa.string())), False)
+        tokens = {
+            str(entry["values"]): int(entry["counts"])
+            for entry in pc.value_counts(pc.filter(column, is_sentinel)).to_pylist()
+        }
+        candidates = pc.if_else(is_sentinel, pa.scalar(None, pa.string()), column)
+        try:
+            return pc.cast(candidates, arrow_type), tokens
+        except pa.ArrowInvalid:
+            pass
+        # Valeurs inconnues : même règle que pd.to_numeric(errors="coerce")
+        raw = candidates.to_pandas()
+        values = pd.to_numeric(raw, errors="coerce")
+        unknown = raw[values.isna() & raw.notna()].value_counts()
+        tokens.update((str(value), int(count)) for value, count in unknown.items())
+        logger.warning(
+            "%s : %d valeurs non numériques hors sentinelles dans '%s', lues comme manquantes (%s)",
+            self._filepath, int(unknown.sum()), name, ", ".join(map(repr, unknown.index[:5])),
+        )
+        return pa.chunked_array([pa.array(values, from_pandas=True).cast(arrow_type, safe=False)]), tokens
+
+    def load(self) -> pd.DataFrame:
+        read_options, parse_options, convert_options = self._options()
+        table = pv.read_csv(
+            self._filepath,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        raw_tokens = {}
+        for name, arrow_type in self._arrow_types.items():
+            if self._is_numeric(arrow_type) and name in table.column_names:
+                values, raw_tokens[name] = self._to_numeric(name, table[name], arrow_type)
+                table = table.set_column(table.schema.get_field_index(name), name, values)
+        # Les nulls des colonnes flottantes deviennent des NaN ; self_destruct libère
+        # chaque colonne Arrow dès sa conversion (pas de double occupation)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        df.attrs[RAW_TOKENS_ATTR] = raw_tokens
+        return df
+
+    def save(self, data: pd.DataFrame) -> None:
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        pv.write_csv(pa.Table.from_pandas(data, preserve_index=False), self._filepath)
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "schema": self._schema,
+            "sentinels": self._sentinels,
+            "load_args": self._load_args,
+        }
+
+    def _exists(self) -> bool:
+        return self._filepath.exists()
@@ -0,0 +1,53 @@
+"""Dataset Kedro du magasin d'artefacts des runs (``tp_kedro_weather.artifacts``).
+
+Chaque sauvegarde archive le modèle et les métriques du run sous son
+identifiant (celui du hook de métriques, ``TP_KEDRO_WEATHER_RUN_ID``) ; les
+objets déjà présents dans le magasin ne sont pas réécrits.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional
+
+from kedro.io import AbstractDataset, DatasetError
+
+from tp_kedro_weather.artifacts import ArtifactStore
+from tp_kedro_weather.hooks import RUN_ID_ENV
+
+
+class ArtifactStoreDataset(AbstractDataset[Dict[str, Any], ArtifactStore]):
+    """
+    Répertoire local d'artefacts adressés par contenu, avec index des runs.
+
+    ``save`` attend ``{"model": ..., "metrics": {...}}`` et ajoute le run à
+    l'index. ``load`` renvoie l'``ArtifactStore`` : lister et comparer les
+    runs ne lit que l'index, les modèles ne sont désérialisés qu'à l'accès.
+
+    Exemple de configuration ::
+
+        run_artifacts:
+          type: tp_kedro_weather.datasets.ArtifactStoreDataset
+          filepath: data/04_models/artifacts
+    """
+
+    def __init__(self, *, filepath: str, metadata: Optional[Dict[str, Any]] = None):
+        self._store = ArtifactStore(filepath)
+        self.metadata = metadata
+
+    def load(self) -> ArtifactStore:
+        return self._store
+
+    def save(self, data: Dict[str, Any]) -> None:
+        missing = {"model", "metrics"} - set(data)
+        if missing:
+            raise DatasetError(f"Artefacts manquants pour l'archivage : {sorted(missing)}")
+        record = self._store.save_run(os.environ.get(RUN_ID_ENV), data["model"], data["metrics"])
+        total = sum(reference["size"] for reference in record["artifacts"].values())
+        print(f"Run {record['run_id']} archivé dans {self._store.root} ({total / 1e6:.2f} Mo d'artefacts référencés)")
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": str(self._store.root)}
+
+    def _exists(self) -> bool:
+        return self._store.index_path.exists()
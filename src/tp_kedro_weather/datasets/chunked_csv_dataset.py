@@ -0,0 +1,247 @@
+"""Dataset CSV lu et écrit par blocs de taille fixe.
+
+Permet de traiter des fichiers plus gros que la mémoire d'un worker : la
+mémoire de pointe dépend de ``chunksize`` et non de la taille du fichier.
+"""
+
+from __future__ import annotations
+
+import io
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+from kedro.io import AbstractDataset
+
+_BLOCK_SIZE = 1 << 20
+
+
+class FrameChunks(ABC):
+    """Source ré-itérable de DataFrames lus bloc par bloc.
+
+    Chaque appel à ``iter()`` relit la source depuis le début, ce qui permet
+    plusieurs passes (statistiques puis transformation) sans tout charger.
+    Les sous-classes définissent ``__iter__`` et ``columns``.
+    """
+
+    chunksize: int
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        """Blocs de la source, depuis le début."""
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        """Noms des colonnes de la source."""
+
+    def count_rows(self) -> int:
+        """Compter les lignes en ne gardant qu'un bloc en mémoire."""
+        return sum(len(chunk) for chunk in self)
+
+    def map(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> "FrameChunks":
+        """Appliquer ``func`` paresseusement à chaque bloc."""
+        return MappedChunks(self, func)
+
+
+class MappedChunks(FrameChunks):
+    """Blocs d'une source transformés à la volée par une fonction."""
+
+    def __init__(self, source: FrameChunks, func: Callable[[pd.DataFrame], pd.DataFrame]):
+        self._source = source
+        self._func = func
+        self.chunksize = source.chunksize
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for chunk in self._source:
+            yield self._func(chunk)
+
+    @property
+    def columns(self) -> List[str]:
+        return self._source.columns
+
+    def count_rows(self) -> int:
+        return self._source.count_rows()
+
+
+class _ByteRange(io.RawIOBase):
+    """Vue en lecture seule sur ``length`` octets d'un fichier binaire déjà positionné."""
+
+    def __init__(self, raw: io.BufferedReader, length: int):
+        self._raw = raw
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        n_read = self._raw.readinto(memoryview(buffer)[: self._remaining])
+        self._remaining -= n_read
+        return n_read
+
+
+class CSVChunks(FrameChunks):
+    """
+    Fichier CSV relu par blocs de ``chunksize`` lignes à chaque itération.
+
+    ``byte_range`` limite la lecture à une plage d'octets alignée sur des
+    débuts de ligne (par exemple les lignes ajoutées depuis un run précédent) ;
+    l'en-tête est alors relu en début de fichier.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        chunksize: int,
+        load_args: Optional[Dict[str, Any]] = None,
+        byte_range: Optional[Tuple[int, int]] = None,
+    ):
+        self._filepath = Path(filepath)
+        self.chunksize = chunksize
+        self._load_args = load_args or {}
+        self.byte_range = byte_range
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        if self.byte_range is None:
+            with pd.read_csv(self._filepath, chunksize=self.chunksize, **self._load_args) as reader:
+                yield from reader
+            return
+
+        start, end = max(self.byte_range[0], self.header_end()), self.byte_range[1]
+        if end <= start:
+            return
+        columns = self.columns
+        with open(self._filepath, "rb") as raw:
+            raw.seek(start)
+            stream = io.TextIOWrapper(io.BufferedReader(_ByteRange(raw, end - start)), encoding="utf-8")
+            with pd.read_csv(
+                stream, chunksize=self.chunksize, header=None, names=columns, **self._load_args
+            ) as reader:
+                yield from reader
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    @property
+    def columns(self) -> List[str]:
+        header = pd.read_csv(self._filepath, nrows=0, **self._load_args)
+        return list(header.columns)
+
+    def tail(self, start: int, end: Optional[int] = None) -> "CSVChunks":
+        """Source limitée aux lignes entre les octets ``start`` et ``end`` (fin des lignes complètes par défaut)."""
+        end = self.complete_size() if end is None else end
+        return CSVChunks(str(self._filepath), self.chunksize, self._load_args, byte_range=(start, end))
+
+    def header_end(self) -> int:
+        """Position de l'octet qui suit la ligne d'en-tête."""
+        with open(self._filepath, "rb") as f:
+            return len(f.readline())
+
+    def complete_size(self) -> int:
+        """Taille du fichier tronquée à la dernière ligne complète (ignore une ligne en cours d'écriture)."""
+        size = self._filepath.stat().st_size
+        with open(self._filepath, "rb") as f:
+            position = size
+            while position > 0:
+                block_start = max(position - _BLOCK_SIZE, 0)
+                f.seek(block_start)
+                block = f.read(position - block_start)
+                newline = block.rfind(b"\n")
+                if newline >= 0:
+                    return block_start + newline + 1
+                position = block_start
+        return 0
+
+    def count_rows(self) -> int:
+        """
+        Compter les lignes de données sans parser le CSV.
+
+        Compte les fins de ligne par blocs binaires, en retirant l'en-tête.
+        Suppose un fichier sans retour à la ligne à l'intérieur des champs.
+        """
+        if self.byte_range is not None:
+            start, end = max(self.byte_range[0], self.header_end()), self.byte_range[1]
+        else:
+            start, end = 0, self._filepath.stat().st_size
+        n_lines = 0
+        last_block = b""
+        with open(self._filepath, "rb") as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = f.read(min(_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                n_lines += block.count(b"\n")
+                remaining -= len(block)
+                last_block = block
+        if last_block and not last_block.endswith(b"\n"):
+            n_lines += 1
+        if self.byte_range is not None:
+            return n_lines
+        return max(n_lines - 1, 0)
+
+
+class ChunkedCSVDataset(AbstractDataset[Union[pd.DataFrame, Iterable[pd.DataFrame]], CSVChunks]):
+    """
+    Dataset CSV local lu et écrit par blocs.
+
+    ``load`` renvoie un ``CSVChunks`` ré-itérable ; ``save`` accepte un
+    DataFrame ou n'importe quel itérable de DataFrames et les écrit à la suite
+    (en-tête écrit une seule fois).
+
+    Exemple de configuration ::
+
+        raw_weather_data:
+          type: tp_kedro_weather.datasets.ChunkedCSVDataset
+          filepath: data/01_raw/weather_data.csv
+          chunksize: 100000
+    """
+
+    DEFAULT_LOAD_ARGS: Dict[str, Any] = {}
+    DEFAULT_SAVE_ARGS: Dict[str, Any] = {"index": False}
+
+    def __init__(
+        self,
+        *,
+        filepath: str,
+        chunksize: int = 100_000,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        if chunksize <= 0:
+            raise ValueError(f"'chunksize' doit être strictement positif, reçu {chunksize}")
+        self._filepath = Path(filepath)
+        self._chunksize = chunksize
+        self._load_args = {**deepcopy(self.DEFAULT_LOAD_ARGS), **(load_args or {})}
+        self._save_args = {**deepcopy(self.DEFAULT_SAVE_ARGS), **(save_args or {})}
+        self.metadata = metadata
+
+    def load(self) -> CSVChunks:
+        return CSVChunks(str(self._filepath), self._chunksize, self._load_args)
+
+    def save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._filepath, "w", newline="", encoding="utf-8") as f:
+            header = True
+            for chunk in chunks:
+                chunk.to_csv(f, header=header, **self._save_args)
+                header = False
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "chunksize": self._chunksize,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+        }
+
+    def _exists(self) -> bool:
+        return self._filepath.exists()
@@ -0,0 +1,207 @@
+"""Dataset colonnaire typé (Parquet ou Arrow IPC) pour les données intermédiaires.
+
+Contrairement au CSV, les types sont stockés avec les données : pas de
+re-parsing texte ni d'inférence de dtypes à chaque lecture.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset
+
+from .chunked_csv_dataset import FrameChunks
+
+_FORMATS = ("parquet", "arrow")
+# Métadonnées du schéma qui conservent ``DataFrame.attrs`` (JSON)
+_ATTRS_KEY = b"tp_kedro_weather.attrs"
+
+
+def _read_arrow_table(filepath: Path, columns: Optional[List[str]], memory_map: bool) -> pa.Table:
+    # Le mapping mémoire reste ouvert : les buffers Arrow le référencent
+    source = pa.memory_map(str(filepath)) if memory_map else pa.OSFile(str(filepath))
+    table = ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
+
+
+class ColumnarChunks(FrameChunks):
+    """Fichier colonnaire relu par lots de ``batch_size`` lignes à chaque itération."""
+
+    def __init__(
+        self,
+        filepath: str,
+        file_format: str,
+        batch_size: int,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True,
+    ):
+        self._filepath = Path(filepath)
+        self._file_format = file_format
+        self.chunksize = batch_size
+        self._columns = columns
+        self._memory_map = memory_map
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        if self._file_format == "parquet":
+            parquet_file = pq.ParquetFile(self._filepath, memory_map=self._memory_map)
+            for batch in parquet_file.iter_batches(batch_size=self.chunksize, columns=self._columns):
+                yield batch.to_pandas(split_blocks=True)
+        else:
+            table = _read_arrow_table(self._filepath, self._columns, self._memory_map)
+            for batch in table.to_batches(max_chunksize=self.chunksize):
+                yield batch.to_pandas(split_blocks=True)
+
+    @property
+    def columns(self) -> List[str]:
+        if self._columns:
+            return list(self._columns)
+        if self._file_format == "parquet":
+            return pq.read_schema(self._filepath).names
+        return ipc.open_file(pa.memory_map(str(self._filepath))).schema.names
+
+    def count_rows(self) -> int:
+        """Lire le nombre de lignes dans les métadonnées, sans décoder les données."""
+        if self._file_format == "parquet":
+            return pq.ParquetFile(self._filepath).metadata.num_rows
+        reader = ipc.open_file(pa.memory_map(str(self._filepath)))
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+
+class ColumnarDataset(AbstractDataset[Union[pd.DataFrame, Iterable[pd.DataFrame]], Union[pd.DataFrame, ColumnarChunks]]):
+    """
+    Dataset local Parquet ou Arrow IPC avec schéma explicite.
+
+    - ``schema`` associe un type Arrow (``float32``, ``float64``, ``int64``,
+      ``string``...) aux colonnes ; les autres colonnes gardent le type inféré.
+      Déclarer ``float32`` divise par deux la taille des mesures.
+    - ``load_args.columns`` ne lit que les colonnes utiles.
+    - ``load_args.memory_map`` (par défaut ``True``) lit le fichier via un
+      mapping mémoire ; en Arrow IPC non compressé, les colonnes numériques
+      sans valeur manquante sont alors des vues sans copie (lecture seule).
+    - ``load_args.batch_size`` renvoie une source par blocs (``ColumnarChunks``)
+      au lieu d'un DataFrame.
+    - ``save`` accepte un DataFrame ou un itérable de DataFrames, écrits
+      comme autant de row groups / record batches dans un fichier temporaire
+      renommé à la fin. Un itérable vide écrit un fichier sans ligne, au
+      schéma déclaré.
+    - ``DataFrame.attrs`` (celui du premier bloc) est conservé dans les
+      métadonnées du schéma et restauré au chargement d'un DataFrame.
+
+    Exemple de configuration ::
+
+        cleaned_weather_data:
+          type: tp_kedro_weather.datasets.ColumnarDataset
+          filepath: data/02_intermediate/cleaned_weather_data.parquet
+          schema:
+            temperature: float32
+          save_args:
+            compression: zstd
+    """
+
+    DEFAULT_LOAD_ARGS: Dict[str, Any] = {"memory_map": True}
+    DEFAULT_SAVE_ARGS: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        *,
+        filepath: str,
+        file_format: str = "parquet",
+        schema: Optional[Dict[str, str]] = None,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        if file_format not in _FORMATS:
+            raise ValueError(f"'file_format' doit valoir l'un de {_FORMATS}, reçu '{file_format}'")
+        self._filepath = Path(filepath)
+        self._file_format = file_format
+        self._schema = dict(schema or {})
+        self._arrow_types = {name: pa.type_for_alias(alias) for name, alias in self._schema.items()}
+        self._load_args = {**deepcopy(self.DEFAULT_LOAD_ARGS), **(load_args or {})}
+        default_compression = "zstd" if file_format == "parquet" else None
+        self._save_args = {"compression": default_compression, **deepcopy(self.DEFAULT_SAVE_ARGS), **(save_args or {})}
+        self.metadata = metadata
+
+    def load(self) -> Union[pd.DataFrame, ColumnarChunks]:
+        columns = self._load_args.get("columns")
+        memory_map = self._load_args.get("memory_map", True)
+        batch_size = self._load_args.get("batch_size")
+        if batch_size:
+            return ColumnarChunks(str(self._filepath), self._file_format, batch_size, columns, memory_map)
+        if self._file_format == "parquet":
+            table = pq.read_table(self._filepath, columns=columns, memory_map=memory_map)
+        else:
+            table = _read_arrow_table(self._filepath, columns, memory_map)
+        frame = table.to_pandas(split_blocks=True)
+        attrs = (table.schema.metadata or {}).get(_ATTRS_KEY)
+        if attrs:
+            frame.attrs.update(json.loads(attrs))
+        return frame
+
+    def _to_table(self, chunk: pd.DataFrame, schema: Optional[pa.Schema]) -> pa.Table:
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if schema is None:
+            schema = pa.schema(
+                [pa.field(field.name, self._arrow_types.get(field.name, field.type)) for field in table.schema],
+                metadata={_ATTRS_KEY: json.dumps(chunk.attrs)} if chunk.attrs else None,
+            )
+        columns = [
+            # La réduction float64 -> float32 est voulue : pas de contrôle de troncature
+            table.column(field.name).cast(field.type, safe=not pa.types.is_floating(field.type))
+            for field in schema
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _open_writer(self, path: Path, schema: pa.Schema) -> Any:
+        compression = self._save_args.get("compression")
+        if self._file_format == "parquet":
+            return pq.ParquetWriter(path, schema, compression=compression)
+        options = ipc.IpcWriteOptions(compression=compression)
+        return ipc.new_file(str(path), schema, options=options)
+
+    def save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Écrit à côté puis renommé : une sauvegarde interrompue laisse le fichier précédent intact
+        tmp_path = self._filepath.with_name(f".{self._filepath.name}.tmp")
+        writer = None
+        schema = None
+        try:
+            for chunk in chunks:
+                table = self._to_table(chunk, schema)
+                if writer is None:
+                    schema = table.schema
+                    writer = self._open_writer(tmp_path, schema)
+                writer.write_table(table)
+            if writer is None:
+                # Aucun bloc : fichier vide au schéma déclaré, plutôt que celui d'un run précédent
+                schema = pa.schema([pa.field(name, arrow_type) for name, arrow_type in self._arrow_types.items()])
+                writer = self._open_writer(tmp_path, schema)
+            writer.close()
+            writer = None
+            os.replace(tmp_path, self._filepath)
+        finally:
+            if writer is not None:
+                writer.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "file_format": self._file_format,
+            "schema": self._schema,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+        }
+
+    def _exists(self) -> bool:
+        return self._filepath.exists()
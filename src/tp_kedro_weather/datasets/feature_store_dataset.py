@@ -0,0 +1,99 @@
+"""Table de features persistante, étendue par ajout de fichiers Parquet.
+
+Chaque run n'écrit que les lignes qu'il a calculées, dans un nouveau
+fichier ``part-NNNNN.parquet`` ; ``meta.json``, écrit en dernier, liste les
+fichiers de la table et les métadonnées du calcul (configuration, lignes
+sources couvertes, empreinte). Un run interrompu laisse au pire un fichier
+orphelin, ignoré au chargement et supprimé à la sauvegarde suivante.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset
+
+_META_FILE = "meta.json"
+
+
+class FeatureStoreDataset(AbstractDataset[Dict[str, Any], Optional[Dict[str, Any]]]):
+    """
+    Répertoire local d'une table de features incrémentale.
+
+    ``load`` renvoie ``None`` si la table n'existe pas encore, sinon
+    ``{"meta": ..., "table": DataFrame}`` (fichiers lus par projection en
+    mémoire). ``save`` attend ``{"meta": ..., "table": DataFrame, "start": k}`` :
+    seules les lignes à partir de ``k`` sont écrites, dans un nouveau
+    fichier ; ``start=0`` réécrit la table. Un dictionnaire vide ne modifie
+    rien (Kedro refuse d'enregistrer ``None``).
+
+    Exemple de configuration ::
+
+        feature_store:
+          type: tp_kedro_weather.datasets.FeatureStoreDataset
+          filepath: data/04_feature/weather_features
+    """
+
+    def __init__(self, *, filepath: str, compression: str = "zstd", metadata: Optional[Dict[str, Any]] = None):
+        self._filepath = Path(filepath)
+        self._compression = compression
+        self.metadata = metadata
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        meta_path = self._filepath / _META_FILE
+        if not meta_path.exists():
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        meta = self._read_meta()
+        if meta is None:
+            return None
+        tables = [pq.read_table(self._filepath / part["file"], memory_map=True) for part in meta["parts"]]
+        table = pa.concat_tables(tables) if tables else pa.table({})
+        return {"meta": meta, "table": table.to_pandas(split_blocks=True)}
+
+    def save(self, data: Dict[str, Any]) -> None:
+        if not data:
+            return
+        self._filepath.mkdir(parents=True, exist_ok=True)
+        start = int(data.get("start", 0))
+        previous = self._read_meta()
+        parts = list(previous["parts"]) if previous and start else []
+        # Numérotation jamais réutilisée : une réécriture n'écrase pas les fichiers encore listés
+        counter = previous.get("next_part", len(previous["parts"])) if previous else 0
+
+        rows = data["table"].iloc[start:]
+        if len(rows) or not parts:
+            name = f"part-{counter:05d}.parquet"
+            counter += 1
+            pq.write_table(
+                pa.Table.from_pandas(rows, preserve_index=False),
+                self._filepath / name,
+                compression=self._compression,
+            )
+            parts.append({"file": name, "n_rows": len(rows)})
+
+        # Métadonnées en dernier, par renommage atomique : elles valident les fichiers listés
+        meta = {**data["meta"], "parts": parts, "next_part": counter}
+        tmp_path = self._filepath / (_META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, self._filepath / _META_FILE)
+
+        listed = {part["file"] for part in parts}
+        for path in self._filepath.glob("part-*.parquet"):
+            if path.name not in listed:
+                path.unlink()
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": str(self._filepath), "compression": self._compression}
+
+    def _exists(self) -> bool:
+        return (self._filepath / _META_FILE).exists()
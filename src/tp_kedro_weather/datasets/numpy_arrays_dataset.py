@@ -0,0 +1,65 @@
+"""Dataset de tableaux NumPy nommés, relus par projection en mémoire.
+
+Chaque tableau est écrit dans son propre fichier ``.npy`` et les valeurs
+scalaires dans ``meta.json`` : le chargement ne désérialise aucun objet
+Python et ne lit les pages des tableaux qu'à l'accès.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+from kedro.io import AbstractDataset
+
+_META_FILE = "meta.json"
+
+
+class NumpyArraysDataset(AbstractDataset[Dict[str, Any], Dict[str, Any]]):
+    """
+    Répertoire de tableaux ``.npy`` et de métadonnées JSON.
+
+    ``save`` accepte un dictionnaire : les ``ndarray`` vont dans
+    ``<clé>.npy``, les autres valeurs dans ``meta.json``. Les tableaux d'une
+    sauvegarde précédente absents de la nouvelle sont supprimés. ``load``
+    renvoie le même dictionnaire, tableaux projetés en mémoire (lecture
+    seule) si ``mmap_mode`` vaut ``"r"``.
+
+    Exemple de configuration ::
+
+        compact_model:
+          type: tp_kedro_weather.datasets.NumpyArraysDataset
+          filepath: data/04_models/modele_compact
+    """
+
+    def __init__(self, *, filepath: str, mmap_mode: Optional[str] = "r", metadata: Optional[Dict[str, Any]] = None):
+        self._filepath = Path(filepath)
+        self._mmap_mode = mmap_mode
+        self.metadata = metadata
+
+    def load(self) -> Dict[str, Any]:
+        with open(self._filepath / _META_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        for path in sorted(self._filepath.glob("*.npy")):
+            data[path.stem] = np.load(path, mmap_mode=self._mmap_mode)
+        return data
+
+    def save(self, data: Dict[str, Any]) -> None:
+        self._filepath.mkdir(parents=True, exist_ok=True)
+        arrays = {name: value for name, value in data.items() if isinstance(value, np.ndarray)}
+        for path in self._filepath.glob("*.npy"):
+            if path.stem not in arrays:
+                path.unlink()
+        for name, array in arrays.items():
+            np.save(self._filepath / f"{name}.npy", np.ascontiguousarray(array))
+        meta = {name: value for name, value in data.items() if name not in arrays}
+        with open(self._filepath / _META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": str(self._filepath), "mmap_mode": self._mmap_mode}
+
+    def _exists(self) -> bool:
+        return (self._filepath / _META_FILE).exists()
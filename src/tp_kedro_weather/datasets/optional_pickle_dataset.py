@@ -0,0 +1,53 @@
+"""Dataset pickle local qui renvoie une valeur par défaut s'il n'existe pas encore.
+
+Utile pour un état persistant d'un run à l'autre (filigrane, statistiques) :
+le premier run démarre de la valeur par défaut au lieu d'échouer.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from kedro.io import AbstractDataset
+
+
+class OptionalPickleDataset(AbstractDataset[Any, Any]):
+    """
+    Pickle local dont le chargement renvoie ``default`` si le fichier est absent.
+
+    L'écriture passe par un fichier temporaire renommé, pour ne jamais laisser
+    un état à moitié écrit.
+
+    Exemple de configuration ::
+
+        incremental_state:
+          type: tp_kedro_weather.datasets.OptionalPickleDataset
+          filepath: data/06_models/incremental_state.pkl
+    """
+
+    def __init__(self, *, filepath: str, default: Any = None, metadata: Optional[Dict[str, Any]] = None):
+        self._filepath = Path(filepath)
+        self._default = default
+        self.metadata = metadata
+
+    def load(self) -> Any:
+        if not self._filepath.exists():
+            return self._default
+        with open(self._filepath, "rb") as f:
+            return pickle.load(f)
+
+    def save(self, data: Any) -> None:
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._filepath.with_suffix(self._filepath.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._filepath)
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": str(self._filepath), "default": self._default}
+
+    def _exists(self) -> bool:
+        return self._filepath.exists()
@@ -0,0 +1,114 @@
+"""Répertoire de fichiers CSV bruts, un fichier par partition.
+
+Les stations livrent un fichier par jour : chaque fichier est une partition,
+identifiée par son chemin relatif sans suffixe. Le chargement ne lit aucun
+fichier ; il renvoie pour chaque partition un objet léger (et picklable,
+donc transmissible à un pool de processus) qui sait se charger et donne une
+empreinte bon marché (taille, date de modification) pour détecter les
+partitions nouvelles ou modifiées.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from kedro.io import AbstractDataset, DatasetError
+
+from .chunked_csv_dataset import FrameChunks
+
+
+class CSVPartition:
+    """Un fichier CSV d'un répertoire partitionné, chargé à la demande."""
+
+    def __init__(self, filepath: str, load_args: Optional[Dict[str, Any]] = None):
+        self.filepath = Path(filepath)
+        self._load_args = load_args or {}
+
+    @property
+    def fingerprint(self) -> str:
+        """Taille et date de modification (ns) : changent dès que le fichier est réécrit."""
+        stat = self.filepath.stat()
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def load(self) -> pd.DataFrame:
+        return pd.read_csv(self.filepath, **self._load_args)
+
+    def __call__(self) -> pd.DataFrame:
+        return self.load()
+
+    def __repr__(self) -> str:
+        return f"CSVPartition({str(self.filepath)!r})"
+
+
+class PartitionChunks(FrameChunks):
+    """Partitions chargées une à une à chaque itération (une partition par bloc)."""
+
+    def __init__(self, loaders: List[Callable[[], pd.DataFrame]], columns: List[str], chunksize: int):
+        self._loaders = loaders
+        self._columns = columns
+        self.chunksize = chunksize
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for load in self._loaders:
+            yield load()
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+
+class PartitionedCSVDataset(AbstractDataset[None, Dict[str, CSVPartition]]):
+    """
+    Répertoire local de fichiers CSV, en lecture seule.
+
+    ``load`` renvoie ``{identifiant: CSVPartition}`` trié par identifiant ;
+    les fichiers ne sont lus qu'à l'appel de ``CSVPartition.load``.
+
+    Exemple de configuration ::
+
+        raw_weather_partitions:
+          type: tp_kedro_weather.datasets.PartitionedCSVDataset
+          path: data/01_raw/weather_partitions
+          load_args:
+            keep_default_na: false
+            na_values: [""]
+    """
+
+    DEFAULT_LOAD_ARGS: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        filename_suffix: str = ".csv",
+        load_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self._path = Path(path)
+        self._filename_suffix = filename_suffix
+        self._load_args = {**deepcopy(self.DEFAULT_LOAD_ARGS), **(load_args or {})}
+        self.metadata = metadata
+
+    def load(self) -> Dict[str, CSVPartition]:
+        if not self._path.is_dir():
+            raise DatasetError(f"Répertoire de partitions introuvable : {self._path}")
+        partitions = {}
+        for filepath in sorted(self._path.rglob(f"*{self._filename_suffix}")):
+            if filepath.is_file():
+                relative = filepath.relative_to(self._path).as_posix()
+                partitions[relative[: len(relative) - len(self._filename_suffix)]] = CSVPartition(
+                    str(filepath), self._load_args
+                )
+        return partitions
+
+    def save(self, data: None) -> None:
+        raise DatasetError(f"{type(self).__name__} est en lecture seule")
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"path": str(self._path), "filename_suffix": self._filename_suffix, "load_args": self._load_args}
+
+    def _exists(self) -> bool:
+        return self._path.is_dir()
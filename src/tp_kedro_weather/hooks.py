@@ -0,0 +1,436 @@
+"""Hooks du projet : mesures de temps et de mémoire par node et par dataset.
+
+Chaque node enregistre son temps réel, son temps CPU, sa RSS courante et
+l'augmentation du pic de RSS ; chaque chargement et sauvegarde de dataset
+enregistre sa durée et sa taille. Les mesures sont ajoutées au fil de l'eau à
+un fichier JSON lines (une ligne par événement, utilisable aussi depuis les
+processus d'un ``ParallelRunner``), puis résumées en fin de run dans un
+fichier au format texte Prometheus pour le textfile collector.
+
+``tracemalloc`` (pic d'allocations Python par node) est coûteux et n'est
+activé que si la variable d'environnement ``KEDRO_TRACEMALLOC`` vaut 1. Son
+pic est global au processus : avec ``ThreadRunner``, il mélange les nodes
+exécutés en même temps.
+
+Avec ``ParallelRunner``, les nodes s'exécutent dans d'autres processus :
+l'identifiant du run leur est transmis par une variable d'environnement,
+pour que leurs lignes soient comptées dans le résumé Prometheus. Le
+processus principal garde ses propres lignes en mémoire et ne relit du
+fichier que celles ajoutées par les autres processus depuis le début du run.
+
+La taille des datasets fichiers est un simple ``stat`` par événement ; les
+datasets répertoires (magasin d'artefacts, table de features) ne sont
+parcourus qu'une fois, en fin de run.
+
+Le paramètre ``memory.budget_mb`` (ou ``kedro run --params
+memory.budget_mb=2048``) fixe un budget de pic de RSS : il est vérifié à la
+fin de chaque node, pour le processus du node comme pour ses sous-processus
+terminés (pools d'entraînement), et le premier node qui le dépasse arrête le
+run avec une ``MemoryError``. Le pic atteint (processus du run et
+sous-processus) est affiché en fin de run. Le budget est lui aussi transmis
+par variable d'environnement aux processus d'un ``ParallelRunner``.
+
+Sous ``ParallelRunner``, les ``MemoryDataset`` déclarés ne sont pas partagés
+entre processus : ``ParallelRunnerGuardHooks`` refuse alors le run dès son
+début, au lieu de laisser un node lire un dataset vide.
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from kedro.framework.hooks import hook_impl
+
+TRACEMALLOC_ENV = "KEDRO_TRACEMALLOC"
+# Identifiant du run, hérité par les processus d'un ParallelRunner
+RUN_ID_ENV = "TP_KEDRO_WEATHER_RUN_ID"
+# Budget de pic de RSS en Mo (paramètre memory.budget_mb), idem
+MEMORY_BUDGET_ENV = "TP_KEDRO_WEATHER_MEMORY_BUDGET_MB"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# ru_maxrss est en kilo-octets sous Linux, en octets sous macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _current_rss() -> Optional[int]:
+    """RSS courante en octets (Linux), ``None`` ailleurs."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _peak_rss() -> int:
+    """Pic de RSS du processus depuis son démarrage, en octets."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def _children_peak_rss() -> int:
+    """Plus grand pic de RSS des sous-processus terminés (pools des nodes), en octets."""
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * _MAXRSS_UNIT
+
+
+def _memory_budget() -> Optional[int]:
+    """Budget de pic de RSS en octets, ``None`` sans budget."""
+    value = os.environ.get(MEMORY_BUDGET_ENV)
+    return int(float(value) * 1024 ** 2) if value else None
+
+
+def _mb(n_bytes: int) -> str:
+    return f"{n_bytes / 1024 ** 2:.0f} Mo"
+
+
+def _path_size(path: Path) -> Optional[int]:
+    """Taille d'un fichier, ``None`` si le chemin est absent."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def _tree_size(path: Path) -> int:
+    """Taille totale d'un répertoire (parcours complet : une fois par run seulement)."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _memory_size(data: Any) -> Optional[int]:
+    """Taille en mémoire, seulement quand elle est connue sans parcours coûteux."""
+    if hasattr(data, "memory_usage") and hasattr(data, "columns"):
+        return int(data.memory_usage(index=True, deep=False).sum())
+    nbytes = getattr(data, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, int) else None
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RunMetricsHooks:
+    """
+    Enregistre les mesures par node et par dataset d'un ``kedro run``.
+
+    Args:
+        output_dir: Répertoire des fichiers ``run_metrics.jsonl`` et
+            ``run_metrics.prom``
+    """
+
+    def __init__(self, output_dir: str = "data/08_reporting"):
+        self._output_dir = Path(output_dir)
+        self._catalog = None
+        self._run_id: Optional[str] = None
+        self._run_start = 0.0
+        self._lock = threading.Lock()
+        self._nodes: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._datasets: Dict[Tuple[int, str, str], float] = {}
+        # Lignes écrites par ce processus pendant le run, et position du fichier
+        # au début du run (seules les lignes suivantes sont relues à la fin)
+        self._records: List[Dict[str, Any]] = []
+        self._jsonl_offset = 0
+        self._tracemalloc = os.environ.get(TRACEMALLOC_ENV) == "1"
+
+    @property
+    def jsonl_path(self) -> Path:
+        return self._output_dir / "run_metrics.jsonl"
+
+    @property
+    def prometheus_path(self) -> Path:
+        return self._output_dir / "run_metrics.prom"
+
+    def _write(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        record = {"run_id": self._run_id or os.environ.get(RUN_ID_ENV), "pid": os.getpid(), "timestamp": time.time(), **record}
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            # Une seule écriture par ligne en mode ajout : sûr entre processus
+            with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                f.write(line)
+            if self._run_id is not None and record["run_id"] == self._run_id:
+                self._records.append(record)
+        return record
+
+    @hook_impl
+    def after_context_created(self, context) -> None:
+        budget = (context.params.get("memory") or {}).get("budget_mb")
+        if budget:
+            os.environ[MEMORY_BUDGET_ENV] = str(budget)
+        else:
+            os.environ.pop(MEMORY_BUDGET_ENV, None)
+
+    @hook_impl
+    def after_catalog_created(self, catalog) -> None:
+        self._catalog = catalog
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any]) -> None:
+        self._run_id = run_params.get("run_id") or run_params.get("session_id") or uuid.uuid4().hex
+        os.environ[RUN_ID_ENV] = self._run_id
+        self._run_start = time.perf_counter()
+        self._records = []
+        try:
+            self._jsonl_offset = self.jsonl_path.stat().st_size
+        except OSError:
+            self._jsonl_offset = 0
+        if self._tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._write({"event": "run_start", "pipeline": run_params.get("pipeline_name"), "env": run_params.get("env")})
+
+    @hook_impl
+    def before_node_run(self, node) -> None:
+        key = (threading.get_ident(), node.name)
+        if self._tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._nodes[key] = {
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+            "peak_rss": _peak_rss(),
+            "traced": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        }
+
+    def _node_record(self, node, status: str) -> None:
+        start = self._nodes.pop((threading.get_ident(), node.name), None)
+        if start is None:
+            return
+        peak_rss = _peak_rss()
+        record = {
+            "event": "node",
+            "node": node.name,
+            "status": status,
+            "wall_seconds": time.perf_counter() - start["wall"],
+            # Temps CPU du processus : inclut les threads de calcul du node
+            "cpu_seconds": time.process_time() - start["cpu"],
+            "rss_bytes": _current_rss(),
+            "peak_rss_bytes": peak_rss,
+            "peak_rss_increase_bytes": peak_rss - start["peak_rss"],
+        }
+        if start["traced"] is not None:
+            record["tracemalloc_peak_increase_bytes"] = tracemalloc.get_traced_memory()[1] - start["traced"]
+        self._write(record)
+
+    @hook_impl
+    def after_node_run(self, node) -> None:
+        self._node_record(node, "success")
+        # Vérifié après le node : ru_maxrss donne le vrai pic, même bref. Les
+        # sous-processus (pools d'entraînement) sont terminés à la fin du node :
+        # leur pic compte aussi
+        budget = _memory_budget()
+        if budget is None:
+            return
+        peak_rss, children_peak = _peak_rss(), _children_peak_rss()
+        if max(peak_rss, children_peak) > budget:
+            raise MemoryError(
+                f"Le node {node.name} a porté le pic de RSS à {_mb(peak_rss)} "
+                f"(sous-processus : {_mb(children_peak)}), au-delà du budget de "
+                f"{_mb(budget)} (memory.budget_mb)"
+            )
+
+    @hook_impl
+    def on_node_error(self, node) -> None:
+        self._node_record(node, "error")
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str) -> None:
+        self._datasets[(threading.get_ident(), "load", dataset_name)] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node) -> None:
+        self._dataset_record("load", dataset_name, data, node)
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str) -> None:
+        self._datasets[(threading.get_ident(), "save", dataset_name)] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node) -> None:
+        self._dataset_record("save", dataset_name, data, node)
+
+    def _dataset_record(self, operation: str, dataset_name: str, data: Any, node) -> None:
+        start = self._datasets.pop((threading.get_ident(), operation, dataset_name), None)
+        if start is None:
+            return
+        seconds = time.perf_counter() - start
+        path = self._dataset_path(dataset_name)
+        directory = path is not None and path.is_dir()
+        self._write({
+            "event": "dataset",
+            "operation": operation,
+            "dataset": dataset_name,
+            "node": getattr(node, "name", None),
+            "seconds": seconds,
+            # Un seul stat par événement ; les répertoires sont mesurés en fin de run
+            "file_bytes": None if path is None or directory else _path_size(path),
+            "directory": str(path) if directory else None,
+            "memory_bytes": _memory_size(data),
+        })
+
+    def _dataset_path(self, dataset_name: str) -> Optional[Path]:
+        """Chemin local du dataset (``None`` pour les datasets en mémoire)."""
+        if self._catalog is None or dataset_name.startswith("params:") or dataset_name == "parameters":
+            return None
+        try:
+            dataset = self._catalog[dataset_name]
+        except Exception:  # noqa: BLE001 - un dataset introuvable ne doit pas casser le run
+            return None
+        filepath = getattr(dataset, "_filepath", None)
+        return None if filepath is None else Path(str(filepath))
+
+    @hook_impl
+    def after_pipeline_run(self) -> None:
+        self._finish_run(success=True)
+
+    @hook_impl
+    def on_pipeline_error(self) -> None:
+        self._finish_run(success=False)
+
+    def _finish_run(self, success: bool) -> None:
+        wall = time.perf_counter() - self._run_start
+        records = self._read_run_records()
+        # Datasets répertoires (magasin d'artefacts, table de features...) :
+        # un seul parcours par répertoire et par run
+        directories = {record["dataset"]: record["directory"] for record in records
+                       if record["event"] == "dataset" and record.get("directory")}
+        for dataset_name, directory in directories.items():
+            records.append(self._write({
+                "event": "dataset_size",
+                "dataset": dataset_name,
+                "file_bytes": _tree_size(Path(directory)),
+            }))
+        # Pic sur tous les processus du run : celui-ci, ceux d'un ParallelRunner
+        # (lignes des nodes) et les pools lancés par les nodes
+        peak = max([_peak_rss()] + [record["peak_rss_bytes"] for record in records if record["event"] == "node"])
+        children_peak = _children_peak_rss()
+        budget = _memory_budget()
+        records.append(self._write({
+            "event": "run_end",
+            "success": success,
+            "wall_seconds": wall,
+            "peak_rss_bytes": peak,
+            "children_peak_rss_bytes": children_peak,
+            "memory_budget_bytes": budget,
+        }))
+        self._write_prometheus(records)
+
+        summary = f"\nPic de RSS : {_mb(peak)} (sous-processus : {_mb(children_peak)})"
+        if budget is not None:
+            summary += f", budget {_mb(budget)} ({max(peak, children_peak) / budget:.0%})"
+        print(summary)
+
+    def _read_run_records(self) -> List[Dict[str, Any]]:
+        """Lignes du run : celles de ce processus (en mémoire), puis celles des autres processus."""
+        records = list(self._records)
+        # Nodes d'un ParallelRunner : seules les lignes ajoutées depuis le début du run sont relues
+        pid = os.getpid()
+        try:
+            with open(self.jsonl_path, encoding="utf-8") as f:
+                f.seek(self._jsonl_offset)
+                for line in f:
+                    record = json.loads(line)
+                    if record.get("run_id") == self._run_id and record.get("pid") != pid:
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _write_prometheus(self, records: List[Dict[str, Any]]) -> None:
+        metrics: Dict[str, Tuple[str, List[str]]] = {
+            "kedro_node_wall_seconds": ("Temps réel du node", []),
+            "kedro_node_cpu_seconds": ("Temps CPU du processus pendant le node", []),
+            "kedro_node_peak_rss_bytes": ("Pic de RSS du processus à la fin du node", []),
+            "kedro_node_peak_rss_increase_bytes": ("Augmentation du pic de RSS pendant le node", []),
+            "kedro_node_tracemalloc_peak_increase_bytes": ("Pic d'allocations Python pendant le node", []),
+            "kedro_dataset_seconds": ("Durée de chargement ou de sauvegarde du dataset", []),
+            "kedro_dataset_file_bytes": ("Taille sur disque du dataset", []),
+            "kedro_dataset_memory_bytes": ("Taille en mémoire des données chargées ou sauvegardées", []),
+            "kedro_dataset_directory_bytes": ("Taille sur disque du dataset répertoire en fin de run", []),
+            "kedro_run_wall_seconds": ("Durée totale du run", []),
+            "kedro_run_peak_rss_bytes": ("Pic de RSS des processus du run", []),
+            "kedro_run_children_peak_rss_bytes": ("Plus grand pic de RSS des sous-processus des nodes", []),
+            "kedro_run_memory_budget_bytes": ("Budget de pic de RSS (memory.budget_mb)", []),
+            "kedro_run_success": ("1 si le run a réussi", []),
+            "kedro_run_timestamp_seconds": ("Fin du run (epoch)", []),
+        }
+
+        def add(name: str, labels: Dict[str, str], value: Any) -> None:
+            if value is None:
+                return
+            label_text = ",".join(f'{key}="{_label(str(val))}"' for key, val in labels.items())
+            metrics[name][1].append(f"{name}{{{label_text}}} {float(value)}")
+
+        for record in records:
+            if record["event"] == "node":
+                labels = {"node": record["node"], "status": record["status"]}
+                add("kedro_node_wall_seconds", labels, record["wall_seconds"])
+                add("kedro_node_cpu_seconds", labels, record["cpu_seconds"])
+                add("kedro_node_peak_rss_bytes", labels, record["peak_rss_bytes"])
+                add("kedro_node_peak_rss_increase_bytes", labels, record["peak_rss_increase_bytes"])
+                add("kedro_node_tracemalloc_peak_increase_bytes", labels,
+                    record.get("tracemalloc_peak_increase_bytes"))
+            elif record["event"] == "dataset":
+                labels = {"dataset": record["dataset"], "operation": record["operation"], "node": record["node"] or ""}
+                add("kedro_dataset_seconds", labels, record["seconds"])
+                add("kedro_dataset_file_bytes", labels, record["file_bytes"])
+                add("kedro_dataset_memory_bytes", labels, record["memory_bytes"])
+            elif record["event"] == "dataset_size":
+                add("kedro_dataset_directory_bytes", {"dataset": record["dataset"]}, record["file_bytes"])
+            elif record["event"] == "run_end":
+                labels = {"run_id": record["run_id"]}
+                add("kedro_run_wall_seconds", labels, record["wall_seconds"])
+                add("kedro_run_peak_rss_bytes", labels, record["peak_rss_bytes"])
+                add("kedro_run_children_peak_rss_bytes", labels, record.get("children_peak_rss_bytes"))
+                add("kedro_run_memory_budget_bytes", labels, record.get("memory_budget_bytes"))
+                add("kedro_run_success", labels, int(record["success"]))
+                add("kedro_run_timestamp_seconds", labels, record["timestamp"])
+
+        lines = []
+        for name, (help_text, samples) in metrics.items():
+            if samples:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", *samples]
+        tmp_path = self.prometheus_path.with_suffix(".prom.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        # Remplacement atomique : le collecteur ne lit jamais un fichier partiel
+        os.replace(tmp_path, self.prometheus_path)
+
+
+class ParallelRunnerGuardHooks:
+    """
+    Refuse un ``ParallelRunner`` quand des nodes échangent un ``MemoryDataset`` déclaré.
+
+    Les processus d'un ``ParallelRunner`` ne partagent pas les
+    ``MemoryDataset`` déclarés dans le catalogue : un node y lirait le
+    contenu vide du processus où il s'exécute. Le run est arrêté avant le
+    premier node, avec la liste des datasets à persister (ou à ne pas
+    déclarer, pour que le runner les partage lui-même). Sans
+    ``ParallelRunner``, le hook n'a aucun effet.
+    """
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any], pipeline, catalog) -> None:
+        if "ParallelRunner" not in str(run_params.get("runner") or ""):
+            return
+        declared = []
+        for name in sorted(pipeline.all_inputs() & pipeline.all_outputs()):
+            try:
+                dataset = catalog[name]
+            except Exception:  # noqa: BLE001 - dataset non déclaré : partagé par le runner
+                continue
+            if type(dataset).__name__ == "MemoryDataset":
+                declared.append(name)
+        if declared:
+            raise ValueError(
+                f"MemoryDataset déclarés, non partagés entre les processus du ParallelRunner : "
+                f"{', '.join(declared)}. Utiliser --runner ThreadRunner"
+            )
@@ -12,5 +12,6 @@ def register_pipelines() -> dict[str, Pipeline]:
         A mapping from pipeline names to ``Pipeline`` objects.
     """
     pipelines = find_pipelines()
-    pipelines["__default__"] = sum(pipelines.values())
+    # Les autres pipelines (incrémental...) se lancent avec --pipeline
+    pipelines["__default__"] = pipelines["data_processing"]
     return pipelines
@@ -0,0 +1,5 @@
+"""Pipeline de scoring par lots avec le modèle sauvegardé."""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
@@ -0,0 +1,149 @@
+"""Nodes pour le scoring par lots de grands fichiers avec le modèle sauvegardé.
+
+pandas et le moteur de nettoyage ne sont importés qu'à l'exécution du node.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from ..data_processing.cleaning import ColumnSpec
+
+# Modèle chargé une fois par worker
+_WORKER_MODEL = None
+
+
+def _init_worker(model: Any) -> None:
+    global _WORKER_MODEL
+    _WORKER_MODEL = model
+
+
+def _predict_in_worker(X: np.ndarray) -> np.ndarray:
+    return _WORKER_MODEL.predict(X)
+
+
+class ScoredChunks:
+    """
+    Prédictions produites bloc par bloc, à la demande du dataset de sortie.
+
+    Les blocs sont nettoyés dans le processus principal puis prédits dans un
+    pool de workers ; au plus ``max_in_flight`` blocs sont en cours à la fois,
+    ce qui borne la mémoire. L'ordre des blocs d'entrée est conservé.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        model: Any,
+        prepare: Any,
+        features: List[str],
+        prediction_column: str,
+        n_workers: int,
+        max_in_flight: int,
+    ):
+        self._chunks = chunks
+        self._model = model
+        self._prepare = prepare
+        self._features = features
+        self._prediction_column = prediction_column
+        self._n_workers = n_workers
+        self._max_in_flight = max_in_flight
+
+    def _with_predictions(self, chunk: pd.DataFrame, predictions: np.ndarray) -> pd.DataFrame:
+        chunk[self._prediction_column] = predictions
+        return chunk
+
+    def _score_inline(self) -> Iterator[pd.DataFrame]:
+        for chunk in self._chunks:
+            chunk = self._prepare(chunk)
+            yield self._with_predictions(chunk, self._model.predict(chunk[self._features].to_numpy()))
+
+    def _score_in_pool(self) -> Iterator[pd.DataFrame]:
+        with ProcessPoolExecutor(
+            max_workers=self._n_workers, initializer=_init_worker, initargs=(self._model,)
+        ) as pool:
+            pending = deque()
+            for chunk in self._chunks:
+                chunk = self._prepare(chunk)
+                pending.append((chunk, pool.submit(_predict_in_worker, chunk[self._features].to_numpy())))
+                if len(pending) >= self._max_in_flight:
+                    done_chunk, future = pending.popleft()
+                    yield self._with_predictions(done_chunk, future.result())
+            while pending:
+                done_chunk, future = pending.popleft()
+                yield self._with_predictions(done_chunk, future.result())
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        start = time.perf_counter()
+        n_rows = 0
+        scored = self._score_inline() if self._n_workers <= 1 else self._score_in_pool()
+        for chunk in scored:
+            n_rows += len(chunk)
+            yield chunk
+        elapsed = time.perf_counter() - start
+        print(f"\nPrédictions écrites : {n_rows} lignes en {elapsed:.2f} s "
+              f"({n_rows / elapsed if elapsed > 0 else float('nan'):,.0f} lignes/s, {self._n_workers} workers)")
+
+
+def _feature_specs(cleaning: Dict[str, Any], features: List[str]) -> List[ColumnSpec]:
+    from ..data_processing.cleaning import parse_schema
+
+    return [spec for spec in parse_schema(cleaning) if spec.name in features]
+
+
+def score_weather_data(
+    data: Iterable[pd.DataFrame],
+    model: Any,
+    cleaning_report: Dict[str, Any],
+    cleaning: Dict[str, Any],
+    training: Dict[str, Any],
+    batch_inference: Dict[str, Any],
+) -> ScoredChunks:
+    """
+    Scorer un grand fichier par blocs avec le modèle sauvegardé.
+
+    Chaque bloc est nettoyé avec le schéma de nettoyage et les valeurs
+    d'imputation de l'entraînement (``cleaning_report``), puis prédit par un
+    pool de workers. Les prédictions sont écrites au fur et à mesure par le
+    dataset de sortie, et le débit (lignes/s) est affiché à la fin.
+
+    Args:
+        data: Données à scorer, lues par blocs
+        model: Chaîne prétraitement + modèle sauvegardée
+        cleaning_report: Rapport de nettoyage de l'entraînement
+        cleaning: Schéma de nettoyage (paramètres ``cleaning``)
+        training: Paramètres ``training`` (features)
+        batch_inference: Paramètres ``batch_inference``
+
+    Returns:
+        Blocs de données complétés par la colonne de prédiction
+    """
+    import pandas as pd
+
+    from ..data_processing.cleaning import clean_chunk
+
+    features = training['features']
+    specs = _feature_specs(cleaning, features)
+    fill_values = {spec.name: cleaning_report['columns'][spec.name]['fill_value'] for spec in specs}
+    n_workers: Optional[int] = batch_inference.get('n_workers')
+    n_workers = n_workers or os.cpu_count() or 1
+
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    return ScoredChunks(
+        chunks,
+        model,
+        partial(clean_chunk, specs=specs, fill_values=fill_values),
+        features,
+        batch_inference.get('prediction_column', 'predicted_temperature'),
+        n_workers,
+        max(1, n_workers * batch_inference.get('max_in_flight_per_worker', 2)),
+    )
@@ -0,0 +1,33 @@
+"""Pipeline de scoring par lots avec le modèle sauvegardé."""
+
+from kedro.pipeline import Pipeline, node
+from .nodes import score_weather_data
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Créer le pipeline de scoring par lots.
+    
+    À lancer avec ``kedro run --pipeline batch_inference``.
+    
+    Returns:
+        Pipeline Kedro complet
+    """
+    return Pipeline(
+        [
+            # Node 1: Nettoyer et scorer les données bloc par bloc
+            node(
+                func=score_weather_data,
+                inputs=[
+                    "batch_inference_input",
+                    "trained_model",
+                    "cleaning_report",
+                    "params:cleaning",
+                    "params:training",
+                    "params:batch_inference",
+                ],
+                outputs="batch_predictions",
+                name="score_weather_data_node",
+            ),
+        ]
+    )
@@ -0,0 +1,318 @@
+"""Moteur de nettoyage piloté par un schéma de colonnes.
+
+Le schéma (``parameters.yml``, clé ``cleaning``) décrit pour chaque colonne
+le dtype, les valeurs sentinelles, la stratégie d'imputation et la plage de
+valeurs valides. Chaque colonne est convertie, comptée, bornée et imputée
+dans un seul buffer NumPy, sans copie complète du DataFrame : ajouter une
+colonne météo ne demande qu'une entrée de configuration.
+"""
+
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SENTINELS = ("N/A", "missing", "unknown")
+IMPUTE_STRATEGIES = ("mean", "constant", "none")
+
+_COUNTERS = ("sentinels", "invalid", "missing", "clipped")
+# Clé de ``DataFrame.attrs`` : valeurs non numériques rendues nulles au chargement
+# (``ArrowCSVDataset``), comptées par valeur : {colonne: {valeur: nombre}}
+RAW_TOKENS_ATTR = "raw_non_numeric_tokens"
+# Taille des tranches converties en liste Python pour la somme exacte
+_EXACT_SUM_SLICE = 1 << 20
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Règles de nettoyage d'une colonne."""
+
+    name: str
+    dtype: np.dtype
+    sentinels: Tuple[str, ...]
+    impute: str
+    fill_value: Optional[float]
+    valid_range: Tuple[float, float]
+
+
+def parse_schema(params: Dict[str, Any]) -> List[ColumnSpec]:
+    """
+    Construire les règles de nettoyage à partir des paramètres.
+
+    Args:
+        params: Paramètres ``cleaning`` (``sentinels`` par défaut et ``columns``)
+
+    Returns:
+        Liste des règles, dans l'ordre de déclaration
+    """
+    default_sentinels = tuple(params.get("sentinels", DEFAULT_SENTINELS))
+    specs = []
+    for name, column in params["columns"].items():
+        column = column or {}
+        impute = column.get("impute", "mean")
+        if impute not in IMPUTE_STRATEGIES:
+            raise ValueError(
+                f"Stratégie d'imputation inconnue pour '{name}' : '{impute}' "
+                f"(attendu : {', '.join(IMPUTE_STRATEGIES)})"
+            )
+        if impute == "constant" and column.get("fill_value") is None:
+            raise ValueError(f"'fill_value' est requis pour l'imputation constante de '{name}'")
+        dtype = np.dtype(column.get("dtype", "float64"))
+        if dtype.kind != "f":
+            raise ValueError(f"'{name}' doit avoir un dtype flottant pour représenter les manquants, reçu '{dtype}'")
+        low, high = column.get("valid_range") or (None, None)
+        specs.append(
+            ColumnSpec(
+                name=name,
+                dtype=dtype,
+                sentinels=tuple(column.get("sentinels", default_sentinels)),
+                impute=impute,
+                fill_value=column.get("fill_value"),
+                valid_range=(-np.inf if low is None else low, np.inf if high is None else high),
+            )
+        )
+    return specs
+
+
+def _exact_sum(values: np.ndarray) -> Fraction:
+    """
+    Somme exacte d'un tableau de flottants finis.
+
+    ``math.fsum`` renvoie l'arrondi correct de la somme ; on y réinjecte
+    l'opposé de chaque somme partielle jusqu'à ce que le reste soit nul, ce qui
+    donne la valeur exacte quel que soit le découpage en blocs.
+    """
+    terms = values.tolist()
+    total = Fraction(0)
+    while terms:
+        partial = math.fsum(terms)
+        if partial == 0.0:
+            break
+        total += Fraction(partial)
+        terms.append(-partial)
+    return total
+
+
+class RunningMean:
+    """Moyenne cumulée (somme exacte + effectif) alimentée bloc par bloc."""
+
+    def __init__(self):
+        self.total = Fraction(0)
+        self.count = 0
+        self.non_finite = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.non_finite += float(values[~finite].sum())
+            values = values[finite]
+        for start in range(0, len(values), _EXACT_SUM_SLICE):
+            self.total += _exact_sum(values[start:start + _EXACT_SUM_SLICE])
+        self.count += len(values)
+
+    def merge(self, other: "RunningMean") -> None:
+        self.total += other.total
+        self.count += other.count
+        self.non_finite += other.non_finite
+
+    def mean(self) -> float:
+        if self.non_finite != 0.0:
+            return self.non_finite
+        if self.count == 0:
+            return np.nan
+        return float(self.total / self.count)
+
+
+class CleaningSummary:
+    """Compteurs et moyennes cumulés sur un ou plusieurs blocs."""
+
+    def __init__(self, specs: List[ColumnSpec]):
+        self.specs = specs
+        self.n_rows = 0
+        self.counts = {spec.name: dict.fromkeys(_COUNTERS, 0) for spec in specs}
+        self.means = {spec.name: RunningMean() for spec in specs}
+
+    def merge(self, other: "CleaningSummary") -> "CleaningSummary":
+        """Fusionner les compteurs et moyennes d'autres blocs (même schéma)."""
+        self.n_rows += other.n_rows
+        for spec in self.specs:
+            for key, value in other.counts[spec.name].items():
+                self.counts[spec.name][key] += value
+            self.means[spec.name].merge(other.means[spec.name])
+        return self
+
+    def fill_values(self) -> Dict[str, float]:
+        """Valeur d'imputation de chaque colonne (NaN : pas d'imputation)."""
+        values = {}
+        for spec in self.specs:
+            if spec.impute == "mean":
+                values[spec.name] = self.means[spec.name].mean()
+            elif spec.impute == "constant":
+                values[spec.name] = float(spec.fill_value)
+            else:
+                values[spec.name] = np.nan
+        return values
+
+    def report(self) -> Dict[str, Any]:
+        """Rapport structuré des valeurs manquantes, sérialisable en JSON."""
+        fill_values = self.fill_values()
+        columns = {}
+        for spec in self.specs:
+            counts = self.counts[spec.name]
+            imputed = 0 if np.isnan(fill_values[spec.name]) else counts["missing"]
+            columns[spec.name] = {
+                **{key: int(value) for key, value in counts.items()},
+                "imputed": int(imputed),
+                "missing_after": int(counts["missing"] - imputed),
+                "impute": spec.impute,
+                "fill_value": float(fill_values[spec.name]),
+            }
+        return {"n_rows": int(self.n_rows), "columns": columns}
+
+
+def coerce_column(series: pd.Series, spec: ColumnSpec) -> Tuple[np.ndarray, Optional[np.ndarray], int]:
+    """
+    Convertir une colonne dans un buffer neuf du dtype du schéma.
+
+    Args:
+        series: Colonne brute
+        spec: Règles de la colonne
+
+    Returns:
+        Buffer converti (manquants, sentinelles et valeurs non numériques à
+        NaN), masque des sentinelles (``None`` si la colonne est déjà
+        numérique) et nombre de valeurs non numériques hors sentinelles
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=spec.dtype, copy=True), None, 0
+    is_sentinel = series.isin(spec.sentinels).to_numpy()
+    was_null = series.isna().to_numpy()
+    # Les sentinelles ne sont pas numériques : la conversion les rend déjà NaN
+    buffer = pd.to_numeric(series, errors="coerce").to_numpy(dtype=spec.dtype)
+    if not buffer.flags.writeable:
+        buffer = buffer.copy()
+    n_invalid = int((np.isnan(buffer) & ~is_sentinel & ~was_null).sum())
+    return buffer, is_sentinel, n_invalid
+
+
+def raw_token_counts(frame: pd.DataFrame, spec: ColumnSpec) -> Tuple[Dict[str, int], int]:
+    """
+    Sentinelles (par valeur) et nombre de valeurs invalides déjà rendues nulles au chargement.
+
+    Returns:
+        Comptes par sentinelle de la colonne et nombre d'autres valeurs non
+        numériques (vides si le DataFrame ne vient pas d'``ArrowCSVDataset``)
+    """
+    tokens = frame.attrs.get(RAW_TOKENS_ATTR, {}).get(spec.name, {})
+    sentinels = {token: count for token, count in tokens.items() if token in spec.sentinels}
+    return sentinels, sum(tokens.values()) - sum(sentinels.values())
+
+
+def _coerce_and_clip(chunk: pd.DataFrame, spec: ColumnSpec, summary: Optional[CleaningSummary]) -> np.ndarray:
+    """
+    Convertir une colonne dans son propre buffer, compter et borner ses valeurs.
+
+    Le buffer renvoyé est neuf : la colonne d'origine n'est jamais modifiée.
+    """
+    buffer, is_sentinel, n_invalid = coerce_column(chunk[spec.name], spec)
+    n_sentinels = 0 if is_sentinel is None else int(is_sentinel.sum())
+    loaded_sentinels, loaded_invalid = raw_token_counts(chunk, spec)
+    n_sentinels += sum(loaded_sentinels.values())
+    n_invalid += loaded_invalid
+
+    low, high = spec.valid_range
+    if summary is not None:
+        counts = summary.counts[spec.name]
+        counts["sentinels"] += n_sentinels
+        counts["invalid"] += n_invalid
+        counts["missing"] += int(np.isnan(buffer).sum())
+        counts["clipped"] += int(np.count_nonzero((buffer < low) | (buffer > high)))
+    np.clip(buffer, low, high, out=buffer)
+    if summary is not None and spec.impute == "mean":
+        summary.means[spec.name].update(buffer)
+    return buffer
+
+
+def _impute(buffer: np.ndarray, fill_value: float) -> np.ndarray:
+    if not np.isnan(fill_value):
+        buffer[np.isnan(buffer)] = fill_value
+    return buffer
+
+
+def _with_columns(chunk: pd.DataFrame, buffers: Dict[str, np.ndarray]) -> pd.DataFrame:
+    # Copie superficielle : seules les colonnes du schéma sont remplacées
+    cleaned = chunk.copy(deep=False)
+    # Comptes du chargement déjà pris en compte : ne pas les recompter en aval
+    cleaned.attrs.pop(RAW_TOKENS_ATTR, None)
+    for name, buffer in buffers.items():
+        cleaned[name] = buffer
+    return cleaned
+
+
+def clip_frame(df: pd.DataFrame, specs: List[ColumnSpec]) -> Tuple[pd.DataFrame, CleaningSummary]:
+    """
+    Convertir et borner un DataFrame, sans imputation.
+
+    Les manquants restent à NaN : les valeurs d'imputation peuvent alors être
+    calculées plus tard, en fusionnant les résumés de plusieurs DataFrames
+    (par exemple des partitions nettoyées séparément).
+
+    Args:
+        df: DataFrame brut
+        specs: Règles de nettoyage
+
+    Returns:
+        DataFrame converti et borné, et résumé (compteurs et moyennes)
+    """
+    buffers, summary = _clip_buffers(df, specs)
+    return _with_columns(df, buffers), summary
+
+
+def _clip_buffers(df: pd.DataFrame, specs: List[ColumnSpec]) -> Tuple[Dict[str, np.ndarray], CleaningSummary]:
+    summary = CleaningSummary(specs)
+    summary.n_rows = len(df)
+    return {spec.name: _coerce_and_clip(df, spec, summary) for spec in specs}, summary
+
+
+def impute_frame(df: pd.DataFrame, fill_values: Dict[str, float]) -> pd.DataFrame:
+    """Imputer un DataFrame déjà converti et borné (colonnes ``fill_values`` copiées, les autres partagées)."""
+    buffers = {name: _impute(df[name].to_numpy(copy=True), value) for name, value in fill_values.items()}
+    return _with_columns(df, buffers)
+
+
+def clean_frame(df: pd.DataFrame, specs: List[ColumnSpec]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Nettoyer un DataFrame en mémoire.
+
+    Args:
+        df: DataFrame brut
+        specs: Règles de nettoyage
+
+    Returns:
+        DataFrame nettoyé et rapport des valeurs manquantes
+    """
+    buffers, summary = _clip_buffers(df, specs)
+    fill_values = summary.fill_values()
+    for name, buffer in buffers.items():
+        _impute(buffer, fill_values[name])
+    return _with_columns(df, buffers), summary.report()
+
+
+def summarise_chunks(chunks: Iterable[pd.DataFrame], specs: List[ColumnSpec]) -> CleaningSummary:
+    """Première passe du mode streaming : compteurs et moyennes, bloc par bloc."""
+    summary = CleaningSummary(specs)
+    for chunk in chunks:
+        summary.n_rows += len(chunk)
+        for spec in specs:
+            _coerce_and_clip(chunk, spec, summary)
+    return summary
+
+
+def clean_chunk(chunk: pd.DataFrame, specs: List[ColumnSpec], fill_values: Dict[str, float]) -> pd.DataFrame:
+    """Seconde passe du mode streaming : nettoyer un bloc avec des valeurs d'imputation connues."""
+    buffers = {spec.name: _impute(_coerce_and_clip(chunk, spec, None), fill_values[spec.name]) for spec in specs}
+    return _with_columns(chunk, buffers)
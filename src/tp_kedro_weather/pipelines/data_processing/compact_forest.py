@@ -0,0 +1,155 @@
+"""Représentation compacte d'une forêt d'arbres de régression.
+
+Les arbres d'un ``RandomForestRegressor`` entraîné sont aplatis en quelques
+tableaux NumPy contigus (feature, seuil, enfants, valeur), enregistrables en
+``.npy`` et projetables en mémoire : le chargement ne désérialise aucun
+objet Python et l'évaluation parcourt tous les arbres d'un lot à la fois.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Tableaux par nœud, tous les arbres mis bout à bout
+_NODE_ARRAYS = ("feature", "threshold", "left", "right", "value", "missing_left")
+# Nombre maximum de couples (arbre, ligne) évalués à la fois
+_MAX_WALK_SIZE = 1 << 22
+
+
+def forest_of(model: Any) -> Optional[Any]:
+    """Forêt à exporter : l'estimateur lui-même, ou l'unique étape d'un ``Pipeline``."""
+    from sklearn.pipeline import Pipeline
+
+    if isinstance(model, Pipeline):
+        if len(model.steps) != 1:
+            return None  # transformation en amont : non prise en charge
+        model = model.steps[-1][1]
+    if hasattr(model, "estimators_") and all(hasattr(tree, "tree_") for tree in model.estimators_):
+        return model
+    return None
+
+
+class CompactForest:
+    """
+    Forêt de régression stockée en tableaux plats.
+
+    Les feuilles bouclent sur elles-mêmes (``left == right == nœud``), ce
+    qui permet de faire descendre toutes les lignes de tous les arbres le
+    même nombre de pas (la profondeur maximale) sans branchement.
+
+    Les prédictions sont identiques à ``RandomForestRegressor.predict`` avec
+    ``n_jobs=1`` : X est converti en float32 comme le fait scikit-learn,
+    comparé avec ``<=`` aux seuils float64, et les valeurs des arbres sont
+    sommées dans l'ordre des arbres puis divisées par leur nombre. Avec
+    ``n_jobs`` > 1 (candidat ``random_forest`` : ``n_jobs: -1``), scikit-learn
+    somme les arbres dans l'ordre de fin des threads, ce qui peut décaler le
+    résultat de quelques ulp : la référence exacte est
+    ``forest.set_params(n_jobs=1).predict(X)``.
+    """
+
+    def __init__(self, arrays: Dict[str, Any]):
+        missing = [name for name in _NODE_ARRAYS + ("roots",) if name not in arrays]
+        if missing:
+            raise ValueError(f"Forêt compacte incomplète (modèle exporté : {arrays.get('model_type')}), "
+                             f"tableaux manquants : {missing}")
+        for name in _NODE_ARRAYS + ("roots",):
+            setattr(self, name, arrays[name])
+        self.n_features = int(arrays["n_features"])
+        self.max_depth = int(arrays["max_depth"])
+        self.n_estimators = len(self.roots)
+
+    @classmethod
+    def from_sklearn(cls, model: Any) -> "CompactForest":
+        """Aplatir les arbres d'une forêt entraînée (ou d'un ``Pipeline`` qui ne contient qu'elle)."""
+        forest = forest_of(model)
+        if forest is None:
+            raise ValueError(f"Modèle non pris en charge par la forêt compacte : {type(model).__name__}")
+        return cls(export_arrays(forest))
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """Tableaux et métadonnées à enregistrer."""
+        return {
+            **{name: getattr(self, name) for name in _NODE_ARRAYS + ("roots",)},
+            "model_type": "random_forest",
+            "n_features": self.n_features,
+            "max_depth": self.max_depth,
+        }
+
+    def predict(self, X: Any) -> np.ndarray:
+        """
+        Prédire un lot de lignes.
+
+        Args:
+            X: Matrice ``(n, n_features)``
+
+        Returns:
+            Prédictions en float64
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"X doit avoir la forme (n, {self.n_features}), reçu {X.shape}")
+        block = max(1, _MAX_WALK_SIZE // max(self.n_estimators, 1))
+        out = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), block):
+            out[start:start + block] = self._predict_block(X[start:start + block])
+        return out
+
+    def _predict_block(self, X: np.ndarray) -> np.ndarray:
+        n_rows = len(X)
+        flat_X = X.ravel()
+        # Un nœud courant par couple (arbre, ligne), arbre par arbre
+        nodes = np.repeat(self.roots, n_rows)
+        row_offsets = np.tile(np.arange(n_rows, dtype=np.int64) * self.n_features, self.n_estimators)
+        for _ in range(self.max_depth):
+            x = flat_X[row_offsets + self.feature[nodes]]
+            go_left = np.where(np.isnan(x), self.missing_left[nodes], x <= self.threshold[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        values = self.value[nodes].reshape(self.n_estimators, n_rows)
+        total = np.zeros(n_rows, dtype=np.float64)
+        for tree_values in values:
+            total += tree_values
+        total /= self.n_estimators
+        return total
+
+
+def export_arrays(forest: Any) -> Dict[str, Any]:
+    """
+    Aplatir les ``tree_`` d'une forêt en tableaux contigus.
+
+    Args:
+        forest: ``RandomForestRegressor`` (ou forêt de la même forme) entraîné
+
+    Returns:
+        Tableaux par nœud, indices des racines et métadonnées
+    """
+    trees = [estimator.tree_ for estimator in forest.estimators_]
+    sizes = np.array([tree.node_count for tree in trees], dtype=np.int64)
+    roots = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32)
+
+    feature, threshold, left, right, value, missing_left = [], [], [], [], [], []
+    for root, tree in zip(roots, trees):
+        own = np.arange(tree.node_count, dtype=np.int32) + root
+        leaf = tree.children_left < 0
+        feature.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+        threshold.append(tree.threshold.astype(np.float64))
+        left.append(np.where(leaf, own, tree.children_left + root).astype(np.int32))
+        right.append(np.where(leaf, own, tree.children_right + root).astype(np.int32))
+        value.append(tree.value[:, 0, 0].astype(np.float64))
+        # Valeurs manquantes (scikit-learn >= 1.3) : direction apprise par nœud
+        missing = getattr(tree, "missing_go_to_left", None)
+        missing_left.append(np.zeros(tree.node_count, dtype=bool) if missing is None else missing.astype(bool))
+
+    return {
+        "feature": np.concatenate(feature),
+        "threshold": np.concatenate(threshold),
+        "left": np.concatenate(left),
+        "right": np.concatenate(right),
+        "value": np.concatenate(value),
+        "missing_left": np.concatenate(missing_left),
+        "roots": roots,
+        "model_type": "random_forest",
+        "n_features": int(forest.n_features_in_),
+        "max_depth": int(max(tree.max_depth for tree in trees)),
+    }
+
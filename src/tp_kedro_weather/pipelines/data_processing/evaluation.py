@@ -0,0 +1,180 @@
+"""Évaluation des candidats par validation croisée k-fold.
+
+Les plis sont calculés une seule fois et partagés par tous les candidats (et
+par la recherche d'hyperparamètres). L'expansion polynomiale ne dépend que
+du nombre de features : elle est calculée une fois par degré sur tout le jeu
+d'entraînement, puis chaque pli en sélectionne les lignes. Les couples
+(candidat, pli) sont ajustés en parallèle ; chaque worker écrit ses
+prédictions hors pli directement dans une matrice partagée
+``(candidats, lignes)``, conservée avec les résultats. Toutes les métriques
+(globales et par pli) sont ensuite calculées en une passe vectorisée sur la
+matrice des résidus.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.preprocessing import PolynomialFeatures
+
+from .models import CandidateSpec, load_shared, resolve_estimator, shared_arrays
+
+Folds = List[Tuple[np.ndarray, np.ndarray]]
+
+
+def make_folds(n_rows: int, n_splits: int, seed: int) -> Folds:
+    """
+    Indices (train, validation) de ``n_splits`` plis, lignes mélangées une fois.
+
+    Args:
+        n_rows: Nombre de lignes d'entraînement
+        n_splits: Nombre de plis (au moins 2)
+        seed: Graine du mélange
+
+    Returns:
+        Couples d'indices triés, un par pli
+    """
+    if n_splits < 2 or n_splits > n_rows:
+        raise ValueError(f"Le nombre de plis doit être compris entre 2 et le nombre de lignes ({n_rows}), reçu {n_splits}")
+    order = np.random.default_rng(seed).permutation(n_rows)
+    folds = []
+    for validation in np.array_split(order, n_splits):
+        mask = np.ones(n_rows, dtype=bool)
+        mask[validation] = False
+        folds.append((np.flatnonzero(mask), np.sort(validation)))
+    return folds
+
+
+def single_threaded(spec: CandidateSpec, config: Optional[Dict[str, Any]] = None) -> CandidateSpec:
+    """Candidat à ajuster dans un worker : ``config`` appliquée, ``n_jobs`` ramené à 1 (le parallélisme vient du pool)."""
+    params = {**spec.params, **(config or {})}
+    if "n_jobs" in params:
+        params["n_jobs"] = 1
+    return replace(spec, params=params)
+
+
+def _fit_fold(spec: CandidateSpec, index: int, source: Any, fold: int) -> None:
+    """
+    Ajuster un candidat sur un pli et écrire ses prédictions hors pli.
+
+    ``source`` est le répertoire partagé (dans un worker) ou le dictionnaire
+    des tableaux (exécution séquentielle).
+    """
+    get = source.__getitem__ if isinstance(source, dict) else partial(load_shared, source)
+    X = get(f"X_poly{spec.poly_degree}" if spec.poly_degree else "X")
+    y, rows = get("y"), get("rows")
+    train, validation = get(f"train_{fold}"), get(f"validation_{fold}")
+    oof = source["oof"] if isinstance(source, dict) else load_shared(source, "oof", mode="r+")
+
+    model = resolve_estimator(spec.estimator)(**spec.params)
+    model.fit(X[rows[train]], y[rows[train]])
+    oof[index, validation] = model.predict(X[rows[validation]])
+    if not isinstance(source, dict):
+        oof.flush()
+
+
+def residual_metrics(predictions: np.ndarray, y: np.ndarray, folds: Folds) -> Dict[str, np.ndarray]:
+    """
+    R², MSE et MAE de chaque ligne de ``predictions``, globaux et par pli.
+
+    Les lignes sont réordonnées pli par pli ; les sommes par pli sont
+    obtenues par ``np.add.reduceat`` sur la même matrice de résidus.
+
+    Args:
+        predictions: Prédictions hors pli, ``(candidats, lignes)``
+        y: Cible
+        folds: Plis de validation croisée
+
+    Returns:
+        ``r2``, ``mse``, ``mae`` (prédictions hors pli regroupées) et
+        ``r2_std`` (écart-type du R² entre plis), un élément par candidat
+    """
+    order = np.concatenate([validation for _, validation in folds])
+    sizes = np.array([len(validation) for _, validation in folds])
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    y_ordered = y[order]
+    residuals = predictions[:, order] - y_ordered
+    squared = residuals * residuals
+    sse = squared.sum(axis=1)
+    n = len(order)
+
+    centered = y_ordered - y_ordered.mean()
+    sst = centered @ centered
+    fold_means = np.add.reduceat(y_ordered, offsets) / sizes
+    fold_centered = y_ordered - np.repeat(fold_means, sizes)
+    fold_sst = np.add.reduceat(fold_centered * fold_centered, offsets)
+    fold_sse = np.add.reduceat(squared, offsets, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Cible constante : R² vaut 1 si la prédiction est parfaite, 0 sinon (comme scikit-learn)
+        r2 = np.where(sst > 0, 1 - sse / sst, np.where(sse == 0, 1.0, 0.0))
+        fold_r2 = np.where(fold_sst > 0, 1 - fold_sse / fold_sst, np.where(fold_sse == 0, 1.0, 0.0))
+    return {
+        "r2": r2,
+        "mse": sse / n,
+        "mae": np.abs(residuals).sum(axis=1) / n,
+        "r2_std": fold_r2.std(axis=1),
+    }
+
+
+def cross_validate(
+    specs: List[CandidateSpec],
+    X: np.ndarray,
+    y: np.ndarray,
+    folds: Folds,
+    n_workers: Optional[int] = None,
+    rows: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    """
+    Évaluer tous les candidats par validation croisée.
+
+    Args:
+        specs: Candidats à évaluer
+        X: Features
+        y: Cible
+        folds: Plis partagés (``make_folds``), en positions dans ``rows``
+        n_workers: Nombre de processus (``None`` : nombre de cœurs)
+        rows: Lignes de ``X`` et ``y`` à utiliser (le jeu d'entraînement),
+            toutes par défaut ; évite d'en matérialiser une copie
+
+    Returns:
+        ``scores`` (R², MSE, MAE et écart-type du R² par candidat),
+        ``oof_predictions`` (matrice ``(candidats, len(rows))``) et ``candidates``
+        (noms, dans l'ordre des lignes de la matrice)
+    """
+    rows = np.arange(len(y)) if rows is None else np.asarray(rows)
+    arrays = {"X": X, "y": y, "rows": rows}
+    for degree in sorted({spec.poly_degree for spec in specs if spec.poly_degree}):
+        arrays[f"X_poly{degree}"] = PolynomialFeatures(degree=degree, include_bias=False).fit_transform(X)
+    for k, (train, validation) in enumerate(folds):
+        arrays[f"train_{k}"] = train
+        arrays[f"validation_{k}"] = validation
+    arrays["oof"] = np.zeros((len(specs), len(rows)), dtype=np.float64)
+
+    n_tasks = len(specs) * len(folds)
+    n_workers = min(n_workers or os.cpu_count() or 1, n_tasks)
+    tasks = [
+        (single_threaded(spec) if n_workers > 1 else spec, i, k)
+        for i, spec in enumerate(specs) for k in range(len(folds))
+    ]
+    if n_workers <= 1:
+        for spec, i, k in tasks:
+            _fit_fold(spec, i, arrays, k)
+        oof = arrays["oof"]
+    else:
+        with shared_arrays(arrays) as data_dir:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                for future in [pool.submit(_fit_fold, spec, i, data_dir, k) for spec, i, k in tasks]:
+                    future.result()
+            oof = np.array(load_shared(data_dir, "oof"))
+
+    metrics = residual_metrics(oof, y[rows], folds)
+    scores = {
+        spec.name: {name: float(values[i]) for name, values in metrics.items()}
+        for i, spec in enumerate(specs)
+    }
+    return {"scores": scores, "oof_predictions": oof, "candidates": [spec.name for spec in specs]}
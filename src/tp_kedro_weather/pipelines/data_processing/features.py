@@ -0,0 +1,188 @@
+"""Features temporelles (retards et fenêtres glissantes), calculées en bloc.
+
+Les lignes sont supposées dans l'ordre chronologique. Pour chaque colonne,
+toutes les features sont écrites dans une seule matrice préallouée, sans
+DataFrame intermédiaire par fenêtre :
+
+- retards : vues décalées de la colonne ;
+- moyennes glissantes : différences d'une seule somme cumulée par colonne
+  (en float64) ;
+- minimums et maximums glissants : algorithme de van Herk / Gil-Werman,
+  en O(lignes) quelle que soit la fenêtre, par ``ufunc.accumulate`` sur une
+  vue ``(blocs, fenêtre)`` de la colonne.
+
+Les premières lignes, dont l'historique ne couvre pas la plus grande
+fenêtre ou le plus grand retard, sont écartées. Le calcul d'une plage de
+lignes ne lit que ces lignes et l'historique qui les précède : une table
+déjà calculée peut être étendue aux lignes ajoutées sans rien recalculer.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+STATS = ("mean", "min", "max")
+
+
+def feature_names(params: Dict[str, Any]) -> List[str]:
+    """Noms des features produites, dans l'ordre des colonnes de la table."""
+    names = []
+    for column in params["columns"]:
+        names += [f"{column}_lag{lag}" for lag in params.get("lags", [])]
+        names += [f"{column}_{stat}{window}" for window in params.get("windows", []) for stat in params.get("stats", STATS)]
+    return names
+
+
+def history_rows(params: Dict[str, Any]) -> int:
+    """Lignes d'historique nécessaires avant la première ligne calculée."""
+    return max([*params.get("lags", []), *(window - 1 for window in params.get("windows", [])), 0])
+
+
+def _validate(params: Dict[str, Any]) -> None:
+    unknown = set(params.get("stats", STATS)) - set(STATS)
+    if unknown:
+        raise ValueError(f"Statistiques glissantes inconnues : {sorted(unknown)} (attendu : {', '.join(STATS)})")
+    if any(lag < 1 for lag in params.get("lags", [])) or any(window < 1 for window in params.get("windows", [])):
+        raise ValueError("Les retards et les fenêtres doivent être des entiers positifs")
+
+
+def sliding_extreme(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """
+    Minimum (``np.minimum``) ou maximum (``np.maximum``) de chaque fenêtre complète.
+
+    Returns:
+        Tableau de ``len(values) - window + 1`` valeurs, la ``i``-ème pour
+        ``values[i:i + window]``
+    """
+    n = len(values)
+    identity = np.inf if ufunc is np.minimum else -np.inf
+    padded = np.full(-(-n // window) * window, identity, dtype=values.dtype)
+    padded[:n] = values
+    blocks = padded.reshape(-1, window)
+    # Extrême depuis le début et jusqu'à la fin de chaque bloc
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[: n - window + 1], prefix[window - 1 : n])
+
+
+def window_features(columns: Dict[str, np.ndarray], params: Dict[str, Any], history: int) -> np.ndarray:
+    """
+    Calculer toutes les features des lignes qui suivent ``history`` lignes d'historique.
+
+    Args:
+        columns: Valeurs par colonne source (historique compris)
+        params: Paramètres ``feature_engineering``
+        history: Lignes d'historique en tête de chaque tableau (au moins ``history_rows``)
+
+    Returns:
+        Matrice ``(features, lignes calculées)`` dans l'ordre de
+        ``feature_names`` (chaque feature contiguë en mémoire)
+    """
+    lags = params.get("lags", [])
+    windows = params.get("windows", [])
+    stats = params.get("stats", STATS)
+    n = len(next(iter(columns.values()))) - history
+    dtype = np.result_type(*(values.dtype for values in columns.values()), np.float32)
+    out = np.empty((len(feature_names(params)), n), dtype=dtype)
+
+    j = 0
+    for name in params["columns"]:
+        x = columns[name]
+        for lag in lags:
+            out[j] = x[history - lag : history - lag + n]
+            j += 1
+        cumulative = np.concatenate([[0.0], np.cumsum(x, dtype=np.float64)]) if "mean" in stats else None
+        for window in windows:
+            # Fenêtres complètes se terminant sur chaque ligne calculée
+            tail = x[history - window + 1 :]
+            for stat in stats:
+                if stat == "mean":
+                    end = cumulative[history + 1 : history + 1 + n]
+                    out[j] = (end - cumulative[history + 1 - window : history + 1 - window + n]) / window
+                else:
+                    out[j] = sliding_extreme(tail, window, np.minimum if stat == "min" else np.maximum)
+                j += 1
+    return out
+
+
+def config_key(params: Dict[str, Any]) -> str:
+    """Empreinte de la configuration : si elle change, la table est recalculée."""
+    keys = ("columns", "lags", "windows", "stats")
+    config = {key: params.get(key, STATS if key == "stats" else []) for key in keys}
+    return hashlib.blake2b(json.dumps(config, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _digests(df: pd.DataFrame, prefix_rows: int) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Empreintes de chaque colonne sur ses ``prefix_rows`` premières lignes, puis sur toutes."""
+    prefix, full = {}, {}
+    for name in df.columns:
+        values = np.ascontiguousarray(df[name].to_numpy())
+        hasher = hashlib.blake2b(str(values.dtype).encode(), digest_size=16)
+        hasher.update(values[:prefix_rows].view(np.uint8))
+        prefix[name] = hasher.hexdigest()
+        hasher.update(values[prefix_rows:].view(np.uint8))
+        full[name] = hasher.hexdigest()
+    return prefix, full
+
+
+def build_feature_table(
+    df: pd.DataFrame,
+    params: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any], int]:
+    """
+    Construire la table de features, en réutilisant une table précédente si possible.
+
+    La table précédente est réutilisée si la configuration est la même et
+    si les lignes sources qu'elle couvre n'ont pas changé (empreinte) ;
+    seules les lignes ajoutées depuis sont alors calculées.
+
+    Args:
+        df: Données nettoyées, dans l'ordre chronologique
+        params: Paramètres ``feature_engineering``
+        previous: Table enregistrée (``FeatureStoreDataset``), ``None`` au premier run
+
+    Returns:
+        Table complète (colonnes sources puis features, lignes à partir de
+        ``history_rows``), métadonnées et indice de la première ligne nouvelle
+    """
+    _validate(params)
+    history = history_rows(params)
+    key = config_key(params)
+    n_rows = len(df)
+    if n_rows <= history:
+        raise ValueError(f"Pas assez de lignes ({n_rows}) pour {history} lignes d'historique")
+
+    meta = previous["meta"] if previous else {}
+    covered = int(meta.get("n_source_rows", 0))
+    reusable = (
+        bool(previous)
+        and meta.get("config") == key
+        and meta.get("columns") == list(df.columns)
+        and covered <= n_rows
+    )
+    prefix, full = _digests(df, covered if reusable else 0)
+    reusable = reusable and prefix == meta.get("digests")
+
+    first = max(covered, history) if reusable else history
+    new_rows = n_rows - first
+    if new_rows:
+        values = {name: df[name].to_numpy()[first - history :] for name in params["columns"]}
+        features = window_features(values, params, history)
+        data = {name: df[name].to_numpy()[first:] for name in df.columns}
+        data.update(zip(feature_names(params), features))
+        new = pd.DataFrame(data, copy=False)
+    else:
+        new = None
+
+    if reusable:
+        start = len(previous["table"])
+        table = previous["table"] if new is None else pd.concat([previous["table"], new], ignore_index=True)
+    else:
+        start = 0
+        table = new
+    meta = {"config": key, "columns": list(df.columns), "n_source_rows": n_rows, "digests": full, "history_rows": history}
+    return table, meta, start
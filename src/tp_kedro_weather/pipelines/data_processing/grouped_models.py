@@ -0,0 +1,346 @@
+"""Entraînement d'un modèle par groupe (station, région...).
+
+Les candidats de la famille linéaire (``LinearRegression``, ``Ridge``,
+``NormalEquationRegressor``, avec ou sans expansion polynomiale) sont
+ajustés pour tous les groupes à la fois : les moyennes et co-moments centrés
+de chaque groupe sont accumulés par ``np.bincount`` en quelques passes sur
+les données, puis les équations normales empilées ``(groupes, p, p)`` sont
+résolues en un seul appel vectorisé. Les autres candidats (forêts...) sont
+ajustés groupe par groupe, par lots de groupes répartis sur un pool de
+processus qui relisent les tableaux en mémoire partagée.
+
+Les métriques de test de chaque (groupe, candidat) sont elles aussi
+calculées par ``np.bincount`` sur les résidus et rendues sous forme de
+table colonnaire (une ligne par groupe et par candidat).
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import PolynomialFeatures
+
+from .evaluation import single_threaded
+from .models import CandidateSpec, load_shared, resolve_estimator, shared_arrays
+from .normal_equations import normal_equations_equivalent
+
+# Lots de groupes par worker : assez pour amortir les tâches, assez peu pour équilibrer
+_BATCHES_PER_WORKER = 4
+
+
+def _expand(X: np.ndarray, degree: Optional[int]) -> np.ndarray:
+    return PolynomialFeatures(degree=degree, include_bias=False).fit_transform(X) if degree else X
+
+
+def _group_sums(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Somme par groupe de chaque colonne de ``values`` (``(groupes, colonnes)``)."""
+    return np.stack([np.bincount(codes, values[:, j], n_groups) for j in range(values.shape[1])], axis=1)
+
+
+def fit_grouped_linear(
+    X: np.ndarray,
+    y: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int,
+    alpha: float = 0.0,
+    fit_intercept: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ajuster une régression linéaire ou Ridge par groupe, tous les groupes à la fois.
+
+    Même solution que ``LinearRegression`` / ``Ridge(alpha)`` ajustés
+    séparément sur chaque groupe (intercept non pénalisé, données centrées
+    par groupe). Un système singulier (groupe trop petit, feature constante)
+    reçoit la solution de norme minimale, comme ``LinearRegression``.
+
+    Args:
+        X: Features ``(lignes, p)``
+        y: Cible
+        codes: Groupe de chaque ligne, entre 0 et ``n_groups - 1``
+        n_groups: Nombre de groupes
+        alpha: Coefficient de régularisation L2
+        fit_intercept: Ajuster un intercept par groupe
+
+    Returns:
+        Coefficients ``(groupes, p)`` et intercepts ``(groupes,)``
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    p = X.shape[1]
+    if fit_intercept:
+        counts = np.maximum(np.bincount(codes, minlength=n_groups), 1)
+        x_mean = _group_sums(codes, X, n_groups) / counts[:, None]
+        y_mean = np.bincount(codes, y, n_groups) / counts
+        X = X - x_mean[codes]
+        y = y - y_mean[codes]
+    else:
+        x_mean = np.zeros((n_groups, p))
+        y_mean = np.zeros(n_groups)
+
+    # Co-moments (groupes, p, p) : une passe par couple de colonnes, mémoire en O(lignes)
+    xx = np.empty((n_groups, p, p))
+    for j in range(p):
+        for k in range(j, p):
+            xx[:, j, k] = xx[:, k, j] = np.bincount(codes, X[:, j] * X[:, k], n_groups)
+    xy = _group_sums(codes, X * y[:, None], n_groups)
+
+    a = xx + alpha * np.eye(p)
+    try:
+        coef = np.linalg.solve(a, xy[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # Au moins un système singulier : pseudo-inverse (norme minimale) pour tous
+        coef = (np.linalg.pinv(a, hermitian=True) @ xy[..., None])[..., 0]
+    return coef, y_mean - np.einsum("gp,gp->g", x_mean, coef)
+
+
+def grouped_metrics(y_true: np.ndarray, y_pred: np.ndarray, codes: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+    """
+    R², MSE et MAE de chaque groupe, en une passe vectorisée.
+
+    Mêmes conventions que ``regression_metrics`` ; NaN pour un groupe sans ligne.
+
+    Returns:
+        Tableaux ``n``, ``r2``, ``mse`` et ``mae`` de longueur ``n_groups``
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuals = np.asarray(y_pred, dtype=np.float64) - y_true
+    n = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(codes, y_true, n_groups) / n
+        centered = y_true - mean[codes]
+        sst = np.bincount(codes, centered * centered, n_groups)
+        sse = np.bincount(codes, residuals * residuals, n_groups)
+        r2 = np.where(sst > 0, 1 - sse / sst, (sse == 0).astype(np.float64))
+        return {
+            "n": n,
+            "r2": np.where(n > 0, r2, np.nan),
+            "mse": sse / n,
+            "mae": np.bincount(codes, np.abs(residuals), n_groups) / n,
+        }
+
+
+class GroupedLinearModel:
+    """Coefficients d'une régression linéaire ou Ridge par groupe (tableaux compacts)."""
+
+    def __init__(self, coef: np.ndarray, intercept: np.ndarray, poly_degree: Optional[int] = None):
+        self.coef = coef
+        self.intercept = intercept
+        self.poly_degree = poly_degree
+
+    def predict(self, X: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        X = np.asarray(_expand(X, self.poly_degree), dtype=np.float64)
+        return np.einsum("ip,ip->i", X, self.coef[codes]) + self.intercept[codes]
+
+
+class GroupedEstimators:
+    """Un estimateur scikit-learn par groupe (``None`` si le groupe n'a pas été ajusté)."""
+
+    def __init__(self, estimators: List[Any], poly_degree: Optional[int] = None):
+        self.estimators = estimators
+        self.poly_degree = poly_degree
+
+    def predict(self, X: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        X = _expand(X, self.poly_degree)
+        predictions = np.full(len(X), np.nan)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        for rows in (np.split(order, bounds) if len(order) else []):
+            estimator = self.estimators[codes[rows[0]]]
+            if estimator is not None:
+                predictions[rows] = estimator.predict(X[rows])
+        return predictions
+
+
+class GroupedModels:
+    """
+    Modèle retenu de chaque groupe, prêt pour la prédiction.
+
+    Args:
+        key: Colonne des groupes
+        features: Features attendues, dans l'ordre
+        groups: Identifiant de chaque groupe (position = code du groupe)
+        candidates: Noms des candidats
+        selected: Indice dans ``candidates`` du candidat retenu par groupe
+        models: Modèles par candidat (``GroupedLinearModel`` ou ``GroupedEstimators``)
+    """
+
+    def __init__(
+        self,
+        key: str,
+        features: List[str],
+        groups: np.ndarray,
+        candidates: List[str],
+        selected: np.ndarray,
+        models: Dict[str, Any],
+    ):
+        self.key = key
+        self.features = features
+        self.groups = groups
+        self.candidates = candidates
+        self.selected = selected
+        self.models = models
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """Prédire chaque ligne avec le modèle de son groupe (NaN pour un groupe inconnu)."""
+        codes = pd.Index(self.groups).get_indexer(df[self.key])
+        X = df[self.features].to_numpy()
+        predictions = np.full(len(df), np.nan)
+        known = codes >= 0
+        choice = np.where(known, self.selected[np.maximum(codes, 0)], -1)
+        for index, name in enumerate(self.candidates):
+            rows = np.flatnonzero(choice == index)
+            if len(rows):
+                predictions[rows] = self.models[name].predict(X[rows], codes[rows])
+        return predictions
+
+
+def _fit_group_batch(spec: CandidateSpec, source: Any, first: int, last: int) -> Tuple[List[Any], List[np.ndarray]]:
+    """
+    Ajuster un candidat sur les groupes ``first`` à ``last - 1``.
+
+    ``source`` est le répertoire partagé (dans un worker) ou le dictionnaire
+    des tableaux (exécution séquentielle).
+
+    Returns:
+        Estimateurs et prédictions de test, par groupe
+    """
+    get = source.__getitem__ if isinstance(source, dict) else partial(load_shared, source)
+    X = get(f"X_poly{spec.poly_degree}" if spec.poly_degree else "X")
+    y, order, offsets, is_test = get("y"), get("order"), get("offsets"), get("is_test")
+    estimator = resolve_estimator(spec.estimator)
+    models, predictions = [], []
+    for group in range(first, last):
+        rows = order[offsets[group]:offsets[group + 1]]
+        train, test = rows[~is_test[rows]], rows[is_test[rows]]
+        model = estimator(**spec.params).fit(X[train], y[train])
+        models.append(model)
+        predictions.append(model.predict(X[test]) if len(test) else np.empty(0))
+    return models, predictions
+
+
+def _fit_grouped_estimators(
+    spec: CandidateSpec,
+    arrays: Dict[str, np.ndarray],
+    n_groups: int,
+    n_workers: int,
+) -> Tuple[GroupedEstimators, np.ndarray]:
+    """Ajuster un candidat quelconque groupe par groupe, par lots dans un pool de processus."""
+    spec = single_threaded(spec)
+    n_batches = min(n_groups, n_workers * _BATCHES_PER_WORKER)
+    edges = np.linspace(0, n_groups, n_batches + 1).astype(int)
+    if n_workers <= 1:
+        outputs = [_fit_group_batch(spec, arrays, 0, n_groups)]
+    else:
+        with shared_arrays(arrays) as data_dir:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                outputs = list(pool.map(partial(_fit_group_batch, spec, data_dir), edges[:-1], edges[1:]))
+
+    models = [model for batch_models, _ in outputs for model in batch_models]
+    predictions = np.full(len(arrays["y"]), np.nan)
+    test_rows = arrays["order"][arrays["is_test"][arrays["order"]]]
+    predictions[test_rows] = np.concatenate([p for _, batch in outputs for p in batch])
+    return GroupedEstimators(models, spec.poly_degree), predictions
+
+
+def train_grouped(
+    specs: List[CandidateSpec],
+    X: np.ndarray,
+    y: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int,
+    is_test: np.ndarray,
+    n_workers: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
+    """
+    Ajuster chaque candidat sur chaque groupe et l'évaluer sur les lignes de test du groupe.
+
+    Args:
+        specs: Candidats à entraîner
+        X: Features
+        y: Cible
+        codes: Groupe de chaque ligne, entre 0 et ``n_groups - 1``
+        n_groups: Nombre de groupes (chacun doit avoir des lignes d'entraînement)
+        is_test: Lignes réservées à l'évaluation
+        n_workers: Nombre de processus pour les candidats non linéaires
+            (``None`` : nombre de cœurs)
+
+    Returns:
+        Modèles par candidat et métriques de test par candidat (tableaux par groupe)
+    """
+    n_workers = min(n_workers or os.cpu_count() or 1, n_groups)
+    train = ~is_test
+    expanded = {degree: _expand(X, degree) for degree in {spec.poly_degree for spec in specs}}
+    order = np.argsort(codes, kind="stable")
+    # Tableaux partagés par les candidats non linéaires, triés par groupe une seule fois
+    arrays = {
+        "y": y,
+        "order": order,
+        "offsets": np.searchsorted(codes[order], np.arange(n_groups + 1)),
+        "is_test": is_test,
+        **{f"X_poly{degree}" if degree else "X": values for degree, values in expanded.items()},
+    }
+
+    models, metrics = {}, {}
+    for spec in specs:
+        equivalent = normal_equations_equivalent(spec)
+        if equivalent is not None:
+            X_spec = expanded[spec.poly_degree]
+            coef, intercept = fit_grouped_linear(
+                X_spec[train], y[train], codes[train], n_groups, equivalent.alpha, equivalent.fit_intercept
+            )
+            model = GroupedLinearModel(coef, intercept, spec.poly_degree)
+            predictions = np.full(len(y), np.nan)
+            predictions[is_test] = (
+                np.einsum("ip,ip->i", np.asarray(X_spec[is_test], dtype=np.float64), coef[codes[is_test]])
+                + intercept[codes[is_test]]
+            )
+        else:
+            model, predictions = _fit_grouped_estimators(spec, arrays, n_groups, n_workers)
+        models[spec.name] = model
+        metrics[spec.name] = grouped_metrics(y[is_test], predictions[is_test], codes[is_test], n_groups)
+    return models, metrics
+
+
+def metrics_table(
+    groups: Sequence[Any],
+    key: str,
+    n_train: np.ndarray,
+    metrics: Dict[str, Dict[str, np.ndarray]],
+    selected: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Table colonnaire des métriques : une ligne par (groupe, candidat).
+
+    Args:
+        groups: Identifiant de chaque groupe
+        key: Nom de la colonne des groupes
+        n_train: Lignes d'entraînement par groupe
+        metrics: Métriques de test par candidat (``train_grouped``)
+        selected: Indice du candidat retenu par groupe
+
+    Returns:
+        Colonnes ``key``, ``candidate`` (catégorielle), ``n_train``,
+        ``n_test``, ``r2``, ``mse``, ``mae`` et ``selected``
+    """
+    names = list(metrics)
+    n_groups = len(groups)
+    return pd.DataFrame({
+        key: np.tile(np.asarray(groups), len(names)),
+        "candidate": pd.Categorical.from_codes(np.repeat(np.arange(len(names)), n_groups), names),
+        "n_train": np.tile(n_train, len(names)).astype(np.int64),
+        "n_test": np.concatenate([metrics[name]["n"] for name in names]).astype(np.int64),
+        "r2": np.concatenate([metrics[name]["r2"] for name in names]),
+        "mse": np.concatenate([metrics[name]["mse"] for name in names]),
+        "mae": np.concatenate([metrics[name]["mae"] for name in names]),
+        "selected": np.concatenate([selected == index for index in range(len(names))]),
+    })
+
+
+def select_per_group(metrics: Dict[str, Dict[str, np.ndarray]]) -> np.ndarray:
+    """Indice du candidat de plus grand R² de test par groupe (le premier si aucun n'est évalué)."""
+    r2 = np.stack([values["r2"] for values in metrics.values()])
+    return np.where(np.isnan(r2), -math.inf, r2).argmax(axis=0)
@@ -0,0 +1,149 @@
+"""Registre des modèles candidats et tableaux partagés avec les workers.
+
+Les candidats sont déclarés dans ``parameters.yml`` (clé
+``training.candidates``). L'estimateur est désigné par un alias du registre
+``ESTIMATORS`` ou par un chemin importable complet
+(``package.module.Classe``), ce qui permet d'ajouter un modèle sans toucher
+au code du pipeline.
+"""
+
+import importlib
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PolynomialFeatures
+
+ESTIMATORS: Dict[str, str] = {
+    "linear_regression": "sklearn.linear_model.LinearRegression",
+    "ridge": "sklearn.linear_model.Ridge",
+    "random_forest": "sklearn.ensemble.RandomForestRegressor",
+    "normal_equations": "tp_kedro_weather.pipelines.data_processing.normal_equations.NormalEquationRegressor",
+}
+
+# Mémoire partagée (tmpfs) quand elle existe, disque sinon
+_SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+Arrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+@dataclass(frozen=True)
+class CandidateSpec:
+    """Description d'un modèle candidat."""
+
+    name: str
+    estimator: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    poly_degree: Optional[int] = None
+    label: Optional[str] = None
+    # Espace de recherche des hyperparamètres (voir ``tuning.sample_config``)
+    search: Dict[str, Any] = field(default_factory=dict)
+
+
+def resolve_estimator(name: str) -> type:
+    """Retrouver la classe d'un estimateur à partir de son alias ou de son chemin."""
+    path = ESTIMATORS.get(name, name)
+    module_name, _, class_name = path.rpartition(".")
+    if not module_name:
+        raise ValueError(f"Estimateur inconnu : '{name}' (alias du registre ou chemin 'module.Classe')")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def parse_candidates(candidates: Dict[str, Dict[str, Any]]) -> List[CandidateSpec]:
+    """
+    Construire les candidats à partir des paramètres.
+
+    Args:
+        candidates: Paramètres ``training.candidates``
+
+    Returns:
+        Liste des candidats, dans l'ordre de déclaration
+    """
+    return [
+        CandidateSpec(
+            name=name,
+            estimator=spec["estimator"],
+            params=dict(spec.get("params") or {}),
+            poly_degree=spec.get("poly_degree"),
+            label=spec.get("label"),
+            search=dict(spec.get("search") or {}),
+        )
+        for name, spec in candidates.items()
+    ]
+
+
+def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """Calculer R², MSE et MAE en une passe sur les résidus."""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuals = np.asarray(y_pred, dtype=np.float64) - y_true
+    sse = float(residuals @ residuals)
+    centered = y_true - y_true.mean()
+    sst = float(centered @ centered)
+    # Cible constante : R² vaut 1 si la prédiction est parfaite, 0 sinon (comme scikit-learn)
+    r2 = 1 - sse / sst if sst > 0 else float(sse == 0)
+    return {"r2": r2, "mse": sse / len(y_true), "mae": float(np.abs(residuals).mean())}
+
+
+def fit_candidate(spec: CandidateSpec, arrays: Arrays, train_metrics: bool = False) -> Dict[str, Any]:
+    """
+    Entraîner un candidat et l'évaluer sur le jeu de test.
+
+    Args:
+        spec: Candidat à entraîner
+        arrays: ``X_train``, ``X_test``, ``y_train``, ``y_test``
+        train_metrics: Calculer aussi les métriques sur le jeu d'entraînement
+            (clé ``train``), pendant que les features transformées sont disponibles
+
+    Returns:
+        Modèle, transformation polynomiale éventuelle et métriques de test
+    """
+    X_train, X_test, y_train, y_test = arrays
+    poly = None
+    if spec.poly_degree:
+        poly = PolynomialFeatures(degree=spec.poly_degree, include_bias=False)
+        X_train = poly.fit_transform(X_train)
+        X_test = poly.transform(X_test)
+
+    model = resolve_estimator(spec.estimator)(**spec.params)
+    model.fit(X_train, y_train)
+    result = {"model": model, "poly": poly, **regression_metrics(y_test, model.predict(X_test))}
+    if train_metrics:
+        result["train"] = regression_metrics(y_train, model.predict(X_train))
+    return result
+
+
+def build_model_pipeline(model: Any, poly: Optional[PolynomialFeatures] = None) -> Pipeline:
+    """Réunir la transformation polynomiale éventuelle et l'estimateur entraînés en un seul artefact."""
+    steps = [("poly", poly)] if poly is not None else []
+    return Pipeline(steps + [("regressor", model)])
+
+
+@contextmanager
+def shared_arrays(arrays: Dict[str, np.ndarray]) -> Iterator[str]:
+    """
+    Écrire des tableaux une seule fois pour un pool de workers.
+
+    Les tableaux sont enregistrés en ``.npy`` (en mémoire partagée
+    ``/dev/shm`` si disponible) dans un répertoire temporaire supprimé à la
+    sortie du bloc ; les workers les relisent avec ``load_shared``.
+
+    Args:
+        arrays: Tableaux par nom
+
+    Returns:
+        Chemin du répertoire, à transmettre aux workers
+    """
+    with tempfile.TemporaryDirectory(prefix="tp_kedro_weather_", dir=_SHARED_DIR) as data_dir:
+        for name, array in arrays.items():
+            np.save(Path(data_dir) / f"{name}.npy", np.ascontiguousarray(array))
+        yield data_dir
+
+
+def load_shared(data_dir: str, name: str, mode: str = "r") -> np.ndarray:
+    """Projeter en mémoire un tableau écrit par ``shared_arrays`` (aucune copie par worker ; ``mode="r+"`` pour y écrire)."""
+    return np.load(Path(data_dir) / f"{name}.npy", mmap_mode=mode)
@@ -1,191 +1,351 @@
-"""Nodes pour le traitement des données météo et la modélisation."""
+"""Nodes pour le traitement des données météo et la modélisation.
 
-import pandas as pd
-import numpy as np
-from sklearn.linear_model import LinearRegression, Ridge
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-from typing import Dict, Any
+Les bibliothèques lourdes (pandas, scikit-learn, pyarrow) sont importées
+dans les nodes qui s'en servent : enregistrer les pipelines ou lancer un
+seul node ne charge que ce dont il a besoin.
+"""
 
+from __future__ import annotations
 
-def load_weather_data(df: pd.DataFrame) -> pd.DataFrame:
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.pipeline import Pipeline
+
+    from tp_kedro_weather.datasets import FrameChunks
+    from .models import CandidateSpec
+
+    WeatherData = Union[pd.DataFrame, FrameChunks]
+
+
+def load_weather_data(df: WeatherData) -> WeatherData:
     """
     Charger les données météo.
     
+    En mode streaming (``FrameChunks``), le nombre de lignes est compté sans
+    matérialiser le fichier complet.
+    
     Args:
-        df: DataFrame chargé depuis le catalogue
+        df: DataFrame ou source par blocs chargé depuis le catalogue
         
     Returns:
-        DataFrame brut
+        Données brutes, inchangées
     """
-    print(f"Données chargées : {len(df)} lignes")
+    from tp_kedro_weather.datasets import FrameChunks
+    
+    if isinstance(df, FrameChunks):
+        print(f"Données chargées : {df.count_rows()} lignes (blocs de {df.chunksize} lignes)")
+    else:
+        print(f"Données chargées : {len(df)} lignes")
     print(f"Colonnes : {list(df.columns)}")
     return df
 
 
-def clean_weather_data(df: pd.DataFrame) -> pd.DataFrame:
+def _as_frame(data: WeatherData, columns: List[str]) -> pd.DataFrame:
+    """Matérialiser uniquement les colonnes demandées d'une source par blocs."""
+    import pandas as pd
+    
+    if isinstance(data, pd.DataFrame):
+        return data
+    return pd.concat([chunk[columns] for chunk in data], ignore_index=True)
+
+
+def clean_weather_data(df: WeatherData, cleaning: Dict[str, Any]) -> Tuple[WeatherData, Dict[str, Any]]:
     """
-    Nettoyer les données météo.
+    Nettoyer les données météo selon le schéma de colonnes.
     
-    Convertit les colonnes en numériques et remplace les valeurs manquantes
-    par la moyenne de chaque colonne.
+    Pour chaque colonne déclarée dans ``parameters.yml`` : conversion dans le
+    dtype, sentinelles ('N/A', 'missing', 'unknown') et valeurs non
+    numériques rendues manquantes, bornage à la plage valide, puis imputation.
+    En mode streaming, une première passe sur les blocs calcule compteurs et
+    moyennes, puis le nettoyage est appliqué bloc par bloc au moment de
+    l'écriture. Le résultat est identique au mode en mémoire.
     
     Args:
-        df: DataFrame brut
+        df: DataFrame brut ou source par blocs
+        cleaning: Schéma de nettoyage (paramètres ``cleaning``)
         
     Returns:
-        DataFrame nettoyé
+        Données nettoyées (DataFrame, ou source par blocs nettoyée
+        paresseusement) et rapport des valeurs manquantes par colonne
     """
-    # Copier le DataFrame pour éviter de modifier l'original
-    df_clean = df.copy()
+    from tp_kedro_weather.datasets import FrameChunks
+    from .cleaning import clean_chunk, clean_frame, parse_schema, summarise_chunks
     
-    # Convertir toutes les colonnes en numériques (gère les valeurs texte comme 'N/A', 'missing', 'unknown')
-    df_clean['temperature'] = pd.to_numeric(df_clean['temperature'], errors='coerce')
-    df_clean['humidity'] = pd.to_numeric(df_clean['humidity'], errors='coerce')
-    df_clean['windspeed'] = pd.to_numeric(df_clean['windspeed'], errors='coerce')
+    specs = parse_schema(cleaning)
     
-    # Compter les valeurs manquantes avant nettoyage
-    missing_before = df_clean.isnull().sum()
-    print(f"\nValeurs manquantes avant nettoyage :")
-    print(missing_before)
+    if isinstance(df, FrameChunks):
+        summary = summarise_chunks(df, specs)
+        report = summary.report()
+        cleaned = df.map(partial(clean_chunk, specs=specs, fill_values=summary.fill_values()))
+    else:
+        cleaned, report = clean_frame(df, specs)
     
-    # Remplacer les valeurs manquantes par la moyenne de chaque colonne
-    df_clean['humidity'] = df_clean['humidity'].fillna(df_clean['humidity'].mean())
-    df_clean['windspeed'] = df_clean['windspeed'].fillna(df_clean['windspeed'].mean())
-    df_clean['temperature'] = df_clean['temperature'].fillna(df_clean['temperature'].mean())
+    print(f"\nDonnées nettoyées : {report['n_rows']} lignes")
     
-    # Compter les valeurs manquantes après nettoyage
-    missing_after = df_clean.isnull().sum()
-    print(f"\nValeurs manquantes après nettoyage :")
-    print(missing_after)
+    return cleaned, report
+
+
+def profile_weather_data(df: WeatherData, cleaning: Dict[str, Any], profiling: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Profiler la qualité des données brutes en une passe.
     
-    print(f"\nDonnées nettoyées : {len(df_clean)} lignes")
+    Pour chaque colonne du schéma : manquants, sentinelles par valeur,
+    valeurs non numériques et hors plage, min/max, moyenne et variance,
+    quantiles approchés (KLL) et nombre approché de valeurs distinctes
+    (HyperLogLog). En mode streaming, les blocs sont profilés un par un en
+    mémoire bornée.
     
-    return df_clean
+    Args:
+        df: DataFrame brut ou source par blocs
+        cleaning: Schéma de nettoyage (paramètres ``cleaning``)
+        profiling: Paramètres ``profiling`` (taille des esquisses, quantiles)
+        
+    Returns:
+        Profil de qualité, sérialisable en JSON
+    """
+    from tp_kedro_weather.datasets import FrameChunks
+    from .cleaning import parse_schema
+    from .profiling import DEFAULT_QUANTILES, profile_chunks
+    
+    chunks = df if isinstance(df, FrameChunks) else [df]
+    profile = profile_chunks(chunks, parse_schema(cleaning), profiling)
+    report = profile.report(profiling.get('quantiles') or DEFAULT_QUANTILES)
+    
+    print(f"\nProfil de qualité : {report['n_rows']} lignes")
+    for name, column in report['columns'].items():
+        print(f"  {name:12s} : {column['missing']} manquants, {column['out_of_range']} hors plage, "
+              f"~{column['distinct_approx']} valeurs distinctes")
+    return report
 
 
-def train_model(df: pd.DataFrame) -> Dict[str, Any]:
+def build_features(
+    df: WeatherData, feature_store: Optional[Dict[str, Any]], feature_engineering: Dict[str, Any]
+) -> Tuple[WeatherData, Dict[str, Any]]:
+    """
+    Ajouter les features temporelles (retards, moyennes, min et max glissants).
+    
+    Les lignes sont prises dans l'ordre chronologique du fichier. La table
+    de features est persistante : si la configuration et les lignes déjà
+    couvertes n'ont pas changé, seules les lignes ajoutées depuis le run
+    précédent sont calculées et écrites. Désactivé
+    (``feature_engineering.enabled: false``), le node transmet les données
+    nettoyées telles quelles.
+    
+    Args:
+        df: Données nettoyées (DataFrame ou source par blocs, alors matérialisée)
+        feature_store: Table enregistrée au run précédent (``None`` au premier run)
+        feature_engineering: Paramètres ``feature_engineering``
+        
+    Returns:
+        Données avec features et mise à jour de la table persistante
+        (vide si rien n'est à enregistrer)
+    """
+    if not feature_engineering.get('enabled', False):
+        return df, {}
+    
+    from .features import build_feature_table, feature_names
+    
+    df = _as_frame(df, list(df.columns))
+    table, meta, start = build_feature_table(df, feature_engineering, feature_store)
+    if start == 0:
+        print(f"\nFeatures : {len(feature_names(feature_engineering))} colonnes calculées sur {len(table)} lignes")
+    else:
+        print(f"\nFeatures : table réutilisée ({start} lignes), {len(table) - start} lignes ajoutées")
+    return table, {'meta': meta, 'table': table, 'start': start}
+
+
+def train_model(
+    df: WeatherData,
+    training: Dict[str, Any],
+    training_cache: Dict[str, Any],
+    feature_engineering: Optional[Dict[str, Any]] = None,
+) -> Tuple[Pipeline, Dict[str, Any], Dict[str, Any]]:
     """
     Entraîner plusieurs modèles et sélectionner le meilleur.
     
-    Teste :
-    - Régression linéaire simple
-    - Régression linéaire avec features polynomiales
-    - Random Forest (capture les relations non-linéaires)
+    Les candidats (par défaut : régression linéaire simple, régression
+    polynomiale Ridge et Random Forest) et leurs hyperparamètres sont
+    déclarés dans ``parameters.yml``. Ils sont comparés par validation
+    croisée k-fold sur le jeu d'entraînement, en parallèle dans un pool de
+    ``n_workers`` processus ; seul le meilleur est réentraîné sur tout le
+    jeu d'entraînement et évalué sur le jeu de test.
+    
+    Avec ``training.out_of_core`` et des données par blocs, la famille
+    linéaire est ajustée hors mémoire par statistiques suffisantes (mémoire
+    constante) ; les candidats non linéaires sont alors ignorés.
+    
+    Si les données d'entraînement, la configuration et les versions des
+    bibliothèques sont identiques à un run précédent, les résultats sont
+    relus depuis le cache au lieu d'être recalculés.
+    
+    Les trois sorties sont séparées et picklables : chacune est enregistrée
+    dans son propre dataset et les nodes en aval (export, rapport) ne
+    dépendent que de celle qu'ils utilisent, ce qui permet de les exécuter en
+    parallèle (``ThreadRunner``, ``ParallelRunner``).
     
     Args:
-        df: DataFrame nettoyé
+        df: DataFrame nettoyé ou source par blocs
+        training: Paramètres ``training`` (features, cible, découpage, candidats)
+        training_cache: Paramètres ``training_cache``
+        feature_engineering: Paramètres ``feature_engineering`` : s'ils sont
+            activés, les features temporelles s'ajoutent à ``training.features``
         
     Returns:
-        Dictionnaire contenant le meilleur modèle et les métriques
+        Meilleur modèle (chaîne prétraitement + estimateur), métriques et
+        prédictions hors pli de validation croisée par candidat
     """
-    # Préparer les features de base
-    X_base = df[['humidity', 'windspeed']]
-    y = df['temperature']
+    if feature_engineering and feature_engineering.get('enabled', False):
+        from .features import feature_names
+        
+        training = {**training, 'features': [*training['features'], *feature_names(feature_engineering)]}
+    return split_training_results(_training_results(df, training, training_cache))
+
+
+def _training_results(df: WeatherData, training: Dict[str, Any], training_cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Résultats d'entraînement complets, relus depuis le cache si possible."""
+    from tp_kedro_weather.datasets import FrameChunks
+    from .training_cache import TrainingCache, fingerprint
+    
+    columns = training['features'] + [training['target']]
+    if training.get('out_of_core', False) and isinstance(df, FrameChunks):
+        train = partial(_train_out_of_core, df, training)
+        frames = (chunk[columns] for chunk in df)
+    else:
+        df = _as_frame(df, columns)
+        train = partial(_train_and_select, df, training)
+        frames = [df[columns]]
+    
+    cache = TrainingCache.from_params(training_cache)
+    if cache is None:
+        return train()
+    
+    key = fingerprint(frames, training)
+    results = cache.get(key)
+    if results is not None:
+        print(f"\nRésultats d'entraînement relus depuis le cache ({key[:12]})")
+    else:
+        results = train()
+        cache.put(key, results)
     
-    # Diviser les données en train/test
-    X_train_base, X_test_base, y_train, y_test = train_test_split(
-        X_base, y, test_size=0.2, random_state=42
+    stats = cache.stats
+    print(f"Cache d'entraînement : {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['entries']} entrées, {stats['size_bytes'] / 1e6:.1f} Mo")
+    return results
+
+
+def _train_and_select(df: pd.DataFrame, training: Dict[str, Any]) -> Dict[str, Any]:
+    """Sélectionner le meilleur candidat par validation croisée, le réentraîner et l'évaluer sur le jeu de test."""
+    import numpy as np
+    from sklearn.model_selection import train_test_split
+    from .evaluation import cross_validate, make_folds
+    from .models import fit_candidate, parse_candidates
+    
+    features = training['features']
+    target = training['target']
+    
+    # Préparer les features de base (float32 avec training.dtype : les arbres
+    # de scikit-learn travaillent en float32, sans copie de conversion)
+    X_base = df[features].to_numpy(dtype=training.get('dtype'))
+    y = df[target].to_numpy()
+    
+    # Diviser les données en train/test par indices : le jeu de test ne sert
+    # qu'à l'évaluation finale, et la recherche et la validation croisée
+    # lisent X_base sans en matérialiser de copie
+    train_rows, test_rows = train_test_split(
+        np.arange(len(y)), test_size=training['test_size'], random_state=training['random_state']
     )
     
-    # Dictionnaire pour stocker tous les résultats
-    results = {}
-    
-    # === Modèle 1 : Régression Linéaire Simple ===
-    lr_model = LinearRegression()
-    lr_model.fit(X_train_base, y_train)
-    y_pred_test_lr = lr_model.predict(X_test_base)
-    r2_lr = r2_score(y_test, y_pred_test_lr)
-    mse_lr = mean_squared_error(y_test, y_pred_test_lr)
-    mae_lr = mean_absolute_error(y_test, y_pred_test_lr)
-    
-    results['linear_regression'] = {
-        'model': lr_model,
-        'r2': r2_lr,
-        'mse': mse_lr,
-        'mae': mae_lr,
-        'X_train': X_train_base,
-        'X_test': X_test_base
-    }
-    
-    # === Modèle 2 : Régression avec Features Polynomiales ===
-    poly = PolynomialFeatures(degree=2, include_bias=False)
-    X_train_poly = poly.fit_transform(X_train_base)
-    X_test_poly = poly.transform(X_test_base)
-    
-    ridge_model = Ridge(alpha=1.0)
-    ridge_model.fit(X_train_poly, y_train)
-    y_pred_test_ridge = ridge_model.predict(X_test_poly)
-    r2_ridge = r2_score(y_test, y_pred_test_ridge)
-    mse_ridge = mean_squared_error(y_test, y_pred_test_ridge)
-    mae_ridge = mean_absolute_error(y_test, y_pred_test_ridge)
-    
-    results['polynomial_ridge'] = {
-        'model': ridge_model,
-        'poly': poly,
-        'r2': r2_ridge,
-        'mse': mse_ridge,
-        'mae': mae_ridge,
-        'X_train': X_train_poly,
-        'X_test': X_test_poly
-    }
+    # Plis partagés par la recherche d'hyperparamètres et la sélection
+    cv = training.get('cv') or {}
+    folds = make_folds(len(train_rows), cv.get('folds', 5), cv.get('random_state', training['random_state']))
     
-    # === Modèle 3 : Random Forest ===
-    rf_model = RandomForestRegressor(
-        n_estimators=100,
-        max_depth=10,
-        min_samples_split=5,
-        random_state=42,
-        n_jobs=-1
+    specs = parse_candidates(training['candidates'])
+    tuning = training.get('tuning') or {}
+    search = {}
+    if tuning.get('enabled', False):
+        from .tuning import tune_candidates
+        
+        specs, search = tune_candidates(specs, X_base, y, tuning, folds, training.get('n_workers'), train_rows)
+    
+    # Évaluer tous les candidats en parallèle sur les mêmes plis
+    evaluation = cross_validate(specs, X_base, y, folds, training.get('n_workers'), train_rows)
+    scores = evaluation['scores']
+    
+    # === Sélectionner le meilleur modèle (plus grand R² hors pli) ===
+    # Seul son réentraînement matérialise les jeux d'entraînement et de test
+    best_model_name = max(scores, key=lambda k: scores[k]['r2'])
+    best_spec = next(spec for spec in specs if spec.name == best_model_name)
+    arrays = (X_base[train_rows], X_base[test_rows], y[train_rows], y[test_rows])
+    best_result = fit_candidate(best_spec, arrays, train_metrics=True)
+    del arrays
+    
+    results = _package_results(
+        specs, scores, best_model_name, best_result, best_result['train'], features,
+        len(train_rows), len(test_rows), search, selection={'method': 'kfold', 'folds': len(folds)},
     )
-    rf_model.fit(X_train_base, y_train)
-    y_pred_test_rf = rf_model.predict(X_test_base)
-    r2_rf = r2_score(y_test, y_pred_test_rf)
-    mse_rf = mean_squared_error(y_test, y_pred_test_rf)
-    mae_rf = mean_absolute_error(y_test, y_pred_test_rf)
-    
-    results['random_forest'] = {
-        'model': rf_model,
-        'r2': r2_rf,
-        'mse': mse_rf,
-        'mae': mae_rf,
-        'X_train': X_train_base,
-        'X_test': X_test_base
-    }
+    results['cv'] = {'candidates': evaluation['candidates'], 'oof_predictions': evaluation['oof_predictions']}
+    return results
+
+
+def _train_out_of_core(chunks: FrameChunks, training: Dict[str, Any]) -> Dict[str, Any]:
+    """Ajuster la famille linéaire hors mémoire et construire les résultats du meilleur."""
+    from .models import parse_candidates
+    from .out_of_core import fit_out_of_core
+    
+    specs = parse_candidates(training['candidates'])
+    results, train_metrics, skipped = fit_out_of_core(chunks, specs, training)
+    if skipped:
+        print(f"\nCandidats ignorés hors mémoire (non linéaires) : {', '.join(skipped)}")
+    if not results:
+        raise ValueError("Aucun candidat linéaire à ajuster hors mémoire (training.out_of_core)")
     
-    # === Sélectionner le meilleur modèle (plus grand R²) ===
     best_model_name = max(results, key=lambda k: results[k]['r2'])
-    best_result = results[best_model_name]
-    
-    # Calculer les métriques finales sur train et test
-    if 'poly' in best_result:
-        y_pred_train = best_result['model'].predict(best_result['X_train'])
-        y_pred_test = best_result['model'].predict(best_result['X_test'])
-    else:
-        y_pred_train = best_result['model'].predict(best_result['X_train'])
-        y_pred_test = best_result['model'].predict(best_result['X_test'])
+    specs = [spec for spec in specs if spec.name in results]
+    best_train = train_metrics[best_model_name]
+    return _package_results(
+        specs, results, best_model_name, results[best_model_name], best_train, training['features'],
+        best_train['n'], results[best_model_name]['n'],
+    )
+
+
+def _package_results(
+    specs: List[CandidateSpec],
+    scores: Dict[str, Dict[str, float]],
+    best_model_name: str,
+    best_result: Dict[str, Any],
+    train_metrics: Dict[str, float],
+    features: List[str],
+    n_train: int,
+    n_test: int,
+    search: Optional[Dict[str, Dict[str, Any]]] = None,
+    selection: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Afficher la comparaison des candidats et construire les résultats du meilleur.
     
-    mse_train = mean_squared_error(y_train, y_pred_train)
+    ``scores`` sont les métriques de sélection de chaque candidat (hors pli
+    avec ``selection``, sur le jeu de test sinon) ; ``best_result`` contient
+    le modèle retenu et ses métriques de test.
+    """
+    search = search or {}
+    scope = 'CV' if selection else 'test'
+    mse_train = train_metrics['mse']
     mse_test = best_result['mse']
-    r2_train = r2_score(y_train, y_pred_train)
+    r2_train = train_metrics['r2']
     r2_test = best_result['r2']
     mae_test = best_result['mae']
     
     # Afficher les résultats
     print(f"\n=== COMPARAISON DES MODÈLES ===")
-    print(f"\n1. Régression Linéaire Simple:")
-    print(f"   R² test : {results['linear_regression']['r2']:.4f}")
-    print(f"   MSE test: {results['linear_regression']['mse']:.4f}")
-    
-    print(f"\n2. Régression Polynomiale (degré 2):")
-    print(f"   R² test : {results['polynomial_ridge']['r2']:.4f}")
-    print(f"   MSE test: {results['polynomial_ridge']['mse']:.4f}")
-    
-    print(f"\n3. Random Forest:")
-    print(f"   R² test : {results['random_forest']['r2']:.4f}")
-    print(f"   MSE test: {results['random_forest']['mse']:.4f}")
+    for i, spec in enumerate(specs, start=1):
+        print(f"\n{i}. {spec.label or spec.name.replace('_', ' ').title()}:")
+        print(f"   R² {scope:<5}: {scores[spec.name]['r2']:.4f}")
+        print(f"   MSE {scope:<4}: {scores[spec.name]['mse']:.4f}")
+        if spec.name in search:
+            print(f"   Recherche : {search[spec.name]['params']}")
     
     print(f"\n=== MEILLEUR MODÈLE : {best_model_name.upper().replace('_', ' ')} ===")
     print(f"MSE (train) : {mse_train:.4f}")
@@ -194,11 +354,10 @@ def train_model(df: pd.DataFrame) -> Dict[str, Any]:
     print(f"R² (train)  : {r2_train:.4f}")
     print(f"R² (test)   : {r2_test:.4f}")
     
-    # Feature importance pour Random Forest
-    if best_model_name == 'random_forest':
+    # Importance des features pour les modèles à base d'arbres
+    if best_result['poly'] is None and hasattr(best_result['model'], 'feature_importances_'):
         print(f"\nImportance des features:")
-        for feature, importance in zip(['humidity', 'windspeed'], 
-                                       best_result['model'].feature_importances_):
+        for feature, importance in zip(features, best_result['model'].feature_importances_):
             print(f"  {feature:12s} : {importance:.4f}")
     
     # Préparer les métriques
@@ -209,30 +368,69 @@ def train_model(df: pd.DataFrame) -> Dict[str, Any]:
         'mae_test': mae_test,
         'r2_train': r2_train,
         'r2_test': r2_test,
+        'n_train': int(n_train),
+        'n_test': int(n_test),
         'all_models': {
             name: {
                 'r2': res['r2'],
                 'mse': res['mse'],
-                'mae': res['mae']
+                'mae': res['mae'],
+                **({'r2_std': res['r2_std']} if 'r2_std' in res else {}),
             }
-            for name, res in results.items()
+            for name, res in scores.items()
         }
     }
+    if selection:
+        metrics['selection'] = selection
+    # Configuration retenue par la recherche d'hyperparamètres
+    for spec in specs:
+        if spec.name in search:
+            metrics['all_models'][spec.name].update(
+                params=spec.params,
+                cv_r2=search[spec.name]['cv_r2'],
+                cv_rows=search[spec.name]['cv_rows'],
+                evaluations=search[spec.name]['evaluations'],
+            )
+    
+    return {'model': best_result['model'], 'metrics': metrics, 'poly': best_result['poly']}
+
+
+def split_training_results(results: Dict[str, Any]) -> Tuple[Pipeline, Dict[str, Any], Dict[str, Any]]:
+    """
+    Séparer les résultats d'entraînement en sorties indépendantes.
     
-    return {'model': best_result['model'], 'metrics': metrics, 'poly': best_result.get('poly')}
+    Args:
+        results: Dictionnaire contenant le modèle, les métriques et, s'il y a
+            eu validation croisée, les prédictions hors pli
+        
+    Returns:
+        Modèle à sauvegarder, métriques et prédictions hors pli (tableaux
+        ``.npy`` et noms des candidats, dans l'ordre des lignes)
+    """
+    cv = results.get('cv') or {}
+    predictions = {'model_type': results['metrics']['model_type'], 'candidates': list(cv.get('candidates', []))}
+    if 'oof_predictions' in cv:
+        predictions['oof_predictions'] = cv['oof_predictions']
+    return save_model(results), save_metrics(results), predictions
 
 
-def save_model(results: Dict[str, Any]) -> Any:
+def save_model(results: Dict[str, Any]) -> Pipeline:
     """
-    Extraire le modèle pour la sauvegarde.
+    Construire l'artefact du modèle pour la sauvegarde.
+    
+    La transformation polynomiale éventuelle et l'estimateur sont réunis
+    dans un seul ``Pipeline`` scikit-learn, qui prédit directement à partir
+    des features brutes.
     
     Args:
         results: Dictionnaire contenant le modèle et les métriques
         
     Returns:
-        Le modèle entraîné
+        La chaîne prétraitement + modèle entraînée
     """
-    return results['model']
+    from .models import build_model_pipeline
+    
+    return build_model_pipeline(results['model'], results.get('poly'))
 
 
 def save_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
@@ -247,3 +445,41 @@ def save_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
     """
     return results['metrics']
 
+
+def archive_run_artifacts(model: Any, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Regrouper le modèle et les métriques du run pour le magasin d'artefacts.
+    
+    Args:
+        model: Chaîne prétraitement + modèle sauvegardée
+        metrics: Métriques de performance
+        
+    Returns:
+        Artefacts du run (``ArtifactStoreDataset``)
+    """
+    return {'model': model, 'metrics': metrics}
+
+
+def export_compact_model(model: Any) -> Dict[str, Any]:
+    """
+    Exporter le modèle sauvegardé en forêt compacte, s'il s'agit d'une forêt.
+    
+    Args:
+        model: Chaîne prétraitement + modèle sauvegardée
+        
+    Returns:
+        Tableaux de la forêt compacte, ou seulement le type du modèle quand
+        il ne s'agit pas d'une forêt (rien à exporter)
+    """
+    from sklearn.pipeline import Pipeline
+    from .compact_forest import export_arrays, forest_of
+    
+    forest = forest_of(model)
+    if forest is None:
+        name = type(model.steps[-1][1] if isinstance(model, Pipeline) else model).__name__
+        print(f"Export compact ignoré : le modèle retenu ({name}) n'est pas une forêt")
+        return {"model_type": name}
+    arrays = export_arrays(forest)
+    n_bytes = sum(getattr(array, "nbytes", 0) for array in arrays.values())
+    print(f"Forêt compacte : {len(arrays['roots'])} arbres, {len(arrays['value'])} nœuds, {n_bytes / 1e6:.2f} Mo")
+    return arrays
@@ -0,0 +1,130 @@
+"""Régression linéaire / Ridge par statistiques suffisantes.
+
+Le modèle ne garde que les moyennes et les co-moments centrés de X et y
+(taille ``p × p``), mis à jour bloc par bloc avec les formules de fusion de
+Chan et al. Les coefficients sont obtenus en résolvant les équations normales
+(ou Ridge) : ``partial_fit`` sur des blocs successifs donne le même modèle
+qu'un ``fit`` sur toutes les données, à la précision numérique près.
+"""
+
+from typing import Optional
+
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import LinearRegression, Ridge
+
+from .models import CandidateSpec, resolve_estimator
+
+
+class NormalEquationRegressor(RegressorMixin, BaseEstimator):
+    """
+    Régression linéaire (``alpha=0``) ou Ridge incrémentale.
+
+    Équivalente à ``LinearRegression`` / ``Ridge(alpha)`` de scikit-learn :
+    l'intercept n'est pas pénalisé et les données sont centrées.
+
+    Args:
+        alpha: Coefficient de régularisation L2
+        fit_intercept: Ajuster un intercept
+    """
+
+    def __init__(self, alpha: float = 0.0, fit_intercept: bool = True):
+        self.alpha = alpha
+        self.fit_intercept = fit_intercept
+
+    def fit(self, X, y) -> "NormalEquationRegressor":
+        for attribute in ("n_samples_seen_", "x_mean_", "y_mean_", "xx_", "xy_"):
+            self.__dict__.pop(attribute, None)
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X, y) -> "NormalEquationRegressor":
+        """Ajouter un bloc de données aux statistiques puis recalculer les coefficients."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if len(X) == 0:
+            return self
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        X_centered = X - x_mean
+        y_centered = y - y_mean
+        self._merge(len(X), x_mean, y_mean, X_centered.T @ X_centered, X_centered.T @ y_centered)
+        return self
+
+    def merge(self, other: "NormalEquationRegressor") -> "NormalEquationRegressor":
+        """Fusionner les statistiques d'un modèle entraîné sur d'autres données."""
+        if getattr(other, "n_samples_seen_", 0):
+            self._merge(other.n_samples_seen_, other.x_mean_, other.y_mean_, other.xx_, other.xy_)
+        return self
+
+    def _merge(self, n_b: int, x_mean_b: np.ndarray, y_mean_b: float, xx_b: np.ndarray, xy_b: np.ndarray) -> None:
+        n_a = getattr(self, "n_samples_seen_", 0)
+        if n_a == 0:
+            self.n_samples_seen_ = n_b
+            self.x_mean_ = np.array(x_mean_b, dtype=np.float64)
+            self.y_mean_ = float(y_mean_b)
+            self.xx_ = np.array(xx_b, dtype=np.float64)
+            self.xy_ = np.array(xy_b, dtype=np.float64)
+        else:
+            n = n_a + n_b
+            delta_x = x_mean_b - self.x_mean_
+            delta_y = y_mean_b - self.y_mean_
+            weight = n_a * n_b / n
+            self.xx_ = self.xx_ + xx_b + weight * np.outer(delta_x, delta_x)
+            self.xy_ = self.xy_ + xy_b + weight * delta_x * delta_y
+            self.x_mean_ = self.x_mean_ + delta_x * n_b / n
+            self.y_mean_ = self.y_mean_ + delta_y * n_b / n
+            self.n_samples_seen_ = n
+        self.n_features_in_ = len(self.x_mean_)
+        self._solve()
+
+    def _solve(self) -> None:
+        if self.fit_intercept:
+            xx, xy = self.xx_, self.xy_
+        else:
+            # Moments non centrés reconstruits depuis les moments centrés
+            n = self.n_samples_seen_
+            xx = self.xx_ + n * np.outer(self.x_mean_, self.x_mean_)
+            xy = self.xy_ + n * self.x_mean_ * self.y_mean_
+        self.coef_ = _solve_symmetric(xx + self.alpha * np.eye(len(xy)), xy)
+        self.intercept_ = float(self.y_mean_ - self.x_mean_ @ self.coef_) if self.fit_intercept else 0.0
+
+    def predict(self, X) -> np.ndarray:
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+    def to_sklearn(self) -> LinearRegression:
+        """Convertir en ``LinearRegression`` / ``Ridge`` scikit-learn aux mêmes coefficients."""
+        if self.alpha == 0:
+            model = LinearRegression(fit_intercept=self.fit_intercept)
+        else:
+            model = Ridge(alpha=self.alpha, fit_intercept=self.fit_intercept)
+        model.coef_ = self.coef_.copy()
+        model.intercept_ = self.intercept_
+        model.n_features_in_ = self.n_features_in_
+        return model
+
+
+def normal_equations_equivalent(spec: CandidateSpec) -> Optional[NormalEquationRegressor]:
+    """
+    Estimateur par statistiques suffisantes équivalent à un candidat.
+
+    Returns:
+        ``NormalEquationRegressor`` pour ``LinearRegression``, ``Ridge`` ou
+        ``NormalEquationRegressor`` ; ``None`` pour les autres estimateurs
+    """
+    estimator = resolve_estimator(spec.estimator)
+    fit_intercept = spec.params.get("fit_intercept", True)
+    if issubclass(estimator, NormalEquationRegressor):
+        return NormalEquationRegressor(**spec.params)
+    if issubclass(estimator, LinearRegression):
+        return NormalEquationRegressor(alpha=0.0, fit_intercept=fit_intercept)
+    if issubclass(estimator, Ridge):
+        return NormalEquationRegressor(alpha=spec.params.get("alpha", 1.0), fit_intercept=fit_intercept)
+    return None
+
+
+def _solve_symmetric(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    try:
+        return np.linalg.solve(a, b)
+    except np.linalg.LinAlgError:
+        # Système singulier (feature constante...) : solution de norme minimale
+        return np.linalg.lstsq(a, b, rcond=None)[0]
@@ -0,0 +1,169 @@
+"""Ajustement hors mémoire de la famille linéaire.
+
+Les candidats ``LinearRegression`` / ``Ridge`` (avec ou sans expansion
+polynomiale) ne dépendent que de XᵀX et Xᵀy. Une première passe sur les
+blocs de ``cleaned_weather_data`` accumule ces statistiques, l'expansion
+polynomiale étant faite bloc par bloc sans garder la matrice étendue ; une
+seconde passe calcule les métriques. La mémoire est constante quel que soit
+le nombre de lignes.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import PolynomialFeatures
+
+from .models import CandidateSpec
+from .normal_equations import NormalEquationRegressor, normal_equations_equivalent
+
+# Constantes de splitmix64
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_UINT64_MASK = (1 << 64) - 1
+
+
+def test_mask(start: int, n_rows: int, test_size: float, seed: int) -> np.ndarray:
+    """
+    Affecter des lignes au jeu de test, de façon déterministe.
+
+    L'affectation ne dépend que de l'indice global de la ligne et de la
+    graine (hachage splitmix64), donc pas du découpage en blocs et sans
+    permutation globale à garder en mémoire.
+
+    Args:
+        start: Indice global de la première ligne du bloc
+        n_rows: Nombre de lignes du bloc
+        test_size: Proportion de lignes de test
+        seed: Graine
+
+    Returns:
+        Masque booléen, vrai pour les lignes de test
+    """
+    z = np.arange(start, start + n_rows, dtype=np.uint64) + np.uint64((seed * _GAMMA) & _UINT64_MASK)
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53 < test_size
+
+
+class StreamingMetrics:
+    """R², MSE et MAE cumulés bloc par bloc à partir des résidus."""
+
+    def __init__(self):
+        self.n = 0
+        self.y_mean = 0.0
+        self.y_m2 = 0.0
+        self.sse = 0.0
+        self.sae = 0.0
+
+    def update(self, y: np.ndarray, y_pred: np.ndarray) -> None:
+        n_b = len(y)
+        if n_b == 0:
+            return
+        residuals = y - y_pred
+        self.sse += float(residuals @ residuals)
+        self.sae += float(np.abs(residuals).sum())
+        # Variance de y fusionnée bloc par bloc (Chan et al.), stable numériquement
+        mean_b = float(y.mean())
+        m2_b = float(((y - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.y_mean
+        self.y_m2 += m2_b + delta * delta * self.n * n_b / n
+        self.y_mean += delta * n_b / n
+        self.n = n
+
+    def metrics(self) -> Dict[str, float]:
+        if self.n == 0:
+            return {"r2": np.nan, "mse": np.nan, "mae": np.nan}
+        return {
+            "r2": 1.0 - self.sse / self.y_m2 if self.y_m2 > 0 else np.nan,
+            "mse": self.sse / self.n,
+            "mae": self.sae / self.n,
+        }
+
+
+def _expand(X: np.ndarray, polys: Dict[Optional[int], Optional[PolynomialFeatures]]) -> Dict[Optional[int], np.ndarray]:
+    """Expansions polynomiales d'un bloc, une seule fois par degré utilisé."""
+    return {degree: X if poly is None else poly.transform(X) for degree, poly in polys.items()}
+
+
+def fit_out_of_core(
+    chunks: Iterable[pd.DataFrame], specs: List[CandidateSpec], training: Dict[str, Any]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, float]], List[str]]:
+    """
+    Ajuster en deux passes les candidats de la famille linéaire.
+
+    Args:
+        chunks: Données nettoyées, ré-itérables par blocs
+        specs: Candidats déclarés
+        training: Paramètres ``training``
+
+    Returns:
+        Résultats de test par candidat (modèle scikit-learn, transformation
+        polynomiale, métriques, nombre de lignes ``n``), métriques
+        d'entraînement par candidat (avec ``n``) et
+        noms des candidats ignorés car non linéaires
+    """
+    features = training["features"]
+    target = training["target"]
+    test_size = training["test_size"]
+    seed = training["random_state"]
+
+    models: Dict[str, Tuple[CandidateSpec, NormalEquationRegressor]] = {}
+    skipped = []
+    for spec in specs:
+        model = normal_equations_equivalent(spec)
+        if model is None:
+            skipped.append(spec.name)
+        else:
+            models[spec.name] = (spec, model)
+
+    polys: Dict[Optional[int], Optional[PolynomialFeatures]] = {}
+    for spec, _ in models.values():
+        if spec.poly_degree and spec.poly_degree not in polys:
+            # PolynomialFeatures ne dépend que du nombre de features
+            polys[spec.poly_degree] = PolynomialFeatures(degree=spec.poly_degree, include_bias=False).fit(
+                np.zeros((1, len(features)))
+            )
+        elif not spec.poly_degree:
+            polys[None] = None
+
+    # Passe 1 : statistiques suffisantes sur les lignes d'entraînement
+    start = 0
+    for chunk in chunks:
+        X = chunk[features].to_numpy(dtype=np.float64)
+        y = chunk[target].to_numpy(dtype=np.float64)
+        train = ~test_mask(start, len(chunk), test_size, seed)
+        start += len(chunk)
+        expanded = _expand(X[train], polys)
+        for spec, model in models.values():
+            model.partial_fit(expanded[spec.poly_degree or None], y[train])
+
+    # Passe 2 : une prédiction par bloc et par candidat, répartie entre train et test
+    test_scores = {name: StreamingMetrics() for name in models}
+    train_scores = {name: StreamingMetrics() for name in models}
+    start = 0
+    for chunk in chunks:
+        X = chunk[features].to_numpy(dtype=np.float64)
+        y = chunk[target].to_numpy(dtype=np.float64)
+        test = test_mask(start, len(chunk), test_size, seed)
+        start += len(chunk)
+        expanded = _expand(X, polys)
+        for name, (spec, model) in models.items():
+            y_pred = model.predict(expanded[spec.poly_degree or None])
+            test_scores[name].update(y[test], y_pred[test])
+            train_scores[name].update(y[~test], y_pred[~test])
+
+    results = {
+        name: {
+            "model": model.to_sklearn(),
+            "poly": polys.get(spec.poly_degree or None),
+            **test_scores[name].metrics(),
+            "n": test_scores[name].n,
+        }
+        for name, (spec, model) in models.items()
+    }
+    train_metrics = {name: {**score.metrics(), "n": score.n} for name, score in train_scores.items()}
+    return results, train_metrics, skipped
@@ -3,10 +3,12 @@
 from kedro.pipeline import Pipeline, node
 from .nodes import (
     load_weather_data,
+    profile_weather_data,
     clean_weather_data,
+    build_features,
     train_model,
-    save_model,
-    save_metrics,
+    export_compact_model,
+    archive_run_artifacts,
 )
 from .reporting import generate_model_report
 
@@ -15,6 +17,12 @@ def create_pipeline(**kwargs) -> Pipeline:
     """
     Créer le pipeline de traitement des données météo.
     
+    Les branches indépendantes (profil de qualité, export compact, archive
+    des artefacts, rapport)
+    ne partagent que des datasets persistés (Arrow IPC projeté en mémoire,
+    ou sources par blocs en mode streaming) : le pipeline peut être exécuté
+    avec ``--runner ThreadRunner`` ou ``--runner ParallelRunner``.
+    
     Returns:
         Pipeline Kedro complet
     """
@@ -27,38 +35,54 @@ def create_pipeline(**kwargs) -> Pipeline:
                 outputs="loaded_data",
                 name="load_weather_data_node",
             ),
+            # Node 1 bis: Profiler la qualité des données brutes
+            node(
+                func=profile_weather_data,
+                inputs=["loaded_data", "params:cleaning", "params:profiling"],
+                outputs="data_quality_profile",
+                name="profile_weather_data_node",
+            ),
             # Node 2: Nettoyer les données
             node(
                 func=clean_weather_data,
-                inputs="loaded_data",
-                outputs="cleaned_weather_data",
+                inputs=["loaded_data", "params:cleaning"],
+                outputs=["cleaned_weather_data", "cleaning_report"],
                 name="clean_weather_data_node",
             ),
-            # Node 3: Entraîner le modèle
+            # Node 2 bis: Ajouter les features temporelles (table persistante,
+            # étendue aux seules lignes nouvelles)
+            node(
+                func=build_features,
+                inputs=["cleaned_weather_data", "feature_store", "params:feature_engineering"],
+                outputs=["weather_features", "feature_store_updated"],
+                name="build_features_node",
+            ),
+            # Node 3: Entraîner le modèle (sorties séparées : modèle, métriques,
+            # prédictions hors pli)
             node(
                 func=train_model,
-                inputs="cleaned_weather_data",
-                outputs="training_results",
+                inputs=["weather_features", "params:training", "params:training_cache", "params:feature_engineering"],
+                outputs=["trained_model", "metrics", "cv_predictions"],
                 name="train_model_node",
             ),
-            # Node 4: Sauvegarder le modèle
+            # Node 4: Exporter la forêt en tableaux compacts (si elle est retenue)
             node(
-                func=save_model,
-                inputs="training_results",
-                outputs="trained_model",
-                name="save_model_node",
+                func=export_compact_model,
+                inputs="trained_model",
+                outputs="compact_model",
+                name="export_compact_model_node",
             ),
-            # Node 5: Sauvegarder les métriques
+            # Node 4 bis: Archiver le modèle et les métriques sous l'identifiant du run
             node(
-                func=save_metrics,
-                inputs="training_results",
-                outputs="metrics",
-                name="save_metrics_node",
+                func=archive_run_artifacts,
+                inputs=["trained_model", "metrics"],
+                outputs="run_artifacts",
+                name="archive_run_artifacts_node",
             ),
-            # Node 6: Générer le rapport visuel
+            # Node 5: Générer le rapport visuel
             node(
                 func=generate_model_report,
-                inputs="metrics",
+                inputs=["metrics", "params:reporting"],
                 outputs=None,
                 name="generate_report_node",
             ),
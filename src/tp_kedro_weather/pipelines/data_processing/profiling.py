@@ -0,0 +1,313 @@
+"""Profil de qualité des données par esquisses fusionnables.
+
+Le profil est calculé en une seule passe, bloc par bloc, en mémoire bornée :
+
+- compteurs de manquants, de sentinelles (par valeur), de valeurs non
+  numériques et hors plage valide ;
+- min, max, moyenne et variance (Welford, fusion de Chan) ;
+- quantiles approchés (esquisse KLL) ;
+- nombre approché de valeurs distinctes (HyperLogLog).
+
+Chaque esquisse a une méthode ``merge`` : les profils de blocs ou de
+partitions calculés séparément (éventuellement dans d'autres processus) se
+combinent sans relire les données. Les valeurs sont profilées après
+conversion mais avant bornage et imputation, pour décrire les données brutes.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cleaning import ColumnSpec, coerce_column, raw_token_counts
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+# Finaliseur de splitmix64
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    return z ^ (z >> np.uint64(31))
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Nombre de bits significatifs de chaque entier non signé (0 pour 0)."""
+    x = x.copy()
+    n = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x >= np.uint64(1 << shift)
+        n += shift * high
+        x = np.where(high, x >> np.uint64(shift), x)
+    return n + (x > 0)
+
+
+class Moments:
+    """Effectif, min, max, moyenne et somme des carrés des écarts (Welford / Chan)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        other = Moments()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        centered = values - other.mean
+        other.m2 = float(centered @ centered)
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self.merge(other)
+
+    def merge(self, other: "Moments") -> "Moments":
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+
+class KLLSketch:
+    """
+    Esquisse KLL de quantiles.
+
+    Une pile de compacteurs : quand le niveau ``h`` dépasse sa capacité, il
+    est trié et une valeur sur deux (décalage aléatoire) monte au niveau
+    ``h + 1``, où chaque valeur pèse ``2**(h + 1)``. Les capacités décroissent
+    géométriquement (facteur 2/3) vers les niveaux bas : la taille reste
+    en O(k) et l'erreur de rang en O(1/k), quel que soit le nombre de valeurs.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Un nombre impair d'éléments : le dernier reste à ce niveau
+                keep, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+                promoted = items[int(self._rng.integers(2))::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                # Les capacités dépendent du nombre de niveaux : on reprend depuis le bas
+                level = 0
+                continue
+            level += 1
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Quantiles approchés (NaN si l'esquisse est vide)."""
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return [math.nan] * len(qs)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        ranks = np.asarray(qs, dtype=np.float64) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, ranks, side="left"), len(items) - 1)
+        return [float(value) for value in items[order][positions]]
+
+
+class HyperLogLog:
+    """Nombre approché de valeurs distinctes (HyperLogLog, 2**p registres)."""
+
+    def __init__(self, p: int = 12):
+        if not 4 <= p <= 18:
+            raise ValueError(f"La précision HyperLogLog doit être comprise entre 4 et 18, reçu {p}")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)] + 0.0  # -0.0 et 0.0 : même valeur
+        if len(values) == 0:
+            return
+        hashes = _mix64(values.view(np.uint64))
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes << np.uint64(self.p)
+        # Rang du premier bit à 1 dans les 64 - p bits restants
+        rank = np.minimum(64 - _bit_length(rest) + 1, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.p != self.p:
+            raise ValueError(f"Précisions HyperLogLog différentes : {self.p} et {other.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # Petites cardinalités : comptage linéaire des registres vides
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return raw
+
+
+class ColumnProfile:
+    """Compteurs et esquisses d'une colonne."""
+
+    def __init__(self, spec: ColumnSpec, kll_k: int = 200, hll_precision: int = 12):
+        self.spec = spec
+        self.missing = 0
+        self.invalid = 0
+        self.non_finite = 0
+        self.out_of_range = 0
+        self.sentinels = {sentinel: 0 for sentinel in spec.sentinels}
+        self.moments = Moments()
+        self.quantiles = KLLSketch(kll_k)
+        self.distinct = HyperLogLog(hll_precision)
+
+    def update(self, series: pd.Series, loaded: Optional[Tuple[Dict[str, int], int]] = None) -> None:
+        """
+        Profiler un bloc de la colonne.
+
+        Args:
+            series: Valeurs brutes du bloc
+            loaded: Sentinelles et valeurs invalides déjà rendues nulles au
+                chargement (``raw_token_counts``)
+        """
+        values, is_sentinel, n_invalid = coerce_column(series, self.spec)
+        if is_sentinel is not None and is_sentinel.any():
+            for sentinel, count in series[is_sentinel].value_counts().items():
+                self.sentinels[sentinel] += int(count)
+        if loaded is not None:
+            for sentinel, count in loaded[0].items():
+                self.sentinels[sentinel] = self.sentinels.get(sentinel, 0) + count
+            n_invalid += loaded[1]
+        self.invalid += n_invalid
+        values = values[~np.isnan(values)].astype(np.float64, copy=False)
+        self.missing += len(series) - len(values)
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.non_finite += int(len(values) - finite.sum())
+            values = values[finite]
+        low, high = self.spec.valid_range
+        self.out_of_range += int(np.count_nonzero((values < low) | (values > high)))
+        self.moments.update(values)
+        self.quantiles.update(values)
+        self.distinct.update(values)
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        self.missing += other.missing
+        self.invalid += other.invalid
+        self.non_finite += other.non_finite
+        self.out_of_range += other.out_of_range
+        for sentinel, count in other.sentinels.items():
+            self.sentinels[sentinel] = self.sentinels.get(sentinel, 0) + count
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        return self
+
+    def report(self, quantiles: Sequence[float]) -> Dict[str, Any]:
+        moments = self.moments
+        variance = moments.variance()
+
+        def finite_or_none(value: float) -> Optional[float]:
+            return float(value) if math.isfinite(value) else None
+
+        return {
+            "count": int(moments.count),
+            "missing": int(self.missing),
+            "sentinels": {str(key): int(value) for key, value in self.sentinels.items()},
+            "invalid": int(self.invalid),
+            "non_finite": int(self.non_finite),
+            "out_of_range": int(self.out_of_range),
+            "min": finite_or_none(moments.min),
+            "max": finite_or_none(moments.max),
+            "mean": finite_or_none(moments.mean) if moments.count else None,
+            "variance": finite_or_none(variance),
+            "std": finite_or_none(math.sqrt(variance)) if math.isfinite(variance) else None,
+            "quantiles": {
+                f"p{round(q * 100):02d}": finite_or_none(value)
+                for q, value in zip(quantiles, self.quantiles.quantiles(quantiles))
+            },
+            "distinct_approx": int(round(self.distinct.estimate())),
+        }
+
+
+class DataProfile:
+    """Profil de toutes les colonnes du schéma, fusionnable."""
+
+    def __init__(self, specs: List[ColumnSpec], kll_k: int = 200, hll_precision: int = 12):
+        self.n_rows = 0
+        self.columns = {spec.name: ColumnProfile(spec, kll_k, hll_precision) for spec in specs}
+
+    @classmethod
+    def from_params(cls, specs: List[ColumnSpec], profiling: Dict[str, Any]) -> "DataProfile":
+        """Construire un profil vide à partir des paramètres ``profiling``."""
+        return cls(specs, int(profiling.get("kll_k", 200)), int(profiling.get("hll_precision", 12)))
+
+    def update(self, chunk: pd.DataFrame) -> "DataProfile":
+        self.n_rows += len(chunk)
+        for name, column in self.columns.items():
+            column.update(chunk[name], raw_token_counts(chunk, column.spec))
+        return self
+
+    def merge(self, other: "DataProfile") -> "DataProfile":
+        self.n_rows += other.n_rows
+        for name, column in self.columns.items():
+            column.merge(other.columns[name])
+        return self
+
+    def report(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """Rapport structuré, sérialisable en JSON."""
+        return {
+            "n_rows": int(self.n_rows),
+            "columns": {name: column.report(quantiles) for name, column in self.columns.items()},
+        }
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], specs: List[ColumnSpec], profiling: Dict[str, Any]) -> DataProfile:
+    """Profiler des blocs en une passe."""
+    profile = DataProfile.from_params(specs, profiling)
+    for chunk in chunks:
+        profile.update(chunk)
+    return profile
@@ -1,15 +1,148 @@
-"""Nodes pour la génération de rapports et visualisations."""
+"""Nodes pour la génération de rapports et visualisations.
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-from typing import Dict, Any
+Le rendu n'est refait que si les métriques (ou ce module) ont changé depuis
+le dernier rapport, et il tourne par défaut dans un processus détaché pour
+ne pas retarder la fin du ``kedro run``. La figure utilise l'API objet de
+matplotlib (``Figure`` + canevas Agg), sans état global ``pyplot``, ce qui
+permet plusieurs rendus concurrents ; matplotlib n'est importé qu'au rendu.
+
+Exécuté comme module, il rend le rapport à partir d'un fichier de
+métriques JSON (utilisé par le rendu en arrière-plan) ::
+
+    python -m tp_kedro_weather.pipelines.data_processing.reporting metrics.json data/08_reporting
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from importlib.metadata import version
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
+REPORT_DIR = Path("data/08_reporting")
+PNG_NAME = "model_performance_report.png"
+HTML_NAME = "model_performance_report.html"
+FINGERPRINT_NAME = "model_performance_report.fingerprint"
+PENDING_NAME = "model_performance_report.pending"
+LOG_NAME = "model_performance_report.log"
+# Erreur du dernier rendu en arrière-plan, affichée par le run suivant
+ERROR_NAME = "model_performance_report.error"
+# Au-delà, un rendu en cours est considéré comme abandonné
+_PENDING_TIMEOUT_S = 600
+
+
+def report_fingerprint(metrics: Dict[str, Any]) -> str:
+    """Empreinte des entrées du rapport : métriques, code de ce module et version de matplotlib."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(metrics, sort_keys=True, default=str).encode())
+    digest.update(Path(__file__).read_bytes())
+    # Version lue dans les métadonnées : pas d'import de matplotlib si le rapport est à jour
+    digest.update(version('matplotlib').encode())
+    return digest.hexdigest()
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding='utf-8').strip()
+    except OSError:
+        return ''
+
+
+def _write_atomically(path: Path, write) -> None:
+    """Écrire via un fichier temporaire renommé : un lecteur ne voit jamais de fichier partiel."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def generate_model_report(metrics: Dict[str, Any], reporting: Dict[str, Any]) -> None:
+    """
+    Générer un rapport visuel des performances du modèle, si nécessaire.
+    
+    Le rapport existant est réutilisé si son empreinte correspond aux
+    métriques actuelles (ou si un rendu identique est déjà en cours), sauf
+    avec ``reporting.force``. Sinon,
+    avec ``reporting.background``, le rendu est confié à un processus
+    détaché (journal dans ``model_performance_report.log``) et le node rend
+    la main immédiatement. Si ce rendu a échoué, l'erreur est affichée au
+    run suivant, qui relance le rendu.
+    
+    Args:
+        metrics: Dictionnaire contenant les métriques du modèle
+        reporting: Paramètres ``reporting``
+    """
+    output_dir = Path(reporting.get('output_dir', REPORT_DIR))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fingerprint = report_fingerprint(metrics)
+    
+    error_path = output_dir / ERROR_NAME
+    error = _read_text(error_path)
+    if error:
+        print(f"\n[ERREUR] Le dernier rendu du rapport en arrière-plan a échoué :\n{error}")
+        error_path.unlink(missing_ok=True)
+    
+    up_to_date = (
+        _read_text(output_dir / FINGERPRINT_NAME) == fingerprint
+        and (output_dir / PNG_NAME).exists()
+        and (output_dir / HTML_NAME).exists()
+    )
+    if not reporting.get('force', False) and (up_to_date or _rendering(output_dir, fingerprint)):
+        print(f"\n[OK] Rapport inchangé ({fingerprint[:12]}) : {output_dir / HTML_NAME}")
+        return
+    
+    if not reporting.get('background', True):
+        render_model_report(metrics, output_dir, fingerprint)
+        return
+    
+    # Métriques transmises au processus de rendu par un fichier JSON
+    fd, metrics_path = tempfile.mkstemp(dir=output_dir, prefix=".metrics.", suffix=".json")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, default=str)
+    (output_dir / PENDING_NAME).write_text(fingerprint, encoding='utf-8')
+    with open(output_dir / LOG_NAME, 'ab') as log:
+        subprocess.Popen(
+            [sys.executable, '-m', __name__, metrics_path, str(output_dir), fingerprint],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True,
+        )
+    print(f"\n[..] Rendu du rapport lancé en arrière-plan : {output_dir / HTML_NAME}")
+
+
+def _rendering(output_dir: Path, fingerprint: str) -> bool:
+    """Vrai si un rendu des mêmes entrées est en cours (et pas abandonné)."""
+    pending = output_dir / PENDING_NAME
+    try:
+        age = time.time() - pending.stat().st_mtime
+    except OSError:
+        return False
+    return age < _PENDING_TIMEOUT_S and _read_text(pending) == fingerprint
+
+
+def _split_sizes(metrics: Dict[str, Any]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Tailles réelles du découpage, ``None`` si absentes (métriques d'anciens runs)."""
+    n_train = metrics.get('n_train')
+    n_test = metrics.get('n_test')
+    if n_train is None or n_test is None:
+        return None, None, None
+    return n_train, n_test, n_train + n_test
 
-def generate_model_report(metrics: Dict[str, Any]) -> None:
+
+def render_model_report(metrics: Dict[str, Any], output_dir: Path, fingerprint: str) -> None:
     """
-    Générer un rapport visuel des performances du modèle.
+    Rendre le rapport visuel (PNG) et le rapport HTML.
     
     Crée 4 visualisations :
     1. MSE et R² Score (bar chart)
@@ -17,19 +150,30 @@ def generate_model_report(metrics: Dict[str, Any]) -> None:
     3. Feature Importance (horizontal bar)
     4. Résumé textuel
     
+    L'empreinte est écrite en dernier : elle ne désigne jamais un rapport
+    incomplet.
+    
     Args:
         metrics: Dictionnaire contenant les métriques du modèle
+        output_dir: Répertoire de sortie
+        fingerprint: Empreinte des entrées du rapport
     """
-    # Créer le dossier de sortie
-    output_dir = Path("data/08_reporting")
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    n_train, n_test, n_total = _split_sizes(metrics)
+    split_known = n_total is not None
+    
     # Créer une figure avec 4 sous-graphiques
-    fig = plt.figure(figsize=(16, 10))
+    fig = Figure(figsize=(16, 10))
+    FigureCanvasAgg(fig)
     fig.suptitle('Weather Model Performance Metrics', fontsize=20, fontweight='bold')
     
     # === Graphique 1: MSE et R² Score ===
-    ax1 = plt.subplot(2, 2, 1)
+    ax1 = fig.add_subplot(2, 2, 1)
     metrics_values = [metrics['mse_test'], abs(metrics['r2_test'])]
     metrics_names = ['MSE', 'R² Score']
     colors = ['#FF6B6B', '#4ECDC4']
@@ -47,23 +191,27 @@ def generate_model_report(metrics: Dict[str, Any]) -> None:
                 ha='center', va='bottom', fontweight='bold', fontsize=11)
     
     # === Graphique 2: Train/Test Split ===
-    ax2 = plt.subplot(2, 2, 2)
-    sizes = [80, 20]
-    labels = ['Train', 'Test']
-    colors_pie = ['#90EE90', '#FFA500']
-    explode = (0, 0.05)
-    
-    wedges, texts, autotexts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
-                                        autopct='%1.0f%%', shadow=True, startangle=90,
-                                        textprops={'fontsize': 12, 'fontweight': 'bold'})
+    ax2 = fig.add_subplot(2, 2, 2)
+    if split_known and n_total > 0:
+        sizes = [n_train, n_test]
+        labels = ['Train', 'Test']
+        colors_pie = ['#90EE90', '#FFA500']
+        explode = (0, 0.05)
+        
+        wedges, texts, autotexts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
+                                            autopct='%1.0f%%', shadow=True, startangle=90,
+                                            textprops={'fontsize': 12, 'fontweight': 'bold'})
+        
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(14)
+    else:
+        ax2.axis('off')
+        ax2.text(0.5, 0.5, 'Split not recorded', ha='center', va='center', fontsize=12)
     ax2.set_title('Train/Test Split Distribution', fontsize=14, fontweight='bold', pad=20)
     
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontsize(14)
-    
     # === Graphique 3: Feature Importance ===
-    ax3 = plt.subplot(2, 2, 3)
+    ax3 = fig.add_subplot(2, 2, 3)
     
     # Déterminer l'importance des features selon le type de modèle
     model_type = metrics.get('model_type', 'linear_regression')
@@ -88,7 +236,7 @@ def generate_model_report(metrics: Dict[str, Any]) -> None:
     ax3.grid(axis='x', alpha=0.3, linestyle='--')
     
     # === Graphique 4: Résumé Textuel ===
-    ax4 = plt.subplot(2, 2, 4)
+    ax4 = fig.add_subplot(2, 2, 4)
     ax4.axis('off')
     
     # Créer le texte du résumé
@@ -103,8 +251,8 @@ Performance:
 • MAE: {metrics.get('mae_test', 0):.4f}
 
 Data Split:
-• Training samples: 80
-• Test samples: 20
+• Training samples: {n_train if split_known else 'n/a'}
+• Test samples: {n_test if split_known else 'n/a'}
 
 Model Type: {model_type.replace('_', ' ').title()}
 Model Quality: {'Good' if metrics['r2_test'] > 0.5 else 'Needs Improvement'}
@@ -129,18 +277,29 @@ All Models Tested:
             family='monospace')
     
     # Ajuster l'espacement
-    plt.tight_layout(rect=[0, 0.03, 1, 0.96])
+    fig.tight_layout(rect=[0, 0.03, 1, 0.96])
     
     # Sauvegarder la figure
-    output_path = output_dir / "model_performance_report.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    output_path = output_dir / PNG_NAME
+    _write_atomically(output_path, lambda path: fig.savefig(
+        path, format='png', dpi=300, bbox_inches='tight', facecolor='white'
+    ))
     
     print(f"\n[OK] Rapport visuel genere : {output_path}")
     print(f"     Vous pouvez ouvrir ce fichier pour voir les visualisations.")
     
     # Générer aussi un rapport HTML interactif
     generate_html_report(metrics, output_dir)
+    
+    # Empreinte du rapport complet, puis fin du rendu en cours éventuel
+    _write_atomically(output_dir / FINGERPRINT_NAME, lambda path: Path(path).write_text(fingerprint, encoding='utf-8'))
+    _clear_pending(output_dir, fingerprint)
+
+
+def _clear_pending(output_dir: Path, fingerprint: str) -> None:
+    """Marquer la fin du rendu en cours, s'il s'agit bien de celui-ci."""
+    if _read_text(output_dir / PENDING_NAME) == fingerprint:
+        (output_dir / PENDING_NAME).unlink(missing_ok=True)
 
 
 def generate_html_report(metrics: Dict[str, Any], output_dir: Path) -> None:
@@ -151,6 +310,8 @@ def generate_html_report(metrics: Dict[str, Any], output_dir: Path) -> None:
         metrics: Dictionnaire contenant les métriques du modèle
         output_dir: Répertoire de sortie
     """
+    n_train, n_test, n_total = _split_sizes(metrics)
+    split_known = n_total is not None
     html_content = f"""
 <!DOCTYPE html>
 <html>
@@ -287,7 +448,12 @@ def generate_html_report(metrics: Dict[str, Any], output_dir: Path) -> None:
                 </tr>
 """
     
-    html_content += """
+    if split_known and n_total > 0:
+        split_text = f"{n_train / n_total:.0%} / {n_test / n_total:.0%} ({n_train} / {n_test})"
+    else:
+        split_text = 'n/a'
+    
+    html_content += f"""
             </tbody>
         </table>
     </div>
@@ -296,8 +462,8 @@ def generate_html_report(metrics: Dict[str, Any], output_dir: Path) -> None:
         <h2>ℹ️ Model Information</h2>
         <p><strong>Target Variable:</strong> temperature</p>
         <p><strong>Features:</strong> humidity, wind_speed</p>
-        <p><strong>Train/Test Split:</strong> 80% / 20%</p>
-        <p><strong>Total Samples:</strong> 100</p>
+        <p><strong>Train/Test Split:</strong> {split_text}</p>
+        <p><strong>Total Samples:</strong> {n_total if split_known else 'n/a'}</p>
     </div>
     
     <footer style="text-align: center; margin-top: 40px; color: #7f8c8d; font-size: 12px;">
@@ -308,10 +474,28 @@ def generate_html_report(metrics: Dict[str, Any], output_dir: Path) -> None:
 """
     
     # Sauvegarder le rapport HTML
-    html_path = output_dir / "model_performance_report.html"
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    html_path = output_dir / HTML_NAME
+    _write_atomically(html_path, lambda path: Path(path).write_text(html_content, encoding='utf-8'))
     
     print(f"[OK] Rapport HTML genere : {html_path}")
     print(f"     Ouvrez ce fichier dans votre navigateur pour un rapport interactif.")
 
+
+def _render_from_file(metrics_path: str, output_dir: str, fingerprint: str) -> None:
+    """Point d'entrée du processus de rendu en arrière-plan."""
+    try:
+        with open(metrics_path, encoding='utf-8') as f:
+            metrics = json.load(f)
+        render_model_report(metrics, Path(output_dir), fingerprint)
+    except Exception:
+        # Sans empreinte écrite, le run suivant affiche l'erreur et relance le rendu
+        _write_atomically(Path(output_dir) / ERROR_NAME,
+                          lambda path: Path(path).write_text(traceback.format_exc(), encoding='utf-8'))
+        _clear_pending(Path(output_dir), fingerprint)
+        raise
+    finally:
+        os.unlink(metrics_path)
+
+
+if __name__ == "__main__":
+    _render_from_file(*sys.argv[1:4])
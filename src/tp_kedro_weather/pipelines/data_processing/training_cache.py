@@ -0,0 +1,152 @@
+"""Cache sur disque des résultats d'entraînement, adressé par contenu.
+
+La clé combine un hash rapide des données d'entraînement, la configuration
+des modèles et les versions des bibliothèques : si rien n'a changé depuis un
+run précédent, les résultats d'entraînement sont relus au lieu d'être
+recalculés. Le cache est borné en taille avec éviction LRU.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import platform
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+import tp_kedro_weather
+
+_INDEX_FILE = "index.json"
+
+
+def _library_versions() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "tp_kedro_weather": tp_kedro_weather.__version__,
+    }
+
+
+def fingerprint(frames: Iterable[pd.DataFrame], config: Dict[str, Any]) -> str:
+    """
+    Calculer la clé de cache d'un entraînement.
+
+    Les colonnes sont hachées directement depuis leurs buffers NumPy
+    (BLAKE2b), sans sérialisation intermédiaire ; les données par blocs sont
+    hachées bloc par bloc.
+
+    Args:
+        frames: Données d'entraînement (colonnes utilisées uniquement), en un
+            ou plusieurs blocs
+        config: Configuration de l'entraînement
+
+    Returns:
+        Empreinte hexadécimale
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps({"config": config, "versions": _library_versions()}, sort_keys=True, default=str).encode())
+    for df in frames:
+        for column in df.columns:
+            values = np.ascontiguousarray(df[column].to_numpy())
+            digest.update(f"{column}:{values.dtype.str}:{values.shape}".encode())
+            digest.update(memoryview(values).cast("B"))
+    return digest.hexdigest()
+
+
+class TrainingCache:
+    """
+    Magasin LRU de résultats d'entraînement sérialisés.
+
+    Un fichier ``index.json`` garde, pour chaque entrée, sa taille et sa date
+    de dernier accès, ainsi que les compteurs de hits et de misses.
+    """
+
+    def __init__(self, directory: str, max_size_mb: float = 512):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index = self._read_index()
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> Optional["TrainingCache"]:
+        """Construire le cache à partir des paramètres ``training_cache`` (``None`` si désactivé)."""
+        if not params.get("enabled", True):
+            return None
+        cache = cls(params["directory"], params.get("max_size_mb", 512))
+        if params.get("invalidate", False):
+            cache.clear()
+        return cache
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Compteurs cumulés et occupation du cache."""
+        return {
+            "hits": self._index["hits"],
+            "misses": self._index["misses"],
+            "entries": len(self._index["entries"]),
+            "size_bytes": sum(entry["size"] for entry in self._index["entries"].values()),
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """Relire une entrée ; ``None`` en cas de miss."""
+        entry = self._index["entries"].get(key)
+        path = self.directory / f"{key}.pkl"
+        if entry is None or not path.exists():
+            self._index["entries"].pop(key, None)
+            self._index["misses"] += 1
+            self._write_index()
+            return None
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+        entry["last_access"] = time.time()
+        self._index["hits"] += 1
+        self._write_index()
+        return payload
+
+    def put(self, key: str, payload: Any) -> None:
+        """Enregistrer une entrée puis évincer les moins récemment utilisées."""
+        path = self.directory / f"{key}.pkl"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._index["entries"][key] = {"size": path.stat().st_size, "last_access": time.time()}
+        self._evict()
+        self._write_index()
+
+    def clear(self) -> None:
+        """Invalider tout le cache (les compteurs sont conservés)."""
+        for key in list(self._index["entries"]):
+            (self.directory / f"{key}.pkl").unlink(missing_ok=True)
+        self._index["entries"] = {}
+        self._write_index()
+
+    def _evict(self) -> None:
+        entries = self._index["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries.pop(key)["size"]
+            (self.directory / f"{key}.pkl").unlink(missing_ok=True)
+
+    def _read_index(self) -> Dict[str, Any]:
+        path = self.directory / _INDEX_FILE
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        return {"hits": 0, "misses": 0, "entries": {}}
+
+    def _write_index(self) -> None:
+        path = self.directory / _INDEX_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
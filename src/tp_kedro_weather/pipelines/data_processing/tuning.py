@@ -0,0 +1,259 @@
+"""Recherche d'hyperparamètres par successive halving / Hyperband.
+
+Chaque candidat peut déclarer un espace de recherche (clé ``search`` de
+``training.candidates``). Des configurations sont tirées au hasard, évaluées
+par validation croisée sur une fraction des lignes d'entraînement, puis les
+meilleures (``1 / eta``) sont promues sur ``eta`` fois plus de lignes,
+jusqu'au jeu complet. Hyperband enchaîne plusieurs de ces tournois, du plus
+agressif (beaucoup de configurations, peu de lignes) au plus prudent.
+
+Les plis de validation croisée (les mêmes que pour la sélection, voir
+``evaluation``) et l'ordre de sous-échantillonnage sont calculés une seule
+fois et partagés en mémoire avec les workers, comme les tableaux
+d'entraînement. Toutes les évaluations d'un palier (tous candidats,
+configurations et plis confondus) sont soumises ensemble au pool de
+processus. Le budget (temps réel et/ou temps CPU) est vérifié entre deux
+paliers : une fois épuisé, la meilleure configuration du palier le plus
+élevé atteint est retenue.
+
+Le jeu de test n'est jamais utilisé : il reste réservé à l'évaluation finale
+dans ``train_model``.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .evaluation import Folds, single_threaded
+from .models import CandidateSpec, fit_candidate, load_shared, shared_arrays
+
+# Distributions acceptées dans un espace de recherche
+DISTRIBUTIONS = ("choice", "uniform", "log_uniform", "int", "log_int")
+
+
+@dataclass
+class Budget:
+    """Budget de recherche : temps réel et/ou temps CPU cumulé des évaluations."""
+
+    wall_seconds: Optional[float] = None
+    cpu_seconds: Optional[float] = None
+    started: float = field(default_factory=time.perf_counter)
+    cpu_used: float = 0.0
+
+    @property
+    def wall_used(self) -> float:
+        return time.perf_counter() - self.started
+
+    def exhausted(self) -> bool:
+        return (
+            (self.wall_seconds is not None and self.wall_used >= self.wall_seconds)
+            or (self.cpu_seconds is not None and self.cpu_used >= self.cpu_seconds)
+        )
+
+
+def sample_config(space: Dict[str, Dict[str, Any]], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Tirer une configuration dans un espace de recherche.
+
+    Chaque paramètre est décrit par une seule distribution :
+    ``{choice: [...]}``, ``{uniform: [a, b]}``, ``{log_uniform: [a, b]}``,
+    ``{int: [a, b]}`` ou ``{log_int: [a, b]}`` (bornes incluses).
+
+    Args:
+        space: Espace de recherche (clé ``search`` d'un candidat)
+        rng: Générateur aléatoire
+
+    Returns:
+        Valeur tirée pour chaque paramètre
+    """
+    config = {}
+    for name, distribution in space.items():
+        if not isinstance(distribution, dict) or len(distribution) != 1:
+            raise ValueError(f"Espace de recherche invalide pour '{name}' : une distribution parmi {DISTRIBUTIONS}")
+        (kind, values), = distribution.items()
+        if kind == "choice":
+            config[name] = values[int(rng.integers(len(values)))]
+        elif kind == "uniform":
+            config[name] = float(rng.uniform(values[0], values[1]))
+        elif kind == "log_uniform":
+            config[name] = float(math.exp(rng.uniform(math.log(values[0]), math.log(values[1]))))
+        elif kind == "int":
+            config[name] = int(rng.integers(values[0], values[1] + 1))
+        elif kind == "log_int":
+            value = math.exp(rng.uniform(math.log(values[0]), math.log(values[1] + 1)))
+            config[name] = int(min(max(int(value), values[0]), values[1]))
+        else:
+            raise ValueError(f"Distribution inconnue pour '{name}' : '{kind}' (attendu : {DISTRIBUTIONS})")
+    return config
+
+
+def brackets(max_rows: int, min_rows: int, eta: int, n_configs: int, method: str) -> List[List[Tuple[int, int]]]:
+    """
+    Paliers ``(nombre de configurations, lignes)`` de chaque tournoi.
+
+    ``successive_halving`` : un seul tournoi de ``n_configs`` configurations.
+    ``hyperband`` : un tournoi par niveau de sous-échantillonnage de départ.
+    """
+    if eta < 2:
+        raise ValueError(f"eta doit être au moins 2, reçu {eta}")
+    min_rows = max(1, min(min_rows, max_rows))
+    s_max = int(math.floor(math.log(max_rows / min_rows, eta) + 1e-9))
+    if method == "successive_halving":
+        starts = [(n_configs, s_max)]
+    elif method == "hyperband":
+        starts = [(int(math.ceil((s_max + 1) / (s + 1) * eta ** s)), s) for s in range(s_max, -1, -1)]
+    else:
+        raise ValueError(f"Méthode de recherche inconnue : '{method}' (successive_halving ou hyperband)")
+
+    plans = []
+    for n, s in starts:
+        rungs = []
+        for i in range(s + 1):
+            n_i = max(1, n // eta ** i)
+            rows = max_rows if i == s else max(min_rows, int(max_rows / eta ** (s - i)))
+            rungs.append((n_i, rows))
+        plans.append(rungs)
+    return plans
+
+
+def _evaluate(spec: CandidateSpec, source: Any, fold: int, rows: int) -> Tuple[float, float]:
+    """
+    R² de validation d'une configuration sur un pli, et temps CPU consommé.
+
+    ``source`` est le répertoire partagé (dans un worker) ou le dictionnaire
+    des tableaux (exécution séquentielle).
+    """
+    cpu_start = time.process_time()
+    get = source.__getitem__ if isinstance(source, dict) else partial(load_shared, source)
+    X, y, rank, positions = get("X"), get("y"), get("rank"), get("rows")
+    train, validation = get(f"train_{fold}"), get(f"validation_{fold}")
+    # Sous-échantillon emboîté : les lignes de plus petit rang d'un ordre fixé
+    train = positions[train[rank[train] < rows]]
+    validation = positions[validation]
+    result = fit_candidate(spec, (X[train], X[validation], y[train], y[validation]))
+    return result["r2"], time.process_time() - cpu_start
+
+
+def tune_candidates(
+    specs: List[CandidateSpec],
+    X: np.ndarray,
+    y: np.ndarray,
+    tuning: Dict[str, Any],
+    folds: Folds,
+    n_workers: Optional[int] = None,
+    rows: Optional[np.ndarray] = None,
+) -> Tuple[List[CandidateSpec], Dict[str, Dict[str, Any]]]:
+    """
+    Rechercher les hyperparamètres des candidats qui déclarent un espace.
+
+    Args:
+        specs: Candidats (clé ``search`` vide : paramètres inchangés)
+        X: Features
+        y: Cible
+        tuning: Paramètres ``training.tuning``
+        folds: Plis de validation croisée partagés (``evaluation.make_folds``),
+            en positions dans ``rows``
+        n_workers: Nombre de processus (``None`` : nombre de cœurs)
+        rows: Lignes de ``X`` et ``y`` à utiliser (le jeu d'entraînement),
+            toutes par défaut
+
+    Returns:
+        Candidats avec leurs meilleurs paramètres, et résumé de la recherche
+        par candidat recherché (paramètres retenus, R² de validation croisée,
+        lignes, évaluations)
+    """
+    searched = [spec for spec in specs if spec.search]
+    if not searched:
+        return specs, {}
+
+    budget = Budget(tuning.get("budget_seconds"), tuning.get("budget_cpu_seconds"))
+    eta = int(tuning.get("eta", 3))
+    n_splits = len(folds)
+    seed = int(tuning.get("random_state", 42))
+    rng = np.random.default_rng(seed)
+
+    rows = np.arange(len(y)) if rows is None else np.asarray(rows)
+    # Lignes comptées sur tout le jeu d'entraînement : au dernier palier, chaque pli garde toutes les siennes
+    max_rows = len(rows)
+    min_rows = int(tuning.get("min_rows", 500))
+    plans = brackets(max_rows, min_rows, eta, int(tuning.get("n_configs", 27)), tuning.get("method", "hyperband"))
+
+    arrays = {"X": X, "y": y, "rows": rows, "rank": np.random.default_rng(seed + 1).permutation(max_rows)}
+    for k, (train, validation) in enumerate(folds):
+        arrays[f"train_{k}"] = train
+        arrays[f"validation_{k}"] = validation
+
+    # Meilleur résultat par candidat : (lignes, R² moyen, configuration)
+    best: Dict[str, Tuple[int, float, Dict[str, Any]]] = {}
+    evaluations = {spec.name: 0 for spec in searched}
+    n_workers = n_workers or os.cpu_count() or 1
+
+    with shared_arrays(arrays) as data_dir:
+        pool = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+        try:
+            for b, rungs in enumerate(plans):
+                # Le premier tournoi évalue aussi les paramètres déclarés
+                population = {
+                    spec.name: ([{}] if b == 0 else [])
+                    + [sample_config(spec.search, rng) for _ in range(rungs[0][0] - (b == 0))]
+                    for spec in searched
+                }
+                for n_keep, n_rows in rungs:
+                    if budget.exhausted():
+                        break
+                    population = {name: configs[:n_keep] for name, configs in population.items()}
+                    tasks = {}
+                    for spec in searched:
+                        for c, config in enumerate(population[spec.name]):
+                            for k in range(n_splits):
+                                candidate = single_threaded(spec, config)
+                                if pool is None:
+                                    tasks[spec.name, c, k] = _evaluate(candidate, arrays, k, n_rows)
+                                else:
+                                    tasks[spec.name, c, k] = pool.submit(_evaluate, candidate, data_dir, k, n_rows)
+
+                    scores: Dict[Tuple[str, int], List[float]] = {}
+                    for (name, c, k), task in tasks.items():
+                        r2, cpu = task if pool is None else task.result()
+                        budget.cpu_used += cpu
+                        scores.setdefault((name, c), []).append(r2)
+                        evaluations[name] += 1
+
+                    for spec in searched:
+                        configs = population[spec.name]
+                        means = [float(np.mean(scores[spec.name, c])) for c in range(len(configs))]
+                        order = sorted(range(len(configs)), key=lambda c: -means[c])
+                        population[spec.name] = [configs[c] for c in order]
+                        top = (n_rows, means[order[0]], configs[order[0]])
+                        if spec.name not in best or top[:2] > best[spec.name][:2]:
+                            best[spec.name] = top
+                        print(f"Recherche {spec.name} : tournoi {b + 1}/{len(plans)}, "
+                              f"{len(configs)} config. sur {n_rows} lignes, meilleur R² CV {means[order[0]]:.4f}")
+                if budget.exhausted():
+                    print(f"Budget de recherche épuisé ({budget.wall_used:.1f} s réel, {budget.cpu_used:.1f} s CPU)")
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    summary = {}
+    tuned = []
+    for spec in specs:
+        if spec.name in best:
+            n_rows, score, config = best[spec.name]
+            spec = replace(spec, params={**spec.params, **config})
+            summary[spec.name] = {
+                "params": config,
+                "cv_r2": score,
+                "cv_rows": n_rows,
+                "evaluations": evaluations[spec.name],
+            }
+        tuned.append(spec)
+    print(f"Recherche terminée en {budget.wall_used:.1f} s ({budget.cpu_used:.1f} s CPU, {n_splits} plis)")
+    return tuned, summary
@@ -0,0 +1,5 @@
+"""Pipeline d'entraînement d'un modèle par station (ou par région)."""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
@@ -0,0 +1,91 @@
+"""Nodes pour l'entraînement d'un modèle par groupe (station, région...).
+
+Les candidats de ``training.candidates`` sont ajustés sur chaque groupe :
+la famille linéaire pour tous les groupes en un seul calcul vectorisé, les
+autres candidats par lots de groupes dans un pool de processus (voir
+``data_processing.grouped_models``). Chaque groupe garde le candidat de
+meilleur R² sur ses propres lignes de test.
+
+Comme pour ``data_processing``, pandas et scikit-learn ne sont importés qu'à
+l'exécution des nodes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from tp_kedro_weather.datasets import FrameChunks
+    from ..data_processing.grouped_models import GroupedModels
+
+
+def train_grouped_models(
+    df: pd.DataFrame | FrameChunks,
+    training: Dict[str, Any],
+    grouping: Dict[str, Any],
+) -> Tuple[GroupedModels, pd.DataFrame]:
+    """
+    Entraîner et sélectionner un modèle par groupe.
+
+    Les lignes de test sont tirées ligne à ligne (proportion
+    ``training.test_size``), donc dans chaque groupe. Les groupes qui ont
+    moins de ``grouping.min_rows`` lignes d'entraînement sont ignorés.
+
+    Args:
+        df: Données nettoyées, avec la colonne ``grouping.key``
+        training: Paramètres ``training`` (features, cible, candidats, découpage)
+        grouping: Paramètres ``grouping`` (``key``, ``min_rows``,
+            ``candidates``, ``n_workers``)
+
+    Returns:
+        Modèles retenus par groupe et table des métriques de test
+        (une ligne par groupe et par candidat)
+    """
+    import numpy as np
+    import pandas as pd
+
+    from ..data_processing.grouped_models import GroupedModels, metrics_table, select_per_group, train_grouped
+    from ..data_processing.models import parse_candidates
+    from ..data_processing.nodes import _as_frame
+
+    key = grouping['key']
+    features = training['features']
+    target = training['target']
+    df = _as_frame(df, [key, *features, target])
+    if key not in df.columns:
+        raise ValueError(f"Colonne de groupe '{key}' absente des données (colonnes : {list(df.columns)})")
+
+    specs = parse_candidates(training['candidates'])
+    if grouping.get('candidates'):
+        specs = [spec for spec in specs if spec.name in grouping['candidates']]
+
+    min_rows = max(int(grouping.get('min_rows', 20)), 2)
+    codes, groups = pd.factorize(df[key], sort=True)
+    X = df[features].to_numpy(dtype=training.get('dtype'))
+    y = df[target].to_numpy()
+    is_test = np.random.default_rng(training['random_state']).random(len(y)) < training['test_size']
+
+    # Lignes sans groupe (code -1) et groupes trop petits : écartés avant
+    # l'ajustement, les codes sont renumérotés
+    n_train = np.bincount(codes[~is_test & (codes >= 0)], minlength=len(groups))
+    kept = n_train >= min_rows
+    if not kept.any():
+        raise ValueError(f"Aucun groupe n'a au moins {min_rows} lignes d'entraînement")
+    remap = np.cumsum(kept) - 1
+    rows = (codes >= 0) & kept[codes]
+    codes, X, y, is_test = remap[codes[rows]], X[rows], y[rows], is_test[rows]
+    groups, n_train = np.asarray(groups)[kept], n_train[kept]
+
+    models, metrics = train_grouped(specs, X, y, codes, len(groups), is_test, grouping.get('n_workers'))
+    selected = select_per_group(metrics)
+    table = metrics_table(groups, key, n_train, metrics, selected)
+
+    names = [spec.name for spec in specs]
+    print(f"\nGroupes : {len(groups)} entraînés, {int((~kept).sum())} ignorés (moins de {min_rows} lignes)")
+    for index, name in enumerate(names):
+        r2 = metrics[name]['r2']
+        print(f"  {name:<20} R² médian = {np.nanmedian(r2):.4f}  retenu pour {int((selected == index).sum())} groupes")
+
+    return GroupedModels(key, list(features), groups, names, selected, models), table
@@ -0,0 +1,42 @@
+"""Pipeline d'entraînement d'un modèle par groupe (station, région...)."""
+
+from kedro.pipeline import Pipeline, node
+from ..data_processing.nodes import clean_weather_data, load_weather_data
+from .nodes import train_grouped_models
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Créer le pipeline d'entraînement par groupe.
+
+    À lancer avec ``kedro run --pipeline grouped_training`` ; la colonne des
+    groupes est ``grouping.key``.
+
+    Returns:
+        Pipeline Kedro complet
+    """
+    return Pipeline(
+        [
+            # Node 1: Charger les données
+            node(
+                func=load_weather_data,
+                inputs="raw_weather_data",
+                outputs="grouped_loaded_data",
+                name="load_grouped_weather_data_node",
+            ),
+            # Node 2: Nettoyer les mesures (la colonne des groupes est conservée)
+            node(
+                func=clean_weather_data,
+                inputs=["grouped_loaded_data", "params:cleaning"],
+                outputs=["grouped_weather_data", "grouped_cleaning_report"],
+                name="clean_grouped_weather_data_node",
+            ),
+            # Node 3: Entraîner un modèle par groupe
+            node(
+                func=train_grouped_models,
+                inputs=["grouped_weather_data", "params:training", "params:grouping"],
+                outputs=["grouped_models", "group_metrics"],
+                name="train_grouped_models_node",
+            ),
+        ]
+    )
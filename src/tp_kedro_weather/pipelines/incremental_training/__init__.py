@@ -0,0 +1,5 @@
+"""Pipeline d'entraînement incrémental sur les lignes ajoutées au fichier brut."""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
@@ -0,0 +1,232 @@
+"""Nodes pour l'entraînement incrémental sur les lignes ajoutées au fichier brut.
+
+Comme pour ``data_processing``, NumPy et scikit-learn ne sont importés
+qu'à l'exécution des nodes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from tp_kedro_weather.datasets import CSVChunks
+    from ..data_processing.models import CandidateSpec
+
+
+def _config_key(cleaning: Dict[str, Any], training: Dict[str, Any]) -> str:
+    """Empreinte de la configuration : si elle change, l'état n'est plus réutilisable."""
+    config = {
+        "cleaning": cleaning,
+        "features": training["features"],
+        "target": training["target"],
+        "candidates": training["candidates"],
+    }
+    return hashlib.blake2b(json.dumps(config, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
+def _tail_checksum(raw: CSVChunks, offset: int, n_bytes: int) -> str:
+    """Hacher les ``n_bytes`` derniers octets déjà ingérés (sans relire tout le fichier)."""
+    start = max(offset - n_bytes, 0)
+    with open(raw.filepath, "rb") as f:
+        f.seek(start)
+        return hashlib.blake2b(f.read(offset - start), digest_size=16).hexdigest()
+
+
+def _watermark_problem(raw: CSVChunks, watermark: Dict[str, Any], n_bytes: int) -> Optional[str]:
+    """Raison pour laquelle le filigrane n'est plus valide, ou ``None``."""
+    if raw.filepath.stat().st_size < watermark["byte_offset"]:
+        return "fichier brut tronqué"
+    if raw.columns != watermark["header"]:
+        return "en-tête du fichier brut modifié"
+    if _tail_checksum(raw, watermark["byte_offset"], n_bytes) != watermark["tail_checksum"]:
+        return "lignes déjà ingérées modifiées"
+    return None
+
+
+def _incremental_estimator(spec: CandidateSpec) -> Optional[Any]:
+    """
+    Estimateur incrémental équivalent à un candidat.
+
+    La famille linéaire passe par les statistiques suffisantes
+    (``NormalEquationRegressor``), les estimateurs qui ont ``partial_fit``
+    sont utilisés tels quels ; les autres (arbres) sont ignorés.
+    """
+    from ..data_processing.models import resolve_estimator
+    from ..data_processing.normal_equations import normal_equations_equivalent
+
+    model = normal_equations_equivalent(spec)
+    if model is not None:
+        return model
+    estimator = resolve_estimator(spec.estimator)
+    if hasattr(estimator, "partial_fit"):
+        return estimator(**spec.params)
+    return None
+
+
+def _initial_state(cleaning: Dict[str, Any], training: Dict[str, Any]) -> Dict[str, Any]:
+    import numpy as np
+    from sklearn.preprocessing import PolynomialFeatures
+
+    from ..data_processing.cleaning import CleaningSummary, parse_schema
+    from ..data_processing.models import parse_candidates
+
+    models = {}
+    for spec in parse_candidates(training["candidates"]):
+        model = _incremental_estimator(spec)
+        if model is None:
+            print(f"Candidat '{spec.name}' ignoré : pas de mise à jour incrémentale possible")
+            continue
+        poly = None
+        if spec.poly_degree:
+            # PolynomialFeatures ne dépend que du nombre de features
+            poly = PolynomialFeatures(degree=spec.poly_degree, include_bias=False)
+            poly.fit(np.zeros((1, len(training["features"]))))
+        models[spec.name] = {"model": model, "poly": poly}
+    return {"watermark": None, "cleaning": CleaningSummary(parse_schema(cleaning)), "models": models, "scores": {}}
+
+
+def _is_fitted(model: Any) -> bool:
+    from sklearn.exceptions import NotFittedError
+    from sklearn.utils.validation import check_is_fitted
+
+    try:
+        check_is_fitted(model)
+    except NotFittedError:
+        return False
+    return True
+
+
+def update_model_incrementally(
+    raw: CSVChunks,
+    state: Optional[Dict[str, Any]],
+    incremental: Dict[str, Any],
+    cleaning: Dict[str, Any],
+    training: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Nettoyer les lignes ajoutées depuis le dernier run et mettre à jour les modèles.
+
+    L'état persistant contient un filigrane (position en octets, nombre de
+    lignes, empreinte de l'en-tête et des derniers octets ingérés), les
+    compteurs et moyennes d'imputation cumulés, et les modèles incrémentaux.
+    Seules les nouvelles lignes sont lues et nettoyées ; les moyennes
+    d'imputation intègrent les nouvelles lignes avant leur imputation.
+
+    Les métriques sont prequentielles : chaque bloc est prédit avant d'être
+    appris, ce qui donne une évaluation hors échantillon sans jeu de test.
+    Un modèle encore vierge (premier bloc) apprend d'abord le début du bloc,
+    puis la fin du bloc (``incremental.warmup_holdout``) est prédite avant
+    d'être apprise à son tour.
+    Les métriques d'entraînement mesurent l'erreur de chaque bloc juste après
+    son apprentissage. Les deux sont cumulées d'un run à l'autre dans l'état :
+    un run sans nouvelle ligne renvoie le modèle et les métriques précédents.
+
+    Un réentraînement complet est fait si ``incremental.full_retrain`` est
+    vrai, si la configuration a changé ou si le fichier brut a été réécrit.
+
+    Args:
+        raw: Fichier brut lu par blocs
+        state: État du run précédent (``None`` au premier run)
+        incremental: Paramètres ``incremental``
+        cleaning: Schéma de nettoyage (paramètres ``cleaning``)
+        training: Paramètres ``training``
+
+    Returns:
+        Résultats d'entraînement (même forme que ``train_model``) et nouvel état
+    """
+    import numpy as np
+
+    from ..data_processing.cleaning import clean_chunk, summarise_chunks
+    from ..data_processing.out_of_core import StreamingMetrics
+
+    checksum_bytes = incremental.get("tail_checksum_bytes", 1 << 20)
+    warmup_holdout = incremental.get("warmup_holdout", 0.2)
+    config_key = _config_key(cleaning, training)
+
+    reason = None
+    if state is None:
+        reason = "premier run"
+    elif incremental.get("full_retrain", False):
+        reason = "réentraînement complet demandé"
+    elif state["config_key"] != config_key:
+        reason = "configuration modifiée"
+    elif state["watermark"] is not None:
+        reason = _watermark_problem(raw, state["watermark"], checksum_bytes)
+    if reason is not None:
+        print(f"\nIngestion complète du fichier brut ({reason})")
+        state = {**_initial_state(cleaning, training), "config_key": config_key}
+
+    watermark = state["watermark"]
+    new_rows = raw.tail(watermark["byte_offset"] if watermark else 0)
+    specs = state["cleaning"].specs
+    features = training["features"]
+    target = training["target"]
+
+    # Passe 1 : compteurs et moyennes des nouvelles lignes, fusionnés avec l'état
+    new_summary = summarise_chunks(new_rows, specs)
+    if new_summary.n_rows == 0 and state.get("metrics") is not None:
+        # Rien d'ingéré : ne pas écraser les dernières métriques
+        print("Aucune nouvelle ligne : modèle et métriques du run précédent conservés")
+        best_entry = state["models"][state["metrics"]["model_type"]]
+        metrics = {**state["metrics"], "rows_new": 0}
+        return {"model": best_entry["model"], "metrics": metrics, "poly": best_entry["poly"]}, state
+    state["cleaning"].merge(new_summary)
+    fill_values = state["cleaning"].fill_values()
+
+    # Passe 2 : nettoyer chaque bloc, l'évaluer, l'apprendre puis mesurer l'ajustement
+    scores = state.setdefault("scores", {})
+    for name in state["models"]:
+        scores.setdefault(name, {"test": StreamingMetrics(), "train": StreamingMetrics()})
+    for chunk in new_rows:
+        chunk = clean_chunk(chunk, specs, fill_values)
+        X = chunk[features].to_numpy(dtype=np.float64)
+        y = chunk[target].to_numpy(dtype=np.float64)
+        for name, entry in state["models"].items():
+            X_model = X if entry["poly"] is None else entry["poly"].transform(X)
+            if _is_fitted(entry["model"]):
+                scores[name]["test"].update(y, entry["model"].predict(X_model))
+                entry["model"].partial_fit(X_model, y)
+            else:
+                # Rien à prédire avant le premier apprentissage : la fin du bloc
+                # sert d'évaluation, puis est apprise comme le reste
+                split = len(y) - int(len(y) * warmup_holdout)
+                entry["model"].partial_fit(X_model[:split], y[:split])
+                if split < len(y):
+                    scores[name]["test"].update(y[split:], entry["model"].predict(X_model[split:]))
+                    entry["model"].partial_fit(X_model[split:], y[split:])
+            scores[name]["train"].update(y, entry["model"].predict(X_model))
+
+    previous_rows = watermark["rows"] if watermark else 0
+    state["watermark"] = {
+        "byte_offset": new_rows.byte_range[1],
+        "rows": previous_rows + new_summary.n_rows,
+        "header": raw.columns,
+        "tail_checksum": _tail_checksum(raw, new_rows.byte_range[1], checksum_bytes),
+    }
+    print(f"Nouvelles lignes ingérées : {new_summary.n_rows} (total : {state['watermark']['rows']})")
+
+    all_models = {name: scores[name]["test"].metrics() for name in state["models"]}
+    best_model_name = max(all_models, key=lambda k: -np.inf if np.isnan(all_models[k]["r2"]) else all_models[k]["r2"])
+    best = all_models[best_model_name]
+    best_train = scores[best_model_name]["train"].metrics()
+    print(f"Meilleur modèle (prequentiel) : {best_model_name} (R² = {best['r2']:.4f})")
+
+    metrics = {
+        "model_type": best_model_name,
+        "mse_train": best_train["mse"],
+        "mse_test": best["mse"],
+        "mae_test": best["mae"],
+        "r2_train": best_train["r2"],
+        "r2_test": best["r2"],
+        "all_models": all_models,
+        # Évaluation prequentielle : toutes les lignes servent à l'entraînement
+        "n_train": state["watermark"]["rows"],
+        "n_test": 0,
+        "rows_seen": state["watermark"]["rows"],
+        "rows_new": new_summary.n_rows,
+    }
+    state["metrics"] = metrics
+    best_entry = state["models"][best_model_name]
+    return {"model": best_entry["model"], "metrics": metrics, "poly": best_entry["poly"]}, state
@@ -0,0 +1,47 @@
+"""Pipeline d'entraînement incrémental sur les lignes ajoutées au fichier brut."""
+
+from kedro.pipeline import Pipeline, node
+from ..data_processing.nodes import save_model, save_metrics
+from .nodes import update_model_incrementally
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Créer le pipeline d'entraînement incrémental.
+    
+    À lancer avec ``kedro run --pipeline incremental_training``.
+    
+    Returns:
+        Pipeline Kedro complet
+    """
+    return Pipeline(
+        [
+            # Node 1: Nettoyer les nouvelles lignes et mettre à jour les modèles
+            node(
+                func=update_model_incrementally,
+                inputs=[
+                    "raw_weather_stream",
+                    "incremental_state",
+                    "params:incremental",
+                    "params:cleaning",
+                    "params:training",
+                ],
+                outputs=["incremental_training_results", "incremental_state_updated"],
+                name="update_model_incrementally_node",
+            ),
+            # Node 2: Sauvegarder le modèle
+            node(
+                func=save_model,
+                inputs="incremental_training_results",
+                outputs="trained_model",
+                name="save_incremental_model_node",
+            ),
+            # Node 3: Sauvegarder les métriques
+            node(
+                func=save_metrics,
+                inputs="incremental_training_results",
+                outputs="metrics",
+                name="save_incremental_metrics_node",
+            ),
+        ]
+    )
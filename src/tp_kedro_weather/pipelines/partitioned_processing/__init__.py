@@ -0,0 +1,5 @@
+"""Pipeline de traitement des données brutes partitionnées (un fichier par jour)."""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
@@ -0,0 +1,140 @@
+"""Nodes pour le traitement des données brutes partitionnées.
+
+Chaque partition (un fichier CSV par jour et par livraison) est convertie et
+bornée indépendamment, dans un pool de processus, puis enregistrée avec son
+résumé de nettoyage (compteurs, somme exacte et effectif des moyennes) dans
+un manifeste. Aux runs suivants, seules les partitions nouvelles ou
+modifiées sont retraitées ; les valeurs d'imputation globales sont obtenues
+en fusionnant les résumés de toutes les partitions, sans relire les données.
+L'imputation est appliquée paresseusement, partition par partition, au
+moment de l'entraînement.
+
+Comme pour ``data_processing``, pandas n'est importé qu'à l'exécution des
+nodes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from tp_kedro_weather.datasets import CSVPartition, FrameChunks
+    from ..data_processing.cleaning import CleaningSummary, ColumnSpec
+
+
+def _schema_key(cleaning: Dict[str, Any]) -> str:
+    """Empreinte du schéma de nettoyage : s'il change, toutes les partitions sont retraitées."""
+    return hashlib.blake2b(json.dumps(cleaning, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
+def _clean_partition(partition: CSVPartition, specs: List[ColumnSpec]) -> Tuple[pd.DataFrame, CleaningSummary]:
+    from ..data_processing.cleaning import clip_frame
+
+    return clip_frame(partition.load(), specs)
+
+
+def clean_partitions(
+    partitions: Dict[str, CSVPartition],
+    manifest: Dict[str, Any],
+    cleaning: Dict[str, Any],
+    partitioning: Dict[str, Any],
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Any], Dict[str, Any]]:
+    """
+    Convertir et borner les partitions nouvelles ou modifiées, en parallèle.
+
+    Args:
+        partitions: Partitions brutes (``PartitionedCSVDataset``)
+        manifest: Manifeste du run précédent (``None`` au premier run)
+        cleaning: Schéma de nettoyage (paramètres ``cleaning``)
+        partitioning: Paramètres ``partitioning`` (``n_workers``)
+
+    Returns:
+        Partitions retraitées (converties et bornées, non imputées), manifeste
+        mis à jour et rapport des valeurs manquantes sur toutes les partitions
+    """
+    from ..data_processing.cleaning import CleaningSummary, parse_schema
+
+    specs = parse_schema(cleaning)
+    schema = _schema_key(cleaning)
+    previous = manifest['partitions'] if manifest and manifest.get('schema') == schema else {}
+
+    fingerprints = {partition_id: partition.fingerprint for partition_id, partition in partitions.items()}
+    todo = [
+        partition_id for partition_id, fingerprint in fingerprints.items()
+        if previous.get(partition_id, {}).get('fingerprint') != fingerprint
+    ]
+    removed = sorted(set(previous) - set(partitions))
+
+    n_workers = min(partitioning.get('n_workers') or os.cpu_count() or 1, len(todo))
+    clean = partial(_clean_partition, specs=specs)
+    if n_workers <= 1:
+        results = [clean(partitions[partition_id]) for partition_id in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(clean, [partitions[partition_id] for partition_id in todo]))
+
+    # Les partitions supprimées de l'entrée brute sortent du manifeste
+    entries = {partition_id: previous[partition_id] for partition_id in partitions if partition_id not in todo}
+    cleaned = {}
+    for partition_id, (frame, summary) in zip(todo, results):
+        entries[partition_id] = {
+            'fingerprint': fingerprints[partition_id],
+            'n_rows': len(frame),
+            'columns': list(frame.columns),
+            'summary': summary,
+        }
+        cleaned[partition_id] = frame
+    entries = dict(sorted(entries.items()))
+
+    merged = CleaningSummary(specs)
+    for entry in entries.values():
+        merged.merge(entry['summary'])
+
+    report = merged.report()
+    report['partitions'] = {'total': len(entries), 'processed': len(todo), 'removed': len(removed)}
+    print(f"\nPartitions : {len(entries)} au total, {len(todo)} traitées "
+          f"({n_workers or 1} processus), {len(removed)} retirées")
+    print(f"Données nettoyées : {report['n_rows']} lignes")
+
+    updated = {'schema': schema, 'partitions': entries, 'fill_values': merged.fill_values()}
+    return cleaned, updated, report
+
+
+def combine_partitions(cleaned_partitions: Dict[str, Callable[[], pd.DataFrame]], manifest: Dict[str, Any]) -> FrameChunks:
+    """
+    Réunir paresseusement les partitions nettoyées du manifeste.
+
+    Les partitions sont lues une à une, dans l'ordre de leurs identifiants,
+    et imputées avec les valeurs globales du manifeste.
+
+    Args:
+        cleaned_partitions: Chargeurs des partitions enregistrées (``PartitionedDataset``)
+        manifest: Manifeste mis à jour par ``clean_partitions``
+
+    Returns:
+        Source par blocs (une partition par bloc) des données nettoyées
+    """
+    from tp_kedro_weather.datasets import PartitionChunks
+    from ..data_processing.cleaning import impute_frame
+
+    entries = manifest['partitions']
+    if not entries:
+        raise ValueError("Aucune partition brute à traiter")
+    missing = [partition_id for partition_id in entries if partition_id not in cleaned_partitions]
+    if missing:
+        raise ValueError(f"Partitions nettoyées introuvables : {missing[:5]}")
+
+    first = next(iter(entries.values()))
+    chunks = PartitionChunks(
+        [cleaned_partitions[partition_id] for partition_id in entries],
+        first['columns'],
+        max(entry['n_rows'] for entry in entries.values()),
+    )
+    return chunks.map(partial(impute_frame, fill_values=manifest['fill_values']))
@@ -0,0 +1,41 @@
+"""Pipeline de traitement des données brutes partitionnées (un fichier par jour)."""
+
+from kedro.pipeline import Pipeline, node
+from ..data_processing.nodes import train_model
+from .nodes import clean_partitions, combine_partitions
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Créer le pipeline de traitement des partitions.
+
+    À lancer avec ``kedro run --pipeline partitioned_processing``.
+
+    Returns:
+        Pipeline Kedro complet
+    """
+    return Pipeline(
+        [
+            # Node 1: Nettoyer les partitions nouvelles ou modifiées
+            node(
+                func=clean_partitions,
+                inputs=["raw_weather_partitions", "partition_manifest", "params:cleaning", "params:partitioning"],
+                outputs=["cleaned_weather_partitions", "partition_manifest_updated", "partition_cleaning_report"],
+                name="clean_partitions_node",
+            ),
+            # Node 2: Réunir toutes les partitions nettoyées (relues depuis le disque)
+            node(
+                func=combine_partitions,
+                inputs=["cleaned_weather_partitions", "partition_manifest_updated"],
+                outputs="combined_weather_partitions",
+                name="combine_partitions_node",
+            ),
+            # Node 3: Entraîner le modèle
+            node(
+                func=train_model,
+                inputs=["combined_weather_partitions", "params:training", "params:training_cache"],
+                outputs=["trained_model", "metrics", "cv_predictions"],
+                name="train_partitioned_model_node",
+            ),
+        ]
+    )
@@ -0,0 +1,302 @@
+"""Profilage à la demande des nodes d'un ``kedro run``.
+
+Les hooks ne sont enregistrés (``settings.py``) que si la variable
+d'environnement ``KEDRO_PROFILE`` est définie : sans elle, le run n'a aucun
+coût supplémentaire ::
+
+    KEDRO_PROFILE=1 kedro run                 # cProfile (déterministe)
+    KEDRO_PROFILE=sampling kedro run          # échantillonnage des piles
+
+Chaque node est profilé séparément, dans
+``data/08_reporting/profiles/<run_id>/`` :
+
+- ``<node>.pstats`` (cProfile) : lisible par ``pstats``, ``snakeviz``... ;
+- ``<node>.collapsed`` : piles repliées (``a;b;c <valeur>``) pour
+  ``flamegraph.pl`` ou speedscope. En mode cProfile, les piles sont
+  reconstruites depuis les arcs appelant-appelé, le temps d'une fonction
+  étant réparti entre ses appelants au prorata (les niveaux au-delà du
+  premier appelant sont donc approchés) ; en mode échantillonnage, ce
+  sont les piles observées (valeur : nombre d'échantillons).
+
+L'échantillonneur lit la pile du thread du node à intervalle fixe depuis un
+thread séparé : son coût ne dépend pas du nombre d'appels, il convient aux
+nodes longs (paramètre ``node_profiling.sampling_nodes``). Aucun des deux
+modes ne voit les processus lancés par les nodes (pools d'entraînement).
+
+En fin de run, les fonctions les plus coûteuses de chaque node (temps
+propre) sont affichées et écrites dans ``summary.txt`` ; le résumé relit les
+fichiers, il inclut donc les nodes exécutés par un ``ParallelRunner``.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from kedro.framework.hooks import hook_impl
+
+from tp_kedro_weather.hooks import RUN_ID_ENV
+
+PROFILE_ENV = "KEDRO_PROFILE"
+# Paramètres node_profiling, transmis aux processus d'un ParallelRunner
+PROFILE_CONFIG_ENV = "TP_KEDRO_WEATHER_PROFILE_CONFIG"
+MODES = ("cprofile", "sampling")
+DEFAULT_CONFIG = {
+    "mode": None,
+    "output_dir": "data/08_reporting/profiles",
+    "top_n": 15,
+    "sampling_interval_ms": 5.0,
+    "sampling_nodes": [],
+}
+# Profondeur maximale des piles reconstruites depuis cProfile
+_MAX_DEPTH = 64
+
+
+def _mode_from_env() -> str:
+    value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    return value if value in MODES else "cprofile"
+
+
+def _config() -> Dict[str, Any]:
+    config = dict(DEFAULT_CONFIG)
+    config.update(json.loads(os.environ.get(PROFILE_CONFIG_ENV) or "{}"))
+    config["mode"] = config["mode"] or _mode_from_env()
+    if config["mode"] not in MODES:
+        raise ValueError(f"Mode de profilage inconnu : {config['mode']!r} (attendu : {', '.join(MODES)})")
+    return config
+
+
+def _file_stem(node_name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", node_name).strip("_") or "node"
+
+
+def _frame_label(filename: str, line: int, name: str) -> str:
+    # Séparateur ';' réservé aux piles repliées
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ",")
+
+
+def collapsed_from_stats(stats: pstats.Stats) -> Counter:
+    """
+    Piles repliées (en microsecondes de temps propre) reconstruites depuis cProfile.
+
+    Chaque fonction racine (sans appelant profilé) est parcourue vers ses
+    appelées ; le temps d'une appelée atteinte par un arc est la part de son
+    temps cumulé qui passe par cet arc, répartie ensuite au prorata sur ses
+    propres appelées. Les appels récursifs ne sont pas redescendus.
+    """
+    entries = stats.stats
+    callees: Dict[Tuple, List[Tuple[Tuple, float]]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    stacks: Counter = Counter()
+
+    def walk(func: Tuple, stack: List[str], on_stack: set, fraction: float) -> None:
+        _, _, tottime, cumtime, _ = entries[func]
+        stack = stack + [_frame_label(*func)]
+        self_us = int(tottime * fraction * 1e6)
+        if self_us:
+            stacks[";".join(stack)] += self_us
+        if len(stack) >= _MAX_DEPTH:
+            return
+        on_stack = on_stack | {func}
+        for callee, edge_cumtime in callees.get(func, []):
+            callee_cumtime = entries[callee][3]
+            if callee in on_stack or not callee_cumtime:
+                continue
+            share = fraction * edge_cumtime / callee_cumtime
+            if share * callee_cumtime * 1e6 >= 1:
+                walk(callee, stack, on_stack, share)
+
+    for func, (_, _, _, cumtime, callers) in entries.items():
+        # Racines : appelées depuis du code non profilé (avant l'activation du profileur)
+        external = sum(edge[3] for caller, edge in callers.items() if caller not in entries)
+        if not callers:
+            walk(func, [], set(), 1.0)
+        elif external and cumtime:
+            walk(func, [], set(), external / cumtime)
+    return stacks
+
+
+class _StackSampler:
+    """Échantillonne la pile d'un thread depuis un thread séparé."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop = threading.Event()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._thread = threading.Thread(target=self._run, name="node-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+                self.samples += 1
+
+
+def _write_collapsed(path: Path, stacks: Counter) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, value in stacks.most_common():
+            f.write(f"{stack} {value}\n")
+
+
+def _read_collapsed(path: Path) -> Counter:
+    stacks: Counter = Counter()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            stack, _, value = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(value)
+    return stacks
+
+
+def hotspots_from_collapsed(stacks: Counter, top_n: int) -> List[Tuple[str, int, int]]:
+    """Fonctions les plus coûteuses : ``(fonction, valeur propre, valeur cumulée)``."""
+    self_values: Counter = Counter()
+    total_values: Counter = Counter()
+    for stack, value in stacks.items():
+        frames = stack.split(";")
+        self_values[frames[-1]] += value
+        for frame in set(frames):
+            total_values[frame] += value
+    return [(frame, value, total_values[frame]) for frame, value in self_values.most_common(top_n)]
+
+
+def _node_summary(stem: str, directory: Path, top_n: int) -> List[str]:
+    pstats_path = directory / f"{stem}.pstats"
+    if pstats_path.exists():
+        stats = pstats.Stats(str(pstats_path))
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top_n]
+        lines = [f"{stem} (cProfile, {stats.total_tt:.3f} s)", f"  {'propre s':>10} {'cumulé s':>10} {'appels':>10}  fonction"]
+        lines += [
+            f"  {tottime:>10.3f} {cumtime:>10.3f} {ncalls:>10}  {_frame_label(*func)}"
+            for func, (_, ncalls, tottime, cumtime, _) in rows
+        ]
+        return lines
+    stacks = _read_collapsed(directory / f"{stem}.collapsed")
+    total = sum(stacks.values()) or 1
+    lines = [f"{stem} (échantillonnage, {total} échantillons)", f"  {'propre':>10} {'cumulé':>10}  fonction"]
+    lines += [
+        f"  {value / total:>10.1%} {cumulative / total:>10.1%}  {frame}"
+        for frame, value, cumulative in hotspots_from_collapsed(stacks, top_n)
+    ]
+    return lines
+
+
+class NodeProfilingHooks:
+    """
+    Profile chaque node et résume les points chauds en fin de run.
+
+    Le mode vient de ``KEDRO_PROFILE`` (``1`` ou ``cprofile``, ``sampling``),
+    sauf si ``node_profiling.mode`` est fixé ; les autres réglages viennent
+    des paramètres ``node_profiling`` (``kedro run --params
+    node_profiling.top_n=30``).
+    """
+
+    def __init__(self):
+        self._run_id: Optional[str] = None
+        self._profiles: Dict[Tuple[int, str], Any] = {}
+
+    def _directory(self) -> Path:
+        run_id = self._run_id or os.environ.get(RUN_ID_ENV) or "run"
+        return Path(_config()["output_dir"]) / run_id
+
+    @hook_impl
+    def after_context_created(self, context) -> None:
+        params = context.params.get("node_profiling") or {}
+        os.environ[PROFILE_CONFIG_ENV] = json.dumps({key: params[key] for key in DEFAULT_CONFIG if key in params})
+        _config()
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any]) -> None:
+        # Même identifiant que RunMetricsHooks (l'ordre des hooks n'est pas garanti)
+        self._run_id = run_params.get("run_id") or run_params.get("session_id") or os.environ.get(RUN_ID_ENV)
+        self._directory().mkdir(parents=True, exist_ok=True)
+
+    @hook_impl
+    def before_node_run(self, node) -> None:
+        config = _config()
+        key = (threading.get_ident(), node.name)
+        sampling = config["mode"] == "sampling" or node.name in config["sampling_nodes"]
+        if not sampling:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Un seul cProfile actif à la fois (nodes concurrents d'un ThreadRunner)
+                sampling = True
+            else:
+                self._profiles[key] = profile
+        if sampling:
+            sampler = _StackSampler(threading.get_ident(), config["sampling_interval_ms"] / 1000)
+            sampler.start()
+            self._profiles[key] = sampler
+
+    def _stop(self, node) -> None:
+        profiler = self._profiles.pop((threading.get_ident(), node.name), None)
+        if profiler is None:
+            return
+        directory = self._directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = _file_stem(node.name)
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            profiler.dump_stats(str(directory / f"{stem}.pstats"))
+            stacks = collapsed_from_stats(pstats.Stats(profiler))
+        else:
+            stacks = profiler.stop()
+        _write_collapsed(directory / f"{stem}.collapsed", stacks)
+
+    @hook_impl
+    def after_node_run(self, node) -> None:
+        self._stop(node)
+
+    @hook_impl
+    def on_node_error(self, node) -> None:
+        self._stop(node)
+
+    @hook_impl
+    def after_pipeline_run(self) -> None:
+        self._summarise()
+
+    @hook_impl
+    def on_pipeline_error(self) -> None:
+        self._summarise()
+
+    def _summarise(self) -> None:
+        directory = self._directory()
+        stems = [path.stem for path in directory.glob("*.collapsed")]
+        if not stems:
+            return
+        # Dans l'ordre de fin des nodes
+        stems.sort(key=lambda stem: (directory / f"{stem}.collapsed").stat().st_mtime)
+        top_n = int(_config()["top_n"])
+        lines = [f"Profils des nodes ({time.strftime('%Y-%m-%d %H:%M:%S')}) : {directory}"]
+        for stem in stems:
+            lines += ["", *_node_summary(stem, directory, top_n)]
+        text = "\n".join(lines)
+        (directory / "summary.txt").write_text(text + "\n", encoding="utf-8")
+        print("\n" + text)
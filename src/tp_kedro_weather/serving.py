@@ -0,0 +1,327 @@
+"""Serveur local de prédiction avec regroupement des requêtes en micro-lots.
+
+Lancé avec ``python -m tp_kedro_weather serve``. Le modèle sauvegardé
+(``data/04_models/modele.pkl``) est chargé une seule fois au démarrage ;
+les requêtes concurrentes sont regroupées en micro-lots, dans la limite
+d'un budget de latence, et prédites par un seul appel vectorisé à
+``predict``.
+
+Points d'entrée HTTP (TCP local ou socket Unix) :
+
+- ``POST /predict`` : ``{"humidity": 60, "windspeed": 12}`` ou
+  ``{"instances": [{"humidity": 60, "windspeed": 12}, ...]}`` ;
+- ``GET /metrics`` : latences p50/p99, débit et taille moyenne des lots ;
+- ``GET /health``.
+"""
+
+import argparse
+import json
+import os
+import pickle
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_MODEL_PATH = "data/04_models/modele.pkl"
+DEFAULT_FEATURES = ("humidity", "windspeed")
+
+
+class ServingStats:
+    """Compteurs du serveur et fenêtre glissante des latences récentes."""
+
+    def __init__(self, window: int = 10_000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record_batch(self, n_rows: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.rows += n_rows
+
+    def record_request(self, latency: float, error: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self._latencies.append(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = np.array(self._latencies, dtype=np.float64) * 1000.0
+            uptime = time.perf_counter() - self._started
+            return {
+                "uptime_s": uptime,
+                "requests": self.requests,
+                "errors": self.errors,
+                "rows": self.rows,
+                "batches": self.batches,
+                "mean_batch_rows": self.rows / self.batches if self.batches else 0.0,
+                "requests_per_s": self.requests / uptime if uptime > 0 else 0.0,
+                "rows_per_s": self.rows / uptime if uptime > 0 else 0.0,
+                "latency_ms": {
+                    "window": int(latencies.size),
+                    "p50": float(np.percentile(latencies, 50)) if latencies.size else None,
+                    "p99": float(np.percentile(latencies, 99)) if latencies.size else None,
+                    "max": float(latencies.max()) if latencies.size else None,
+                },
+            }
+
+
+class MicroBatcher:
+    """
+    Regroupe les requêtes concurrentes en lots prédits par un seul appel.
+
+    Un thread dédié attend la première requête, puis accumule les suivantes
+    pendant au plus ``max_wait_ms`` ou jusqu'à ``max_batch_rows`` lignes, et
+    appelle ``model.predict`` une fois sur la matrice empilée. Chaque
+    requête récupère sa tranche de prédictions via un ``Future``.
+    """
+
+    def __init__(self, model: Any, max_batch_rows: int = 1024, max_wait_ms: float = 2.0,
+                 stats: Optional[ServingStats] = None):
+        self._model = model
+        self._max_batch_rows = max_batch_rows
+        self._max_wait = max_wait_ms / 1000.0
+        self.stats = stats or ServingStats()
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, X: np.ndarray) -> Future:
+        """Mettre en file une matrice de features ; le ``Future`` donne ses prédictions."""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Le serveur de prédiction est arrêté")
+            self._pending.append((X, future))
+            self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _next_batch(self) -> List[Any]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return []
+            deadline = time.perf_counter() + self._max_wait
+            n_rows = sum(len(X) for X, _ in self._pending)
+            while n_rows < self._max_batch_rows and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+                n_rows = sum(len(X) for X, _ in self._pending)
+            batch = []
+            n_rows = 0
+            # Toujours au moins une requête, même si elle dépasse la taille de lot
+            while self._pending and (not batch or n_rows + len(self._pending[0][0]) <= self._max_batch_rows):
+                X, future = self._pending.popleft()
+                batch.append((X, future))
+                n_rows += len(X)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            X = np.concatenate([X for X, _ in batch]) if len(batch) > 1 else batch[0][0]
+            try:
+                predictions = np.asarray(self._model.predict(X), dtype=np.float64)
+            except Exception as error:  # noqa: BLE001 - l'erreur est renvoyée à chaque requête du lot
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            self.stats.record_batch(len(X))
+            start = 0
+            for rows, future in batch:
+                future.set_result(predictions[start:start + len(rows)])
+                start += len(rows)
+
+
+def parse_instances(payload: Any, features: Sequence[str]) -> np.ndarray:
+    """
+    Convertir le corps JSON d'une requête en matrice de features.
+
+    Args:
+        payload: Objet ``{feature: valeur}`` ou ``{"instances": [...]}``
+        features: Noms des features, dans l'ordre attendu par le modèle
+
+    Returns:
+        Matrice ``(n, len(features))`` en float64
+    """
+    instances = payload.get("instances", [payload]) if isinstance(payload, dict) else None
+    if not isinstance(instances, list) or not instances:
+        raise ValueError("Corps attendu : {feature: valeur} ou {\"instances\": [...]}")
+    try:
+        X = np.array([[float(instance[name]) for name in features] for instance in instances], dtype=np.float64)
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Chaque instance doit fournir les features {list(features)}") from error
+    if not np.isfinite(X).all():
+        raise ValueError("Les features doivent être des nombres finis")
+    return X
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """Gestionnaire HTTP/1.1 (connexions persistantes) du serveur de prédiction."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            self._send_json(200, self.server.batcher.stats.snapshot())
+        else:
+            self._send_json(404, {"error": f"Chemin inconnu : {self.path}"})
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+        if self.path != "/predict":
+            self._send_json(404, {"error": f"Chemin inconnu : {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            X = parse_instances(json.loads(self.rfile.read(length)), self.server.features)
+            predictions = self.server.batcher.submit(X).result()
+        except ValueError as error:
+            self.server.batcher.stats.record_request(time.perf_counter() - start, error=True)
+            self._send_json(400, {"error": str(error)})
+            return
+        except Exception as error:  # noqa: BLE001 - renvoyé au client plutôt que de couper la connexion
+            self.server.batcher.stats.record_request(time.perf_counter() - start, error=True)
+            self._send_json(500, {"error": str(error)})
+            return
+        self.server.batcher.stats.record_request(time.perf_counter() - start)
+        self._send_json(200, {self.server.target: predictions.tolist()})
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Les sockets Unix n'ont pas d'adresse (host, port)
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Pas de log par requête : il coûterait plus cher que la prédiction
+        pass
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        # Désactive Nagle : les réponses sont petites et sensibles à la latence
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().server_bind()
+
+
+class _UnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def load_model(path: str) -> Any:
+    """
+    Charger le modèle sauvegardé par le pipeline.
+
+    Un répertoire est lu comme une forêt compacte (``data/04_models/modele_compact``),
+    un fichier comme la chaîne prétraitement + modèle picklée.
+    """
+    if Path(path).is_dir():
+        from tp_kedro_weather.datasets import NumpyArraysDataset
+        from tp_kedro_weather.pipelines.data_processing.compact_forest import CompactForest
+
+        return CompactForest(NumpyArraysDataset(filepath=path).load())
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def make_server(
+    model: Any,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+    features: Sequence[str] = DEFAULT_FEATURES,
+    target: str = "temperature",
+    max_batch_rows: int = 1024,
+    max_wait_ms: float = 2.0,
+):
+    """
+    Construire le serveur HTTP (TCP ou socket Unix) et son micro-batcher.
+
+    Returns:
+        Serveur prêt pour ``serve_forever()``
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _UnixServer(unix_socket, PredictionHandler)
+    else:
+        server = _TCPServer((host, port), PredictionHandler)
+    server.batcher = MicroBatcher(model, max_batch_rows, max_wait_ms)
+    server.features = list(features)
+    server.target = target
+    return server
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Point d'entrée de ``python -m tp_kedro_weather serve``."""
+    parser = argparse.ArgumentParser(prog="tp_kedro_weather serve", description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH,
+                        help="Modèle sauvegardé (pickle) ou répertoire de la forêt compacte")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--unix-socket", default=None, help="Écouter sur un socket Unix plutôt qu'en TCP")
+    parser.add_argument("--features", nargs="+", default=list(DEFAULT_FEATURES))
+    parser.add_argument("--target", default="temperature")
+    parser.add_argument("--max-batch-rows", type=int, default=1024, help="Lignes maximum par micro-lot")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="Attente maximum pour compléter un micro-lot (budget de latence)")
+    args = parser.parse_args(argv)
+
+    model = load_model(args.model)
+    server = make_server(
+        model,
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        features=args.features,
+        target=args.target,
+        max_batch_rows=args.max_batch_rows,
+        max_wait_ms=args.max_wait_ms,
+    )
+    where = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"Modèle {Path(args.model)} chargé ; écoute sur {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+        print(json.dumps(server.batcher.stats.snapshot(), indent=2))
@@ -2,11 +2,24 @@
 from the Kedro defaults. For further information, including these default values, see
 https://docs.kedro.org/en/stable/kedro_project_setup/settings.html."""
 
+import os
+
+from tp_kedro_weather.hooks import ParallelRunnerGuardHooks, RunMetricsHooks
+
 # Instantiated project hooks.
 # For example, after creating a hooks.py and defining a ProjectHooks class there, do
 # from tp_kedro_weather.hooks import ProjectHooks
 # Hooks are executed in a Last-In-First-Out (LIFO) order.
-# HOOKS = (ProjectHooks(),)
+# Mesures par node et par dataset : data/08_reporting/run_metrics.jsonl et .prom.
+# ParallelRunner refusé si des nodes échangent un MemoryDataset déclaré (non partagé)
+HOOKS = (RunMetricsHooks(), ParallelRunnerGuardHooks())
+
+# Profils par node (data/08_reporting/profiles), seulement si KEDRO_PROFILE est
+# défini : sans profilage, le module n'est même pas importé
+if os.environ.get("KEDRO_PROFILE"):
+    from tp_kedro_weather.profiling import NodeProfilingHooks
+
+    HOOKS += (NodeProfilingHooks(),)
 
 # Installed plugins for which to disable hook auto-registration.
 # DISABLE_HOOKS_FOR_PLUGINS = ("kedro-viz",)
@@ -31,6 +44,8 @@ https://docs.kedro.org/en/stable/kedro_project_setup/settings.html."""
 CONFIG_LOADER_ARGS = {
     "base_env": "base",
     "default_run_env": "local",
+    # Les paramètres d'un environnement complètent ceux de base clé par clé
+    "merge_strategy": {"parameters": "soft"},
     # "config_patterns": {
     #     "spark" : ["spark*/"],
     #     "parameters": ["parameters*", "parameters*/**", "**/parameters*"],
@@ -0,0 +1,152 @@
+"""Générateur de données météo synthétiques au format de ``weather_data.csv``.
+
+Les mesures suivent une relation linéaire bruitée entre température,
+humidité et vitesse du vent, arrondies au dixième comme celles des
+stations. Une proportion configurable de cellules est remplacée par les
+sentinelles sales du fichier brut (``N/A``, ``missing``, ``unknown``).
+Avec ``n_stations``, chaque ligne reçoit une colonne ``station`` et la
+relation est décalée et inclinée par station (effets fixes, identiques d'un
+bloc à l'autre), pour l'entraînement par groupe.
+
+La génération est déterministe pour une graine donnée et se fait par blocs
+(chaque bloc a sa propre graine dérivée), ce qui permet d'écrire des
+fichiers de 10⁸ lignes sans tout garder en mémoire ::
+
+    python -m tp_kedro_weather.synthetic --rows 1000000 --dirty-rate 0.02 \\
+        --output data/01_raw/weather_data.csv
+"""
+
+import argparse
+from pathlib import Path
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("temperature", "humidity", "windspeed")
+DIRTY_SENTINELS = ("N/A", "missing", "unknown")
+DEFAULT_CHUNKSIZE = 1_000_000
+# Graine des effets par station : indépendante de la graine des blocs
+_STATION_SEED = 2024
+
+
+def station_effects(n_stations: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Décalage de température et pente supplémentaire en humidité de chaque station."""
+    rng = np.random.default_rng(_STATION_SEED)
+    return rng.normal(0, 3, n_stations), rng.normal(0, 0.05, n_stations)
+
+
+def station_ids(n_stations: int) -> np.ndarray:
+    return np.array([f"S{index:05d}" for index in range(n_stations)], dtype=object)
+
+
+def generate_weather_frame(
+    n_rows: int,
+    dirty_rate: float = 0.0,
+    seed: int = 42,
+    sentinels: Sequence[str] = DIRTY_SENTINELS,
+    n_stations: int = 0,
+) -> pd.DataFrame:
+    """
+    Générer un bloc de données brutes synthétiques.
+
+    Args:
+        n_rows: Nombre de lignes
+        dirty_rate: Proportion de cellules remplacées par une sentinelle
+        seed: Graine du générateur
+        sentinels: Sentinelles possibles, tirées uniformément
+        n_stations: Nombre de stations (0 : pas de colonne ``station``)
+
+    Returns:
+        DataFrame ``temperature``, ``humidity``, ``windspeed`` (et
+        ``station``) ; les mesures sont en float64 si ``dirty_rate`` est nul,
+        en texte sinon
+    """
+    if not 0.0 <= dirty_rate <= 1.0:
+        raise ValueError(f"'dirty_rate' doit être entre 0 et 1, reçu {dirty_rate}")
+    rng = np.random.default_rng(seed)
+    humidity = rng.uniform(20, 100, n_rows).round(1)
+    windspeed = rng.gamma(2.0, 5.0, n_rows).round(1)
+    temperature = 30 - 0.15 * humidity - 0.2 * windspeed + rng.normal(0, 2, n_rows)
+    stations = None
+    if n_stations:
+        station = rng.integers(0, n_stations, n_rows)
+        offset, slope = station_effects(n_stations)
+        temperature = temperature + offset[station] + slope[station] * humidity
+        stations = station_ids(n_stations)[station]
+    data = {"temperature": temperature.round(1), "humidity": humidity, "windspeed": windspeed}
+
+    if dirty_rate > 0.0:
+        choices = np.asarray(sentinels, dtype=object)
+        for name, values in data.items():
+            dirty = rng.random(n_rows) < dirty_rate
+            column = values.astype(str).astype(object)
+            column[dirty] = choices[rng.integers(0, len(choices), int(dirty.sum()))]
+            data[name] = column
+    if stations is not None:
+        data["station"] = stations
+    return pd.DataFrame(data)
+
+
+def generate_weather_chunks(
+    n_rows: int,
+    dirty_rate: float = 0.0,
+    seed: int = 42,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    n_stations: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """Générer ``n_rows`` lignes par blocs de ``chunksize`` (graine ``[seed, indice du bloc]``)."""
+    for index, start in enumerate(range(0, n_rows, chunksize)):
+        chunk_seed = int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+        yield generate_weather_frame(
+            min(chunksize, n_rows - start), dirty_rate, chunk_seed, n_stations=n_stations
+        )
+
+
+def write_weather_csv(
+    path: str,
+    n_rows: int,
+    dirty_rate: float = 0.0,
+    seed: int = 42,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    n_stations: int = 0,
+) -> Path:
+    """
+    Écrire un fichier brut synthétique, bloc par bloc.
+
+    Args:
+        path: Fichier CSV à écrire
+        n_rows: Nombre de lignes
+        dirty_rate: Proportion de cellules sentinelles
+        seed: Graine
+        chunksize: Lignes générées à la fois
+        n_stations: Nombre de stations (0 : pas de colonne ``station``)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        header = True
+        for chunk in generate_weather_chunks(n_rows, dirty_rate, seed, chunksize, n_stations):
+            chunk.to_csv(f, header=header, index=False)
+            header = False
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--dirty-rate", type=float, default=0.02, help="Proportion de cellules sentinelles")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--stations", type=int, default=0, help="Nombre de stations (colonne station)")
+    parser.add_argument("--output", default="data/01_raw/weather_data.csv")
+    args = parser.parse_args()
+    path = write_weather_csv(args.output, args.rows, args.dirty_rate, args.seed, args.chunksize, args.stations)
+    print(f"{args.rows} lignes écrites dans {path}")
+
+
+if __name__ == "__main__":
+    main()